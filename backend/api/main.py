@@ -11,29 +11,37 @@ Usage:
     uvicorn backend.api.main:app --reload
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, ValidationError
+from typing import Dict, Any, Iterator, List, Literal, Optional, Union
+from functools import lru_cache, partial, singledispatch
+from concurrent.futures import ProcessPoolExecutor
+from threadpoolctl import threadpool_limits
 import pandas as pd
 import numpy as np
+import orjson
+import asyncio
 import traceback
-import json
+import uuid
 import os
 import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dqml.parser import parse_query, DMQLQuery
-from dqml.executor import SQLiteExecutor, ExecutionResult
+from dqml.parser import parse_query, DMQLQuery, Display
+from dqml.executor import SQLiteExecutor, DuckDBExecutor, ExecutionResult
 from dqml.mining import (
     kmeans_clustering,
     dbscan_clustering,
-    basic_statistics,
     correlation_analysis,
-    data_profile,
-    detect_anomalies
+    summary_and_profile,
+    detect_anomalies,
+    optimize_dtypes
 )
 from dqml.visualization import (
     generate_chart,
@@ -44,24 +52,94 @@ from dqml.visualization import (
 )
 
 
-def convert_to_serializable(obj):
-    """Convert numpy/pandas types to JSON-serializable Python types."""
-    if isinstance(obj, dict):
-        return {k: convert_to_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_to_serializable(item) for item in obj]
-    elif isinstance(obj, (np.integer, np.int64, np.int32)):
-        return int(obj)
-    elif isinstance(obj, (np.floating, np.float64, np.float32)):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, pd.DataFrame):
-        return obj.to_dict(orient='records')
-    elif isinstance(obj, (np.bool_, bool)):
-        return bool(obj)
-    else:
-        return obj
+@singledispatch
+def to_serializable(obj: Any) -> Any:
+    """
+    Convert numpy/pandas types to JSON-serializable Python types.
+    
+    Dispatches on the value's type, so each node of a nested result costs
+    one registry lookup. Unregistered types are returned unchanged.
+    """
+    return obj
+
+
+to_serializable.register(np.integer, int)
+to_serializable.register(np.floating, float)
+to_serializable.register(np.bool_, bool)
+to_serializable.register(np.ndarray, lambda a: a.tolist())
+to_serializable.register(pd.DataFrame, lambda d: d.to_dict(orient='records'))
+to_serializable.register(pd.Series, lambda s: s.tolist())
+to_serializable.register(pd.Timestamp, lambda t: t.isoformat())
+to_serializable.register(type(pd.NaT), lambda _: None)
+to_serializable.register(type(pd.NA), lambda _: None)
+to_serializable.register(dict, lambda d: {k: to_serializable(v) for k, v in d.items()})
+to_serializable.register(list, lambda l: [to_serializable(x) for x in l])
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for values orjson doesn't know about (pandas types, mostly)."""
+    converted = to_serializable(obj)
+    if converted is obj:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return converted
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    
+    numpy scalars/arrays, dataclasses and datetimes are serialized natively
+    in a single pass, so mining results don't need a Python-level conversion
+    walk before they are sent.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+def _dumps(content: Any) -> bytes:
+    """Serialize content with orjson, handling numpy and pandas values."""
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+
+
+class RequestIDMiddleware:
+    """
+    Tag every HTTP response with an X-Request-ID header.
+    
+    An incoming X-Request-ID is echoed back; otherwise a new one is generated.
+    
+    Middleware in this module is written as pure ASGI callables like this
+    one, never as BaseHTTPMiddleware subclasses: those run each request in an
+    extra task and copy the response through a stream, which costs a large
+    share of per-request throughput.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex.encode()
+        
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (b"x-request-id", request_id)]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_request_id)
 
 
 # ============================================================================
@@ -71,18 +149,27 @@ def convert_to_serializable(obj):
 app = FastAPI(
     title="DQML API",
     description="Data Mining Query Language - REST API for executing DMQL queries",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware for React frontend
+# Compress large JSON bodies (mining results and chart specs); level 4
+# gets most of the ratio for a fraction of the CPU of level 9
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
+# CORS middleware for React frontend; one compiled regex match per request
+# instead of scanning an origin list
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:5173"],
+    allow_origin_regex=r"http://(localhost|127\.0\.0\.1):(3000|5173)",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID", "X-DQML-Row-Count"],
 )
 
+app.add_middleware(RequestIDMiddleware)
+
 
 # ============================================================================
 # Request/Response Models
@@ -90,14 +177,24 @@ app.add_middleware(
 
 class QueryRequest(BaseModel):
     """Request model for query execution."""
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore', validate_assignment=False)
+    
     query: str
-    data: Optional[Dict[str, List[Any]]] = None  # Optional inline data
+    # Optional inline data (column -> values); the values are not validated
+    # element by element, they are handed straight to numpy/pandas
+    data: Optional[Dict[str, Any]] = None
+    # Row format: 'records' (one object per row, in `data`) or 'split'
+    # (one array per row, in `rows`, ordered like `columns`)
+    orient: Literal['records', 'split'] = 'records'
 
 
 class QueryResponse(BaseModel):
     """Response model for query execution."""
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore', validate_assignment=False)
+    
     success: bool
     data: Optional[List[Dict[str, Any]]] = None
+    rows: Optional[List[Any]] = None  # Row tuples, serialized as arrays
     columns: Optional[List[str]] = None
     row_count: int = 0
     mining_result: Optional[Dict[str, Any]] = None
@@ -109,16 +206,161 @@ class QueryResponse(BaseModel):
 
 class HealthResponse(BaseModel):
     """Response model for health check."""
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore', validate_assignment=False)
+    
     status: str
     version: str
 
 
+# Prebuilt bodies for results without rows; handlers merge in per-query fields
+_EMPTY_SELECT_RESPONSE = QueryResponse(
+    success=True,
+    data=[],
+    columns=[],
+    row_count=0,
+    query_type='select'
+).model_dump()
+_NO_DATA_RESPONSE = QueryResponse(
+    success=False,
+    error="No data returned from query",
+    query_type='mining'
+).model_dump()
+
+
 # ============================================================================
 # Global State
 # ============================================================================
 
-# Global executor instance
-executor = SQLiteExecutor()
+# uvicorn worker processes. Each worker has its own executor and in-memory
+# database, so with more than one, a table loaded through /api/load-csv
+# exists only in the worker that loaded it and other workers' queries
+# fail. Raise this only when the database is a file shared by all workers.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+@lru_cache(maxsize=1)
+def get_executor() -> SQLiteExecutor:
+    """
+    Return the executor for this process.
+    
+    Created lazily so that each uvicorn worker opens its own connection
+    (SQLite connections can't be shared across forked processes).
+    The backend is chosen with DQML_BACKEND ('sqlite' or 'duckdb') and
+    defaults to SQLite. DuckDB is opt-in because the translated SQL is
+    SQLite's dialect: under DuckDB, GROUP BY with ungrouped columns is an
+    error and LIKE is case-sensitive. DuckDBExecutor subclasses
+    SQLiteExecutor, so either way callers get a SQLiteExecutor.
+    Endpoints receive it through Depends(get_executor), so tests can swap
+    it out with app.dependency_overrides.
+    """
+    backend = os.getenv("DQML_BACKEND", "sqlite").lower()
+    if backend == "duckdb" and DuckDBExecutor is not None:
+        return DuckDBExecutor()
+    return SQLiteExecutor()
+
+
+# Mining inputs with fewer rows than this run in the request's process;
+# below it, pickling the DataFrame to a pool worker and the result back
+# costs more than the work itself
+POOL_MIN_ROWS = 20_000
+
+
+@lru_cache(maxsize=1)
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Return the process pool used for CPU-bound mining operations.
+    
+    Created on first use so that each uvicorn worker owns its pool. The
+    CPUs are split between the uvicorn workers, and each pool process runs
+    its mining call single-threaded (see _init_pool_worker), so the pools
+    together use about one process per CPU.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY),
+        initializer=_init_pool_worker
+    )
+
+
+def _init_pool_worker() -> None:
+    """Limit a pool process to one thread; the pool itself provides the parallelism."""
+    # joblib sizes n_jobs=-1 from this, so the estimators' n_jobs=-1 means
+    # one job here instead of another cpu_count processes or threads
+    os.environ["LOKY_MAX_CPU_COUNT"] = "1"
+    threadpool_limits(limits=1)
+
+
+async def _run_in_pool(func, df: pd.DataFrame, *args,
+                       narrow_columns: Optional[List[str]] = None, **kwargs):
+    """
+    Run a mining function on df without blocking the event loop.
+    
+    Inputs with at least POOL_MIN_ROWS rows go to the process pool;
+    smaller ones are run directly. When narrow_columns is given, those
+    columns are downcast before the frame is pickled to the pool.
+    """
+    if len(df) < POOL_MIN_ROWS:
+        return func(df, *args, **kwargs)
+    if narrow_columns is not None:
+        df = optimize_dtypes(df, narrow_columns)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), partial(func, df, *args, **kwargs))
+
+
+# Results with more rows than this are streamed as NDJSON
+STREAM_ROW_THRESHOLD = 10_000
+_STREAM_CHUNK_ROWS = 10_000
+
+
+def df_to_rows(df: pd.DataFrame) -> List[tuple]:
+    """
+    Convert a DataFrame to a list of row tuples (the 'split' orient).
+    
+    Each column is converted to Python scalars in one tolist() call, so
+    no per-row dict is built; orjson writes the tuples as arrays.
+    """
+    return list(zip(*(df.iloc[:, i].tolist() for i in range(df.shape[1]))))
+
+
+def _df_to_payload(df: pd.DataFrame, orient: str) -> list:
+    """Convert result rows to the requested orient."""
+    if orient == 'split':
+        return df_to_rows(df)
+    return df.to_dict(orient='records')
+
+
+def _attach_rows(response: QueryResponse, df: pd.DataFrame, orient: str) -> None:
+    """Set the response's data or rows field from the result DataFrame."""
+    if orient == 'split':
+        response.data = None
+        response.rows = df_to_rows(df)
+    else:
+        response.data = df.to_dict(orient='records')
+
+
+def _iter_ndjson(meta: Dict[str, Any], df: pd.DataFrame, orient: str) -> Iterator[bytes]:
+    """
+    Yield a streamed result as NDJSON.
+    
+    The first line is the response object without its rows; each following
+    line is a JSON array with the next chunk of rows (objects, or arrays
+    with the 'split' orient). Only one chunk is materialized at a time.
+    """
+    yield _dumps(meta) + b"\n"
+    for start in range(0, len(df), _STREAM_CHUNK_ROWS):
+        chunk = df.iloc[start:start + _STREAM_CHUNK_ROWS]
+        yield _dumps(_df_to_payload(chunk, orient)) + b"\n"
+
+
+def _stream_response(
+    response: QueryResponse,
+    df: pd.DataFrame,
+    orient: str
+) -> StreamingResponse:
+    """Stream a large result set instead of rendering it in one body."""
+    return StreamingResponse(
+        _iter_ndjson(response.model_dump(exclude={'data', 'rows'}), df, orient),
+        media_type="application/x-ndjson",
+        headers={"X-DQML-Row-Count": str(len(df))}
+    )
 
 
 # ============================================================================
@@ -126,13 +368,61 @@ executor = SQLiteExecutor()
 # ============================================================================
 
 @app.get("/api/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(response: Response):
     """Health check endpoint."""
+    response.headers["Cache-Control"] = "public, max-age=10"
     return HealthResponse(status="healthy", version="0.1.0")
 
 
-@app.post("/api/execute", response_model=QueryResponse)
-async def execute_query(request: QueryRequest):
+async def _read_query_request(http_request: Request) -> QueryRequest:
+    """
+    Parse the /api/execute body with orjson.
+    
+    Inline datasets can be large, so the body is decoded in one orjson pass
+    instead of through the stdlib json module.
+    """
+    try:
+        payload = orjson.loads(await http_request.body())
+        return QueryRequest.model_validate(payload)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError([{
+            'type': 'json_invalid', 'loc': ('body',), 'msg': str(e), 'input': None
+        }])
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, 'loc': ('body', *error['loc'])}
+            for error in e.errors(include_url=False)
+        ])
+
+
+def _inline_frame(data: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Build a DataFrame from inline column data.
+    
+    Homogeneous numeric/boolean columns are converted to a typed ndarray in
+    one call; anything else is left for pandas to infer (e.g. None -> NaN).
+    """
+    columns = {}
+    for name, values in data.items():
+        array = np.asarray(values)
+        columns[name] = array if array.dtype.kind in 'biuf' else values
+    return pd.DataFrame(columns)
+
+
+@app.post(
+    "/api/execute",
+    response_model=None,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": QueryRequest.model_json_schema()}}
+        }
+    }
+)
+async def execute_query(
+    request: QueryRequest = Depends(_read_query_request),
+    executor: SQLiteExecutor = Depends(get_executor)
+) -> Union[ORJSONResponse, StreamingResponse]:
     """
     Execute a DMQL query.
     
@@ -140,6 +430,9 @@ async def execute_query(request: QueryRequest):
     - Basic SELECT queries (translated to SQL)
     - Data mining operations (CLUSTER, STATISTICS, ANOMALIES)
     - Visualization (DISPLAY AS chart_type)
+    
+    Results with more than STREAM_ROW_THRESHOLD rows are streamed as
+    application/x-ndjson (see _iter_ndjson).
     """
     try:
         query_text = request.query.strip()
@@ -149,7 +442,7 @@ async def execute_query(request: QueryRequest):
         
         # Load inline data if provided
         if request.data:
-            df = pd.DataFrame(request.data)
+            df = _inline_frame(request.data)
             # Register as 'inline_data' table
             executor.load_dataframe(df, 'inline_data')
         
@@ -161,95 +454,115 @@ async def execute_query(request: QueryRequest):
         
         # Determine query type
         if parsed.mining_operation:
-            return await _execute_mining_query(parsed, request)
+            response = await _execute_mining_query(parsed, request, executor)
         else:
-            return await _execute_select_query(parsed, request)
+            response = await _execute_select_query(parsed, request, executor)
             
     except HTTPException:
         raise
     except Exception as e:
         traceback.print_exc()
-        return QueryResponse(
+        response = QueryResponse(
             success=False,
             error=str(e)
         )
+    
+    # Streamed and prebuilt responses are returned as they are
+    if isinstance(response, Response):
+        return response
+    
+    # Responses are built with model_construct() and rendered directly, so
+    # the (potentially large) data rows are never validated by Pydantic
+    return ORJSONResponse(response.model_dump())
 
 
-async def _execute_select_query(parsed: DMQLQuery, request: QueryRequest) -> QueryResponse:
+async def _execute_select_query(
+    parsed: DMQLQuery,
+    request: QueryRequest,
+    executor: SQLiteExecutor
+) -> Union[QueryResponse, Response]:
     """Execute a basic SELECT query."""
     # Execute query using parsed DMQLQuery object
     result = executor.execute_query(parsed)
+    if not result.success:
+        return QueryResponse(
+            success=False,
+            error=result.error,
+            sql=result.sql_query,
+            query_type='select'
+        )
     
     # Prepare response
     if result.data is not None and not result.data.empty:
-        data_records = result.data.to_dict(orient='records')
         columns = list(result.data.columns)
         row_count = len(result.data)
         
         # Check if visualization is requested
         chart_data = None
-        if parsed.display_type and parsed.display_type != 'table':
+        if parsed.display_type and parsed.display is not Display.TABLE:
             chart_result = generate_chart(
                 result.data,
                 parsed.display_type,
                 title=f"Query Results"
             )
-            chart_data = chart_result.to_dict()
+            chart_data = chart_result.as_dict
         
-        return QueryResponse(
+        response = QueryResponse.model_construct(
             success=True,
-            data=data_records,
+            data=[],
             columns=columns,
             row_count=row_count,
             sql=result.sql_query,
             chart=chart_data,
             query_type='select'
         )
+        if row_count > STREAM_ROW_THRESHOLD:
+            return _stream_response(response, result.data, request.orient)
+        
+        _attach_rows(response, result.data, request.orient)
+        return response
     else:
-        return QueryResponse(
-            success=True,
-            data=[],
-            columns=[],
-            row_count=0,
-            sql=result.sql_query,
-            query_type='select'
-        )
+        return ORJSONResponse({**_EMPTY_SELECT_RESPONSE, 'sql': result.sql_query})
 
 
-async def _execute_mining_query(parsed: DMQLQuery, request: QueryRequest) -> QueryResponse:
+async def _execute_mining_query(
+    parsed: DMQLQuery,
+    request: QueryRequest,
+    executor: SQLiteExecutor
+) -> Union[QueryResponse, Response]:
     """Execute a mining operation query."""
     mining_op = parsed.mining_operation
     
-    # First get the data using a select query
-    table_name = parsed.tables[0] if parsed.tables else 'unknown'
-    select_query = f"FROM {table_name}"
-    if parsed.database:
-        select_query = f"USE DATABASE {parsed.database} " + select_query
-    if parsed.conditions:
-        select_query += f" WHERE {parsed.conditions}"
-    
     # Execute the base query to get data
     result = executor.execute_query(parsed)
     
-    if result.data is None or result.data.empty:
+    if not result.success:
         return QueryResponse(
             success=False,
-            error="No data returned from query",
+            error=result.error,
+            sql=result.sql_query,
             query_type='mining'
         )
+    if result.data is None or result.data.empty:
+        return ORJSONResponse(_NO_DATA_RESPONSE)
     
     df = result.data
+    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
     
     # Execute mining operation
     mining_result = None
     chart_data = None
     
     if mining_op.operation_type.upper() == 'CLUSTER':
-        mining_result, chart_data = await _run_clustering(df, mining_op, parsed.display_type)
+        mining_result, chart_data = await _run_clustering(
+            df, mining_op, parsed.display_type, numeric_cols
+        )
     elif mining_op.operation_type.upper() == 'STATISTICS':
         mining_result, chart_data = await _run_statistics(df, mining_op, parsed.display_type)
     elif mining_op.operation_type.upper() == 'ANOMALIES':
-        mining_result, chart_data = await _run_anomaly_detection(df, mining_op, parsed.display_type)
+        mining_result, chart_data = await _run_anomaly_detection(
+            df, mining_op, parsed.display_type, numeric_cols
+        )
     else:
         return QueryResponse(
             success=False,
@@ -257,49 +570,45 @@ async def _execute_mining_query(parsed: DMQLQuery, request: QueryRequest) -> Que
             query_type='mining'
         )
     
-    # Get output data
-    output_data = mining_result.pop('data', df)  # Remove 'data' from mining_result
-    if isinstance(output_data, pd.DataFrame):
-        data_records = convert_to_serializable(output_data.to_dict(orient='records'))
-        columns = list(output_data.columns)
-        row_count = len(output_data)
-    else:
-        data_records = []
-        columns = []
-        row_count = 0
+    # Every _run_* helper returns its output DataFrame under 'data'
+    output_data = mining_result.pop('data')
+    row_count = len(output_data)
     
-    # Convert mining_result to serializable types
-    serializable_mining_result = convert_to_serializable(mining_result)
-    
-    return QueryResponse(
+    response = QueryResponse.model_construct(
         success=True,
-        data=data_records,
-        columns=columns,
+        data=[],
+        columns=output_data.columns.tolist(),
         row_count=row_count,
-        mining_result=serializable_mining_result,
+        mining_result=mining_result,
         chart=chart_data,
         sql=result.sql_query,
         query_type='mining'
     )
+    if row_count > STREAM_ROW_THRESHOLD:
+        return _stream_response(response, output_data, request.orient)
+    
+    _attach_rows(response, output_data, request.orient)
+    return response
 
 
 async def _run_clustering(
     df: pd.DataFrame,
     mining_op,
-    display_as: Optional[str]
+    display_as: Optional[str],
+    numeric_cols: List[str]
 ) -> tuple:
     """Run clustering operation."""
     # Get K value from parameters
     k = mining_op.parameters.get('k', 3)
     
-    # Get numeric columns
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-    
     if len(numeric_cols) < 2:
         raise ValueError("Need at least 2 numeric columns for clustering")
     
     # Run K-Means clustering
-    cluster_result = kmeans_clustering(df, n_clusters=k, feature_columns=numeric_cols)
+    cluster_result = await _run_in_pool(
+        kmeans_clustering, df, n_clusters=k, feature_columns=numeric_cols,
+        narrow_columns=numeric_cols
+    )
     
     # Build mining result
     mining_result = {
@@ -322,7 +631,7 @@ async def _run_clustering(
             color_col='cluster',
             title='Clustering Results'
         )
-        chart_data = chart_result.to_dict()
+        chart_data = chart_result.as_dict
     else:
         # Default to scatter plot for clustering
         chart_result = generate_cluster_visualization(
@@ -331,7 +640,7 @@ async def _run_clustering(
             cluster_col='cluster',
             title='K-Means Clustering'
         )
-        chart_data = chart_result.to_dict()
+        chart_data = chart_result.as_dict
     
     return mining_result, chart_data
 
@@ -343,8 +652,7 @@ async def _run_statistics(
 ) -> tuple:
     """Run statistics operation."""
     # Get statistics
-    stats_result = basic_statistics(df)
-    profile = data_profile(df)
+    stats_result, profile = await _run_in_pool(summary_and_profile, df)
     
     # Build mining result
     mining_result = {
@@ -361,14 +669,14 @@ async def _run_statistics(
             df, display_as,
             title='Statistics Results'
         )
-        chart_data = chart_result.to_dict()
+        chart_data = chart_result.as_dict
     else:
         # Default to heatmap of correlations
         chart_result = generate_chart(
             df, 'heatmap',
             title='Correlation Heatmap'
         )
-        chart_data = chart_result.to_dict()
+        chart_data = chart_result.as_dict
     
     return mining_result, chart_data
 
@@ -376,20 +684,26 @@ async def _run_statistics(
 async def _run_anomaly_detection(
     df: pd.DataFrame,
     mining_op,
-    display_as: Optional[str]
+    display_as: Optional[str],
+    numeric_cols: List[str]
 ) -> tuple:
     """Run anomaly detection operation."""
-    # Get numeric columns
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-    
     if len(numeric_cols) < 1:
         raise ValueError("Need at least 1 numeric column for anomaly detection")
     
     # Run anomaly detection
-    anomaly_result = detect_anomalies(df, method='isolation_forest', feature_columns=numeric_cols)
+    anomaly_result = await _run_in_pool(
+        detect_anomalies, df, method='isolation_forest', feature_columns=numeric_cols,
+        narrow_columns=numeric_cols
+    )
     
-    # Get anomaly indices
-    anomaly_indices = anomaly_result.data[anomaly_result.data['is_anomaly'] == True].index.tolist()
+    # Get anomaly indices straight from the mask, without filtering the frame
+    mask = anomaly_result.mask
+    index = anomaly_result.data.index
+    if isinstance(index, pd.RangeIndex):
+        anomaly_indices = (index.start + index.step * np.flatnonzero(mask)).tolist()
+    else:
+        anomaly_indices = index.values[mask].tolist()
     
     # Build mining result
     mining_result = {
@@ -409,7 +723,7 @@ async def _run_anomaly_detection(
             display_as,
             title='Anomaly Detection Results'
         )
-        chart_data = chart_result.to_dict()
+        chart_data = chart_result.as_dict
     else:
         # Default to anomaly visualization
         chart_result = generate_anomaly_visualization(
@@ -419,7 +733,7 @@ async def _run_anomaly_detection(
             score_col='anomaly_score',
             title='Anomaly Detection'
         )
-        chart_data = chart_result.to_dict()
+        chart_data = chart_result.as_dict
     
     return mining_result, chart_data
 
@@ -430,12 +744,16 @@ async def _run_anomaly_detection(
 
 class LoadDataRequest(BaseModel):
     """Request to load data from CSV."""
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore', validate_assignment=False)
+    
     file_path: str
     table_name: str
 
 
 class LoadDataResponse(BaseModel):
     """Response for data loading."""
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore', validate_assignment=False)
+    
     success: bool
     table_name: str
     row_count: int
@@ -443,16 +761,20 @@ class LoadDataResponse(BaseModel):
     error: Optional[str] = None
 
 
-@app.post("/api/load-csv", response_model=LoadDataResponse)
-async def load_csv(request: LoadDataRequest):
+@app.post("/api/load-csv")
+async def load_csv(
+    request: LoadDataRequest,
+    executor: SQLiteExecutor = Depends(get_executor)
+) -> ORJSONResponse:
     """Load a CSV file into the executor."""
     try:
         if not os.path.exists(request.file_path):
             raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
         
-        df = executor.load_csv(request.file_path, request.table_name)
+        # Parsing a large CSV must not block the event loop
+        df = await asyncio.to_thread(executor.load_csv, request.file_path, request.table_name)
         
-        return LoadDataResponse(
+        response = LoadDataResponse(
             success=True,
             table_name=request.table_name,
             row_count=len(df),
@@ -461,17 +783,19 @@ async def load_csv(request: LoadDataRequest):
     except HTTPException:
         raise
     except Exception as e:
-        return LoadDataResponse(
+        response = LoadDataResponse(
             success=False,
             table_name=request.table_name,
             row_count=0,
             columns=[],
             error=str(e)
         )
+    
+    return ORJSONResponse(response.model_dump())
 
 
 @app.get("/api/tables")
-async def list_tables():
+async def list_tables(executor: SQLiteExecutor = Depends(get_executor)):
     """List all loaded tables."""
     return {"tables": executor.list_tables()}
 
@@ -482,4 +806,16 @@ async def list_tables():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Workers need an import string; the backend directory is already on
+    # sys.path (see above), so the app is importable as api.main. The auto
+    # loop is uvloop wherever uvicorn[standard] installs it (not on Windows).
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        workers=WEB_CONCURRENCY,
+        limit_concurrency=1000,
+        timeout_keep_alive=30
+    )
@@ -9,4 +9,9 @@ Supports:
 
 from .sqlite_executor import SQLiteExecutor, ExecutionResult
 
-__all__ = ['SQLiteExecutor', 'ExecutionResult']
+try:
+    from .duckdb_executor import DuckDBExecutor
+except ImportError:  # duckdb is an optional dependency
+    DuckDBExecutor = None
+
+__all__ = ['SQLiteExecutor', 'DuckDBExecutor', 'ExecutionResult']
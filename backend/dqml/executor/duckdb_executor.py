@@ -0,0 +1,148 @@
+"""
+DuckDB Executor for DMQL Queries
+
+DuckDB runs queries on vectorized columnar batches, which makes it a much
+better fit than SQLite for the analytical scans that feed mining operations.
+DMQL translation is shared with the SQLite executor; only the connection
+handling and data loading differ.
+
+Usage:
+    from backend.dqml.executor import DuckDBExecutor
+    
+    executor = DuckDBExecutor()
+    executor.connect(':memory:')
+    executor.load_csv('data/customers.csv', 'customers')
+    
+    result = executor.execute_query(parsed_query)
+"""
+
+import duckdb
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+from .sqlite_executor import SQLiteExecutor, _locked, _read_csv
+
+
+class DuckDBExecutor(SQLiteExecutor):
+    """
+    Executes DMQL queries against a DuckDB database.
+    
+    DataFrames are registered with DuckDB as views instead of being copied
+    row by row, so DuckDB scans the DataFrame's buffers directly. Registered
+    views live only as long as the connection.
+    """
+    
+    def __init__(self, db_path: str = ':memory:'):
+        """
+        Initialize the DuckDB executor.
+        
+        Args:
+            db_path: Path to DuckDB database file, or ':memory:' for in-memory DB
+        """
+        super().__init__(db_path)
+        self.conn: Optional[duckdb.DuckDBPyConnection] = None
+    
+    @_locked
+    def connect(self, db_path: Optional[str] = None) -> 'DuckDBExecutor':
+        """
+        Connect to the DuckDB database.
+        
+        Args:
+            db_path: Optional path to override the default database path
+        
+        Returns:
+            Self for method chaining
+        """
+        if db_path:
+            self.db_path = db_path
+        
+        self.conn = duckdb.connect(self.db_path)
+        self._table_set = None
+        return self
+    
+    # ========================================================================
+    # DATA LOADING
+    # ========================================================================
+    
+    @_locked
+    def load_csv(self, csv_path: str, table_name: str,
+                 database_name: Optional[str] = None) -> pd.DataFrame:
+        """
+        Load a CSV file and register it as a DuckDB table.
+        
+        Args:
+            csv_path: Path to the CSV file
+            table_name: Name for the table in DuckDB
+            database_name: Optional database name for organizing tables
+        
+        Returns:
+            The loaded DataFrame
+        """
+        df = _read_csv(csv_path)
+        self.load_dataframe(df, table_name, database_name=database_name)
+        return df
+    
+    @_locked
+    def load_dataframe(self, df: pd.DataFrame, table_name: str,
+                       database_name: Optional[str] = None) -> None:
+        """
+        Register a pandas DataFrame as a DuckDB table (zero-copy).
+        
+        Args:
+            df: The DataFrame to load
+            table_name: Name for the table
+            database_name: Optional database name
+        """
+        if not self.conn:
+            self.connect()
+        
+        full_table_name = table_name
+        if database_name:
+            full_table_name = f"{database_name}__{table_name}"
+            if database_name not in self._databases:
+                self._databases[database_name] = database_name
+        
+        self.conn.register(full_table_name, df)
+        self._table_set = None
+    
+    # ========================================================================
+    # QUERY EXECUTION
+    # ========================================================================
+    
+    def _read_sql(self, sql: str, params: Optional[List[Any]] = None,
+                  chunksize: Optional[int] = None) -> pd.DataFrame:
+        """
+        Run a SQL query on the connection and return a DataFrame.
+        
+        DuckDB already builds the DataFrame column by column, so chunksize
+        is ignored.
+        """
+        return self.conn.execute(sql, params).df()
+    
+    @_locked
+    def fetch_columnar(self, sql: str, params: Optional[List[Any]] = None,
+                       batch_size: int = 10_000) -> Dict[str, np.ndarray]:
+        """
+        Run a SQL query and return its result as one NumPy array per column.
+        
+        DuckDB results are already columnar, so the arrays come straight
+        from the result DataFrame and batch_size is ignored.
+        """
+        df = self._read_sql(sql, params)
+        return {name: col.to_numpy() for name, col in df.items()}
+    
+    def _exec(self, sql: str, params: Optional[List[Any]] = None):
+        """
+        Execute a metadata query on the connection.
+        
+        DuckDB cursors are separate connections that can't see registered
+        DataFrames, so nothing is cached here.
+        """
+        return self.conn.execute(sql, params)
+    
+    def _all_table_names(self) -> List[str]:
+        """Return the names of all tables and registered DataFrames."""
+        cursor = self._exec("SELECT table_name FROM information_schema.tables")
+        return [row[0] for row in cursor.fetchall()]
+
@@ -14,16 +14,134 @@ Usage:
     result = executor.execute_query(parsed_query)
 """
 
+import functools
 import sqlite3
+import threading
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass
 
 # Import parser types
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-from backend.dqml.parser.dmql_parser import DMQLQuery, Condition
+from backend.dqml.parser.dmql_parser import DMQLQuery, Condition, ConditionTable
+
+try:
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+try:
+    import adbc_driver_sqlite.dbapi as adbc_sqlite
+except ImportError:
+    adbc_sqlite = None
+
+
+# WAL lets readers run concurrently with a writer; temp tables, mmap and a
+# 64 MB page cache keep intermediate result sets for mining off the disk
+_CONNECTION_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'mmap_size': 268435456,
+    'cache_size': -64000,
+}
+
+# Applied while bulk loading, then reset to the connection defaults
+_BULK_LOAD_PRAGMAS = {
+    'synchronous': 'OFF',
+    'cache_size': -200000,
+}
+
+_CSV_CHUNK_ROWS = 100_000
+_INSERT_BATCH_ROWS = 10_000
+_STMT_CACHE_SIZE = 256
+
+
+def _read_csv_arrow(csv_path: str):
+    """Read a CSV file into an Arrow table with pyarrow's multithreaded parser."""
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=16 << 20)
+    return pa_csv.read_csv(csv_path, read_options=read_options)
+
+
+def _read_csv(csv_path: str) -> pd.DataFrame:
+    """Read a CSV file, using pyarrow's multithreaded parser when installed."""
+    if pa_csv is not None:
+        return _read_csv_arrow(csv_path).to_pandas(self_destruct=True)
+    return pd.read_csv(csv_path)
+
+
+def _locked(method):
+    """Run an executor method while holding the executor's connection lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _quote_ident(name: str) -> str:
+    """Quote an identifier for use in SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sort_direction(direction: str) -> str:
+    """Validate an ORDER BY direction."""
+    direction = direction.upper()
+    if direction not in ('ASC', 'DESC'):
+        raise ValueError(f"Invalid sort direction: {direction}")
+    return direction
+
+
+def _sqlite_type(dtype) -> str:
+    """Map a pandas dtype to a SQLite column type (as to_sql does)."""
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'REAL'
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return 'TIMESTAMP'
+    return 'TEXT'
+
+
+def _sqlite_rows(df: pd.DataFrame):
+    """
+    Iterate a DataFrame's rows as tuples of values sqlite3 can bind.
+    
+    Numpy columns already yield Python scalars (NaN is stored as NULL);
+    only datetime and extension/object columns with missing values need
+    converting first.
+    """
+    converted = {}
+    for i, (col, dtype) in enumerate(df.dtypes.items()):
+        series = df.iloc[:, i]
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            # Same text as sqlite3's datetime adapter (isoformat(' '))
+            series = series.dt.strftime('%Y-%m-%d %H:%M:%S.%f').str.removesuffix('.000000')
+        elif isinstance(dtype, np.dtype) and dtype != object:
+            continue
+        if series.hasnans:
+            series = series.astype(object).where(series.notna(), None)
+        converted[i] = series
+    
+    if converted:
+        df = pd.DataFrame(
+            {i: converted.get(i, df.iloc[:, i]) for i in range(len(df.columns))}
+        )
+    return df.itertuples(index=False, name=None)
+
+
+def _column_array(values: List[Any]) -> np.ndarray:
+    """Convert fetched column values to the narrowest fitting NumPy array."""
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    has_null = any(v is None for v in values)
+    if kind == 'integer' and not has_null:
+        return np.array(values, dtype=np.int64)
+    if kind in ('integer', 'floating', 'mixed-integer-float'):
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=object)
 
 
 @dataclass
@@ -61,9 +179,22 @@ class SQLiteExecutor:
         """
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
+        # Arrow-native read connection, used for file databases when ADBC is installed
+        self._adbc_conn = None
         self._databases: Dict[str, str] = {}  # Maps database names to table prefixes
         self._current_database: Optional[str] = None
+        # Names of existing tables; None until loaded, reset whenever tables change
+        self._table_set: Optional[Set[str]] = None
+        # Maps query shape to its translated SQL; valid while _table_set is
+        self._stmt_cache: Dict[tuple, str] = {}
+        # Metadata cursors keyed by SQL text, reused by _exec()
+        self._cursors: Dict[str, sqlite3.Cursor] = {}
+        # The connection and the caches above are shared by every thread
+        # (the API loads CSVs off the event loop), so public methods that
+        # use them hold this; reentrant, as they call each other
+        self._lock = threading.RLock()
     
+    @_locked
     def connect(self, db_path: Optional[str] = None) -> 'SQLiteExecutor':
         """
         Connect to the SQLite database.
@@ -77,15 +208,31 @@ class SQLiteExecutor:
         if db_path:
             self.db_path = db_path
         
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Identifiers are quoted consistently, so repeated metadata queries
+        # produce identical SQL text and hit the prepared-statement cache
+        self.conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=256
+        )
         self.conn.row_factory = sqlite3.Row
+        self._set_pragmas(_CONNECTION_PRAGMAS)
+        self._table_set = None
+        self._cursors.clear()
+        
+        # A separate connection can't see an in-memory database
+        if adbc_sqlite is not None and self.db_path != ':memory:':
+            self._adbc_conn = adbc_sqlite.connect(self.db_path, autocommit=True)
         return self
     
+    @_locked
     def close(self):
         """Close the database connection."""
+        self._cursors.clear()
         if self.conn:
             self.conn.close()
             self.conn = None
+        if self._adbc_conn is not None:
+            self._adbc_conn.close()
+            self._adbc_conn = None
     
     def __enter__(self):
         """Context manager entry."""
@@ -100,6 +247,7 @@ class SQLiteExecutor:
     # DATA LOADING
     # ========================================================================
     
+    @_locked
     def load_csv(self, csv_path: str, table_name: str, 
                  database_name: Optional[str] = None) -> pd.DataFrame:
         """
@@ -116,9 +264,6 @@ class SQLiteExecutor:
         if not self.conn:
             self.connect()
         
-        # Read CSV into DataFrame
-        df = pd.read_csv(csv_path)
-        
         # Create full table name with database prefix if provided
         full_table_name = table_name
         if database_name:
@@ -126,11 +271,29 @@ class SQLiteExecutor:
             if database_name not in self._databases:
                 self._databases[database_name] = database_name
         
-        # Load into SQLite
-        df.to_sql(full_table_name, self.conn, if_exists='replace', index=False)
+        # pyarrow parses the whole file on multiple threads; without it the
+        # CSV is read in chunks that are inserted as they are parsed
+        if pa_csv is not None:
+            table = _read_csv_arrow(csv_path)
+            if self._adbc_conn is not None:
+                self._ingest_arrow(full_table_name, table)
+                return table.to_pandas(self_destruct=True)
+            df = table.to_pandas(self_destruct=True)
+            self._bulk_insert(full_table_name, [df])
+            return df
+        
+        chunks = []
         
-        return df
+        def read_chunks():
+            for chunk in pd.read_csv(csv_path, chunksize=_CSV_CHUNK_ROWS):
+                chunks.append(chunk)
+                yield chunk
+        
+        self._bulk_insert(full_table_name, read_chunks())
+        
+        return pd.concat(chunks, ignore_index=True)
     
+    @_locked
     def load_dataframe(self, df: pd.DataFrame, table_name: str,
                        database_name: Optional[str] = None) -> None:
         """
@@ -150,8 +313,66 @@ class SQLiteExecutor:
             if database_name not in self._databases:
                 self._databases[database_name] = database_name
         
-        df.to_sql(full_table_name, self.conn, if_exists='replace', index=False)
+        self._bulk_insert(full_table_name, [df])
+    
+    def _bulk_insert(self, table_name: str, frames: Iterable[pd.DataFrame]) -> None:
+        """
+        Replace a table with the rows of one or more DataFrames.
+        
+        The table is created from the first frame's dtypes. All rows go
+        through executemany() in batches of _INSERT_BATCH_ROWS inside one
+        transaction, with durability pragmas relaxed for the duration of
+        the load; this avoids to_sql's per-row value conversion entirely.
+        """
+        name = _quote_ident(table_name)
+        insert_sql = None
+        self._table_set = None
+        
+        if self.conn.in_transaction:
+            self.conn.commit()
+        self._set_pragmas(_BULK_LOAD_PRAGMAS)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for frame in frames:
+                if insert_sql is None:
+                    columns = ', '.join(
+                        f"{_quote_ident(col)} {_sqlite_type(dtype)}"
+                        for col, dtype in frame.dtypes.items()
+                    )
+                    placeholders = ', '.join('?' * len(frame.columns))
+                    self.conn.execute(f"DROP TABLE IF EXISTS {name}")
+                    self.conn.execute(f"CREATE TABLE {name} ({columns})")
+                    insert_sql = f"INSERT INTO {name} VALUES ({placeholders})"
+                
+                for start in range(0, len(frame), _INSERT_BATCH_ROWS):
+                    batch = frame.iloc[start:start + _INSERT_BATCH_ROWS]
+                    self.conn.executemany(insert_sql, _sqlite_rows(batch))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self._set_pragmas({key: _CONNECTION_PRAGMAS[key] for key in _BULK_LOAD_PRAGMAS})
+    
+    def _ingest_arrow(self, table_name: str, table) -> None:
+        """
+        Replace a table with an Arrow table through ADBC's bulk ingest.
+        
+        The Arrow buffers are handed to the driver directly, so no per-cell
+        Python objects are created.
+        """
+        self._table_set = None
+        if self.conn.in_transaction:
+            self.conn.commit()
+        with self._adbc_conn.cursor() as cursor:
+            cursor.adbc_ingest(table_name, table, mode='replace')
+    
+    def _set_pragmas(self, pragmas: Dict[str, Any]) -> None:
+        """Apply PRAGMA settings to the connection."""
+        for key, value in pragmas.items():
+            self.conn.execute(f"PRAGMA {key}={value}")
     
+    @_locked
     def register_database(self, name: str, tables_path: Optional[str] = None) -> None:
         """
         Register a database name for organizing tables.
@@ -161,6 +382,7 @@ class SQLiteExecutor:
             tables_path: Optional path to directory containing CSV files
         """
         self._databases[name] = name
+        self._table_set = None
         
         if tables_path:
             path = Path(tables_path)
@@ -177,12 +399,19 @@ class SQLiteExecutor:
     # QUERY EXECUTION
     # ========================================================================
     
-    def execute_query(self, query: Union[DMQLQuery, str]) -> ExecutionResult:
+    @_locked
+    def execute_query(self, query: Union[DMQLQuery, str],
+                      chunksize: Optional[int] = None,
+                      columnar: bool = False) -> ExecutionResult:
         """
         Execute a DMQL query and return results.
         
         Args:
             query: Either a parsed DMQLQuery object or a raw SQL string
+            chunksize: Optional number of rows to fetch at a time; bounds the
+                       per-fetch Python object churn on large results
+            columnar: Build the DataFrame from fetch_columnar() arrays
+                      instead of going through pandas' row-based reader
             
         Returns:
             ExecutionResult with data and metadata
@@ -192,14 +421,17 @@ class SQLiteExecutor:
         
         # If raw SQL string, execute directly
         if isinstance(query, str):
-            return self._execute_raw_sql(query)
+            return self._execute_raw_sql(query, chunksize)
         
         # Translate DMQL to SQL
-        sql = self._translate_to_sql(query)
+        sql, params = self._translate_to_sql(query)
         
         # Execute the SQL
         try:
-            df = pd.read_sql_query(sql, self.conn)
+            if columnar:
+                df = pd.DataFrame(self.fetch_columnar(sql, params), copy=False)
+            else:
+                df = self._read_sql(sql, params, chunksize)
             
             return ExecutionResult(
                 success=True,
@@ -209,20 +441,24 @@ class SQLiteExecutor:
                 metadata={
                     'database': query.database,
                     'tables': query.tables,
-                    'columns': list(df.columns) if df is not None else []
+                    'columns': list(df.columns) if df is not None else [],
+                    'params': params
                 }
             )
         except Exception as e:
             return ExecutionResult(
                 success=False,
                 sql_query=sql,
-                error=str(e)
+                error=str(e),
+                metadata={'params': params}
             )
     
-    def _execute_raw_sql(self, sql: str) -> ExecutionResult:
+    def _execute_raw_sql(self, sql: str, chunksize: Optional[int] = None) -> ExecutionResult:
         """Execute raw SQL and return results."""
+        # Raw SQL may create or drop tables
+        self._table_set = None
         try:
-            df = pd.read_sql_query(sql, self.conn)
+            df = self._read_sql(sql, chunksize=chunksize)
             return ExecutionResult(
                 success=True,
                 data=df,
@@ -236,6 +472,7 @@ class SQLiteExecutor:
                 error=str(e)
             )
     
+    @_locked
     def execute_select(self, table: str, columns: Optional[List[str]] = None,
                        where_clause: Optional[str] = None,
                        group_by: Optional[List[str]] = None,
@@ -259,40 +496,119 @@ class SQLiteExecutor:
             self.connect()
         
         # Build column list
-        cols = '*' if not columns else ', '.join(columns)
+        cols = '*' if not columns else ', '.join(map(_quote_ident, columns))
         
         # Build query
-        sql = f"SELECT {cols} FROM {table}"
+        sql = f"SELECT {cols} FROM {_quote_ident(table)}"
+        params: List[Any] = []
         
         if where_clause:
             sql += f" WHERE {where_clause}"
         
         if group_by:
-            sql += f" GROUP BY {', '.join(group_by)}"
+            sql += f" GROUP BY {', '.join(map(_quote_ident, group_by))}"
         
         if order_by:
-            order_parts = [f"{col} {direction}" for col, direction in order_by]
+            order_parts = [f"{_quote_ident(col)} {_sort_direction(direction)}"
+                           for col, direction in order_by]
             sql += f" ORDER BY {', '.join(order_parts)}"
         
         if limit:
-            sql += f" LIMIT {limit}"
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        
+        return self._read_sql(sql, params)
+    
+    def _read_sql(self, sql: str, params: Optional[List[Any]] = None,
+                  chunksize: Optional[int] = None) -> pd.DataFrame:
+        """
+        Run a SQL query on the connection and return a DataFrame.
+        
+        With ADBC available the result is fetched as an Arrow table and
+        converted column by column, skipping per-cell Python objects.
+        """
+        if self._adbc_conn is not None:
+            with self._adbc_conn.cursor() as cursor:
+                cursor.execute(sql, params or None)
+                return cursor.fetch_arrow_table().to_pandas()
+        
+        if chunksize:
+            chunks = pd.read_sql_query(sql, self.conn, params=params, chunksize=chunksize)
+            return pd.concat(chunks, ignore_index=True)
+        return pd.read_sql_query(sql, self.conn, params=params)
+    
+    @_locked
+    def fetch_columnar(self, sql: str, params: Optional[List[Any]] = None,
+                       batch_size: int = 10_000) -> Dict[str, np.ndarray]:
+        """
+        Run a SQL query and return its result as one NumPy array per column.
+        
+        Rows are fetched as plain tuples in batches and transposed into
+        per-column lists, so no sqlite3.Row objects are built and each
+        column is converted to a typed array once at the end.
+        
+        Args:
+            sql: SQL query with ? placeholders
+            params: Parameter values
+            batch_size: Number of rows per fetchmany() call
+        
+        Returns:
+            Dictionary mapping column names to arrays
+        """
+        if not self.conn:
+            self.connect()
+        
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, params or ())
+        names = [d[0] for d in cursor.description]
+        columns: List[List[Any]] = [[] for _ in names]
+        
+        while rows := cursor.fetchmany(batch_size):
+            for values, batch in zip(columns, zip(*rows)):
+                values.extend(batch)
         
-        return pd.read_sql_query(sql, self.conn)
+        return {name: _column_array(values) for name, values in zip(names, columns)}
     
     # ========================================================================
     # DMQL TO SQL TRANSLATION
     # ========================================================================
     
-    def _translate_to_sql(self, query: DMQLQuery) -> str:
+    def _translate_to_sql(self, query: DMQLQuery) -> Tuple[str, List[Any]]:
         """
         Translate a DMQL query to SQL.
         
+        Queries with the same shape (tables, columns, condition structure,
+        grouping and ordering) but different literal values translate to the
+        same SQL text, so it is cached by shape and only the parameters are
+        rebuilt. The cache is dropped whenever the table set changes, since
+        table names resolve against it.
+        
         Args:
             query: Parsed DMQL query
             
         Returns:
-            SQL string
+            Tuple of (SQL string with ? placeholders, parameter values)
         """
+        # The placeholder WHERE text doubles as the condition's shape key
+        where_sql, params = '', []
+        if query.conditions:
+            where_sql, params = self._condition_to_sql(query.conditions)
+        
+        if self._table_set is None:
+            self._stmt_cache.clear()
+        key = (
+            query.database,
+            tuple(query.tables),
+            tuple(query.columns or ()),
+            where_sql,
+            tuple(query.group_by or ()),
+            tuple(map(tuple, query.order_by or ())),
+        )
+        sql = self._stmt_cache.get(key)
+        if sql is not None:
+            return sql, params
+        
         # Determine table names with potential database prefix
         tables = self._get_table_names(query.database, query.tables)
         
@@ -306,8 +622,7 @@ class SQLiteExecutor:
         sql = f"SELECT {columns} FROM {', '.join(tables)}"
         
         # Add WHERE clause
-        if query.conditions:
-            where_sql = self._condition_to_sql(query.conditions)
+        if where_sql:
             sql += f" WHERE {where_sql}"
         
         # Add GROUP BY
@@ -319,7 +634,11 @@ class SQLiteExecutor:
             order_parts = [f"{col} {direction}" for col, direction in query.order_by]
             sql += f" ORDER BY {', '.join(order_parts)}"
         
-        return sql
+        if len(self._stmt_cache) >= _STMT_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._stmt_cache[next(iter(self._stmt_cache))]
+        self._stmt_cache[key] = sql
+        return sql, params
     
     def _get_table_names(self, database: str, tables: List[str]) -> List[str]:
         """
@@ -350,47 +669,69 @@ class SQLiteExecutor:
         if not self.conn:
             return False
         
-        cursor = self.conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-            (table_name,)
-        )
-        return cursor.fetchone() is not None
+        tables = self._table_set
+        if tables is None:
+            tables = self._refresh_tables()
+        return table_name in tables
+    
+    def _refresh_tables(self) -> Set[str]:
+        """Reload the cached set of table names with a single query."""
+        self._table_set = set(self._all_table_names())
+        return self._table_set
     
-    def _condition_to_sql(self, condition: Condition) -> str:
+    def _condition_to_sql(self, condition: Condition) -> Tuple[str, List[Any]]:
         """
         Convert a Condition object to SQL WHERE clause.
         
+        The condition is flattened into a ConditionTable and its rows are
+        scanned once in pre-order; SQL fragments are collected in a list
+        and joined once, and values are bound as ? parameters rather than
+        formatted into the SQL text.
+        
         Args:
             condition: Condition object from parsed query
             
         Returns:
-            SQL condition string
-        """
-        # Handle nested conditions (AND/OR)
-        if condition.nested:
-            parts = [self._condition_to_sql(c) for c in condition.nested]
-            op = condition.logical_op or 'AND'
-            return f"({f' {op} '.join(parts)})"
-        
-        # Handle simple conditions
-        left = condition.left
-        operator = condition.operator
-        right = condition.right
-        
-        # Format the right side based on type
-        if isinstance(right, str):
-            right_sql = f"'{right}'"
-        elif right is None:
-            right_sql = 'NULL'
-        else:
-            right_sql = str(right)
+            Tuple of (SQL condition string, parameter values)
+        """
+        table = ConditionTable.from_condition(condition)
+        parts: List[str] = []
+        params: List[Any] = []
+        # Open groups as [operator, children, children emitted so far]
+        groups: List[list] = []
+        
+        for op, left, right, arity in zip(table.ops, table.lefts, table.rights, table.arity):
+            if groups:
+                group = groups[-1]
+                if group[2]:
+                    parts.append(f" {group[0]} ")
+                group[2] += 1
+            
+            # Handle nested conditions (AND/OR); their children follow
+            if arity:
+                parts.append('(')
+                groups.append([op, arity, 0])
+                continue
+            
+            # Handle simple conditions
+            if right is None:
+                parts.append(f"{left} {op} NULL")
+            else:
+                parts.append(f"{left} {op} ?")
+                params.append(right)
+            
+            # Close every group this row completed
+            while groups and groups[-1][2] == groups[-1][1]:
+                parts.append(')')
+                groups.pop()
         
-        return f"{left} {operator} {right_sql}"
+        return ''.join(parts), params
     
     # ========================================================================
     # UTILITY METHODS
     # ========================================================================
     
+    @_locked
     def get_table_info(self, table_name: str) -> List[Dict[str, Any]]:
         """
         Get information about a table's columns.
@@ -404,7 +745,7 @@ class SQLiteExecutor:
         if not self.conn:
             self.connect()
         
-        cursor = self.conn.execute(f"PRAGMA table_info({table_name})")
+        cursor = self._exec(f"PRAGMA table_info({_quote_ident(table_name)})")
         columns = cursor.fetchall()
         
         return [
@@ -418,6 +759,7 @@ class SQLiteExecutor:
             for col in columns
         ]
     
+    @_locked
     def list_tables(self, database: Optional[str] = None) -> List[str]:
         """
         List all tables in the database.
@@ -431,10 +773,7 @@ class SQLiteExecutor:
         if not self.conn:
             self.connect()
         
-        cursor = self.conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        )
-        tables = [row[0] for row in cursor.fetchall()]
+        tables = self._all_table_names()
         
         # Filter by database prefix if specified
         if database:
@@ -445,17 +784,37 @@ class SQLiteExecutor:
         
         return tables
     
+    def _exec(self, sql: str, params: Iterable[Any] = ()):
+        """
+        Execute a metadata query on a cursor kept for its SQL text.
+        
+        Callers fetch the whole result before the next call, so the cursor
+        can be re-executed; SQLite then reuses the statement compiled for
+        the identical text.
+        """
+        cursor = self._cursors.get(sql)
+        if cursor is None:
+            cursor = self._cursors[sql] = self.conn.cursor()
+        return cursor.execute(sql, params)
+    
+    def _all_table_names(self) -> List[str]:
+        """Return the names of all tables in the connected database."""
+        cursor = self._exec("SELECT name FROM sqlite_master WHERE type='table'")
+        return [row[0] for row in cursor.fetchall()]
+    
+    @_locked
     def get_row_count(self, table_name: str) -> int:
         """Get the number of rows in a table."""
         if not self.conn:
             self.connect()
         
-        cursor = self.conn.execute(f"SELECT COUNT(*) FROM {table_name}")
+        cursor = self._exec(f"SELECT COUNT(*) FROM {_quote_ident(table_name)}")
         return cursor.fetchone()[0]
     
+    @_locked
     def sample_data(self, table_name: str, n: int = 5) -> pd.DataFrame:
         """Get sample rows from a table."""
         if not self.conn:
             self.connect()
         
-        return pd.read_sql_query(f"SELECT * FROM {table_name} LIMIT {n}", self.conn)
+        return self._read_sql(f"SELECT * FROM {_quote_ident(table_name)} LIMIT ?", [int(n)])
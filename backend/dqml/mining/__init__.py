@@ -24,11 +24,14 @@ from .statistics import (
     distribution_analysis,
     group_statistics,
     data_profile,
+    summary_and_profile,
+    optimize_dtypes,
     StatisticsResult
 )
 
 from .anomaly_detection import (
     detect_anomalies,
+    detect_anomalies_async,
     detect_univariate_anomalies,
     AnomalyResult
 )
@@ -47,9 +50,12 @@ __all__ = [
     'distribution_analysis',
     'group_statistics',
     'data_profile',
+    'summary_and_profile',
+    'optimize_dtypes',
     'StatisticsResult',
     # Anomaly Detection
     'detect_anomalies',
+    'detect_anomalies_async',
     'detect_univariate_anomalies',
     'AnomalyResult'
 ]
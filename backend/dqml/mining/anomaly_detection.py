@@ -12,18 +12,40 @@ Usage:
     print(result.data['is_anomaly'])
 """
 
+import os
 import pandas as pd
 import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
+from joblib import parallel_config
 from sklearn.ensemble import IsolationForest
 from sklearn.neighbors import LocalOutlierFactor
-from sklearn.preprocessing import StandardScaler
 from dataclasses import dataclass, field
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
 
 @dataclass
 class AnomalyResult:
-    """Result of anomaly detection operation."""
+    """
+    Result of anomaly detection operation.
+    
+    data is a shallow copy of the input with the two label columns added,
+    so it shares the input's other column buffers. Without copy-on-write,
+    editing those values in place also edits the caller's DataFrame.
+    """
     data: pd.DataFrame  # DataFrame with anomaly labels
     n_anomalies: int
     anomaly_percentage: float
@@ -31,14 +53,19 @@ class AnomalyResult:
     anomaly_scores: Optional[np.ndarray] = None
     threshold: Optional[float] = None
     method: str = 'isolation_forest'
+    mask: Optional[np.ndarray] = field(default=None, repr=False)  # Boolean is_anomaly array
+    
+    def __post_init__(self):
+        if self.mask is None:
+            self.mask = self.data['is_anomaly'].to_numpy(dtype=bool)
     
     def get_anomalies(self) -> pd.DataFrame:
         """Get only the anomalous rows."""
-        return self.data[self.data['is_anomaly'] == True]
+        return self.data.iloc[self.mask]
     
     def get_normal(self) -> pd.DataFrame:
         """Get only the normal rows."""
-        return self.data[self.data['is_anomaly'] == False]
+        return self.data.iloc[~self.mask]
 
 
 def detect_anomalies(
@@ -68,8 +95,6 @@ def detect_anomalies(
         >>> result = detect_anomalies(df, method='iqr')
         >>> print(result.data['is_anomaly'])
     """
-    result_df = df.copy()
-    
     # Auto-detect numeric columns if not specified
     if feature_columns is None:
         feature_columns = df.select_dtypes(include=[np.number]).columns.tolist()
@@ -94,6 +119,35 @@ def detect_anomalies(
         raise ValueError(f"Unknown method: {method}. Use 'isolation_forest', 'lof', 'zscore', or 'iqr'")
 
 
+@lru_cache(maxsize=1)
+def _thread_pool() -> ThreadPoolExecutor:
+    """Shared thread pool for asynchronous detection, created on first use."""
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def detect_anomalies_async(df: pd.DataFrame, **kwargs) -> Future:
+    """
+    Run detect_anomalies on a background thread.
+    
+    sklearn releases the GIL while building and querying its trees, so the
+    caller can keep loading or querying data while detection runs.
+    
+    Args:
+        df: Input DataFrame
+        **kwargs: Arguments for detect_anomalies
+    
+    Returns:
+        Future resolving to an AnomalyResult
+    """
+    return _thread_pool().submit(_detect_with_threads, df, **kwargs)
+
+
+def _detect_with_threads(df: pd.DataFrame, **kwargs) -> AnomalyResult:
+    """Call detect_anomalies with joblib's n_jobs work on threads, not processes."""
+    with parallel_config(backend='threading'):
+        return detect_anomalies(df, **kwargs)
+
+
 def _isolation_forest_detection(
     df: pd.DataFrame,
     feature_columns: List[str],
@@ -102,29 +156,34 @@ def _isolation_forest_detection(
     random_state: int
 ) -> AnomalyResult:
     """Detect anomalies using Isolation Forest."""
-    result_df = df.copy()
-    X = df[feature_columns].values
-    X = np.nan_to_num(X, nan=0)
+    # Standardize in float64, where large offsets don't round away the
+    # variation, then narrow to the float32, C-ordered matrix the trees
+    # score one row at a time (sklearn would convert to float32 anyway)
+    X = df[feature_columns].to_numpy(dtype=np.float64, copy=True, na_value=0.0)
     
     if scale_features:
-        scaler = StandardScaler()
-        X = scaler.fit_transform(X)
+        _standardize_inplace(X)
+    X = np.asarray(X, dtype=np.float32, order='C')
     
-    # Fit Isolation Forest
+    # Fit Isolation Forest, building the trees in parallel
     iso_forest = IsolationForest(
         contamination=contamination,
         random_state=random_state,
-        n_estimators=100
+        n_estimators=100,
+        max_samples=min(256, len(X)),
+        bootstrap=False,
+        n_jobs=-1
     )
+    iso_forest.fit(X)
     
-    # Predict: -1 for anomalies, 1 for normal
-    predictions = iso_forest.fit_predict(X)
-    scores = iso_forest.decision_function(X)
+    # Score once; decision_function and predict would each traverse the
+    # trees again, and both are just score_samples shifted by offset_
+    scores = iso_forest.score_samples(X) - iso_forest.offset_
+    is_anomaly = scores < 0
     
-    result_df['is_anomaly'] = predictions == -1
-    result_df['anomaly_score'] = -scores  # Higher score = more anomalous
+    result_df = _with_labels(df, is_anomaly, -scores)  # Higher score = more anomalous
     
-    n_anomalies = int((predictions == -1).sum())
+    n_anomalies = int(is_anomaly.sum())
     
     return AnomalyResult(
         data=result_df,
@@ -132,10 +191,33 @@ def _isolation_forest_detection(
         anomaly_percentage=round(n_anomalies / len(df) * 100, 2),
         feature_columns=feature_columns,
         anomaly_scores=-scores,
-        method='isolation_forest'
+        method='isolation_forest',
+        mask=is_anomaly
     )
 
 
+def _with_labels(df: pd.DataFrame, is_anomaly: np.ndarray, scores: np.ndarray) -> pd.DataFrame:
+    """
+    Return df with is_anomaly and anomaly_score columns, leaving df itself unchanged.
+    
+    A shallow copy plus column assignment only allocates the two new
+    columns; DataFrame.assign deep-copies the whole frame on pandas 2.
+    """
+    result_df = df.copy(deep=False)
+    result_df['is_anomaly'] = is_anomaly
+    result_df['anomaly_score'] = scores
+    return result_df
+
+
+def _standardize_inplace(X: np.ndarray) -> None:
+    """Scale the columns of a float matrix to zero mean and unit variance, in place."""
+    mu = X.mean(axis=0, dtype=X.dtype)
+    sd = X.std(axis=0, dtype=X.dtype)
+    np.subtract(X, mu, out=X)
+    sd[sd == 0] = 1
+    np.divide(X, sd, out=X)
+
+
 def _lof_detection(
     df: pd.DataFrame,
     feature_columns: List[str],
@@ -143,28 +225,29 @@ def _lof_detection(
     scale_features: bool
 ) -> AnomalyResult:
     """Detect anomalies using Local Outlier Factor."""
-    result_df = df.copy()
-    X = df[feature_columns].values
-    X = np.nan_to_num(X, nan=0)
+    X = df[feature_columns].to_numpy(dtype=np.float64, copy=True, na_value=0.0)
     
     if scale_features:
-        scaler = StandardScaler()
-        X = scaler.fit_transform(X)
+        _standardize_inplace(X)
     
-    # Fit LOF
+    # Fit LOF; neighbor queries dominate, so run them on all cores. Ball
+    # trees only beat brute force in low dimensions
     lof = LocalOutlierFactor(
         contamination=contamination,
-        n_neighbors=min(20, len(df) - 1)
+        n_neighbors=min(20, len(df) - 1),
+        algorithm='ball_tree' if X.shape[1] <= 20 else 'auto',
+        leaf_size=64,
+        n_jobs=-1
     )
     
     # Predict: -1 for anomalies, 1 for normal
     predictions = lof.fit_predict(X)
     scores = -lof.negative_outlier_factor_  # Higher = more anomalous
+    is_anomaly = predictions == -1
     
-    result_df['is_anomaly'] = predictions == -1
-    result_df['anomaly_score'] = scores
+    result_df = _with_labels(df, is_anomaly, scores)
     
-    n_anomalies = int((predictions == -1).sum())
+    n_anomalies = int(is_anomaly.sum())
     
     return AnomalyResult(
         data=result_df,
@@ -172,7 +255,8 @@ def _lof_detection(
         anomaly_percentage=round(n_anomalies / len(df) * 100, 2),
         feature_columns=feature_columns,
         anomaly_scores=scores,
-        method='lof'
+        method='lof',
+        mask=is_anomaly
     )
 
 
@@ -186,18 +270,25 @@ def _zscore_detection(
     
     Points with Z-score > threshold in any feature are flagged as anomalies.
     """
-    result_df = df.copy()
-    X = df[feature_columns].copy()
-    
-    # Calculate Z-scores
-    zscores = np.abs((X - X.mean()) / X.std())
+    # Kept in float64 until centered: float32 rounds away the variation of
+    # large-magnitude columns (epoch seconds, IDs) before the mean is taken
+    X = df[feature_columns].to_numpy(dtype=np.float64, na_value=np.nan)
     
-    # Flag as anomaly if any feature exceeds threshold
-    is_anomaly = (zscores > threshold).any(axis=1)
-    max_zscore = zscores.max(axis=1)
+    if NUMBA_AVAILABLE:
+        # The kernel's per-row pass wants rows contiguous
+        is_anomaly, max_zscore = _zscore_kernel(np.ascontiguousarray(X), float(threshold))
+    else:
+        # Calculate Z-scores (missing values are skipped, as in pandas)
+        mu = np.nanmean(X, axis=0)
+        sd = np.nanstd(X, axis=0, ddof=1)
+        sd[sd == 0] = 1
+        zscores = np.abs((X - mu) / sd)
+        
+        # Flag as anomaly if any feature exceeds threshold
+        is_anomaly = (zscores > threshold).any(axis=1)
+        max_zscore = np.fmax.reduce(zscores, axis=1).astype(np.float32)
     
-    result_df['is_anomaly'] = is_anomaly
-    result_df['anomaly_score'] = max_zscore
+    result_df = _with_labels(df, is_anomaly, max_zscore)
     
     n_anomalies = int(is_anomaly.sum())
     
@@ -206,9 +297,10 @@ def _zscore_detection(
         n_anomalies=n_anomalies,
         anomaly_percentage=round(n_anomalies / len(df) * 100, 2),
         feature_columns=feature_columns,
-        anomaly_scores=max_zscore.values,
+        anomaly_scores=max_zscore,
         threshold=threshold,
-        method='zscore'
+        method='zscore',
+        mask=is_anomaly
     )
 
 
@@ -222,29 +314,33 @@ def _iqr_detection(
     
     Points outside [Q1 - multiplier*IQR, Q3 + multiplier*IQR] are anomalies.
     """
-    result_df = df.copy()
-    X = df[feature_columns]
+    X = df[feature_columns].to_numpy(dtype=np.float64, na_value=np.nan)
     
-    # Calculate IQR bounds for each feature
-    Q1 = X.quantile(0.25)
-    Q3 = X.quantile(0.75)
+    # Calculate IQR bounds for each feature in one partition-based pass
+    if np.isnan(X).any():
+        Q1, Q3 = np.nanpercentile(X, [25, 75], axis=0)
+    else:
+        Q1, Q3 = _q13(X)
     IQR = Q3 - Q1
     
     lower_bound = Q1 - multiplier * IQR
     upper_bound = Q3 + multiplier * IQR
     
-    # Flag as anomaly if any feature is outside bounds
-    is_below = X < lower_bound
-    is_above = X > upper_bound
-    is_anomaly = (is_below | is_above).any(axis=1)
-    
-    # Calculate anomaly score as max distance from bounds (normalized)
-    below_distance = (lower_bound - X).clip(lower=0) / IQR
-    above_distance = (X - upper_bound).clip(lower=0) / IQR
-    anomaly_score = (below_distance.abs().max(axis=1) + above_distance.abs().max(axis=1))
+    if NUMBA_AVAILABLE:
+        is_anomaly, anomaly_score = _iqr_kernel(X, lower_bound, upper_bound, IQR)
+    else:
+        # Flag as anomaly if any feature is outside bounds
+        is_anomaly = ((X < lower_bound) | (X > upper_bound)).any(axis=1)
+        
+        # Calculate anomaly score as max distance from bounds (normalized);
+        # fmax skips the NaNs a zero IQR or a missing value produces
+        with np.errstate(divide='ignore', invalid='ignore'):
+            below_distance = np.maximum(lower_bound - X, 0) / IQR
+            above_distance = np.maximum(X - upper_bound, 0) / IQR
+        anomaly_score = (np.fmax.reduce(below_distance, axis=1)
+                         + np.fmax.reduce(above_distance, axis=1))
     
-    result_df['is_anomaly'] = is_anomaly
-    result_df['anomaly_score'] = anomaly_score
+    result_df = _with_labels(df, is_anomaly, anomaly_score)
     
     n_anomalies = int(is_anomaly.sum())
     
@@ -253,11 +349,38 @@ def _iqr_detection(
         n_anomalies=n_anomalies,
         anomaly_percentage=round(n_anomalies / len(df) * 100, 2),
         feature_columns=feature_columns,
-        anomaly_scores=anomaly_score.values,
-        method='iqr'
+        anomaly_scores=anomaly_score,
+        method='iqr',
+        mask=is_anomaly
     )
 
 
+def _q13(X: np.ndarray):
+    """
+    First and third quartiles along axis 0, with linear interpolation.
+    
+    A single np.partition places just the (at most four) order statistics
+    the interpolation needs, rather than ordering the whole column.
+    
+    Returns:
+        Tuple of (q1, q3); NaN for an empty input
+    """
+    n = X.shape[0]
+    if n == 0:
+        nan = np.full(X.shape[1:], np.nan)
+        return nan, nan
+    
+    positions = (0.25 * (n - 1), 0.75 * (n - 1))
+    kth = sorted({int(np.floor(p)) for p in positions} | {int(np.ceil(p)) for p in positions})
+    part = np.partition(X, kth, axis=0)
+    
+    quartiles = []
+    for p in positions:
+        lo, hi = int(np.floor(p)), int(np.ceil(p))
+        quartiles.append(part[lo] + (part[hi] - part[lo]) * (p - lo))
+    return quartiles[0], quartiles[1]
+
+
 def detect_univariate_anomalies(
     df: pd.DataFrame,
     column: str,
@@ -274,7 +397,8 @@ def detect_univariate_anomalies(
         threshold: Custom threshold (method-specific)
         
     Returns:
-        Dictionary with anomaly information
+        Dictionary with anomaly information; anomaly_indices and
+        anomaly_values are NumPy arrays
     """
     if column not in df.columns:
         raise ValueError(f"Column '{column}' not found")
@@ -284,43 +408,142 @@ def detect_univariate_anomalies(
     if not np.issubdtype(col_data.dtype, np.number):
         raise ValueError(f"Column '{column}' is not numeric")
     
+    values = col_data.to_numpy(dtype=np.float64)
+    n_total = len(values)
+    
     if method == 'iqr':
         multiplier = threshold or 1.5
-        Q1 = col_data.quantile(0.25)
-        Q3 = col_data.quantile(0.75)
+        Q1, Q3 = _q13(values)
         IQR = Q3 - Q1
         lower = Q1 - multiplier * IQR
         upper = Q3 + multiplier * IQR
-        anomalies = col_data[(col_data < lower) | (col_data > upper)]
+        mask = (values < lower) | (values > upper)
         
     elif method == 'zscore':
         z_threshold = threshold or 3.0
-        z_scores = np.abs((col_data - col_data.mean()) / col_data.std())
-        anomalies = col_data[z_scores > z_threshold]
-        lower = col_data.mean() - z_threshold * col_data.std()
-        upper = col_data.mean() + z_threshold * col_data.std()
+        mean = values.mean() if n_total else np.nan
+        std = values.std(ddof=1) if n_total > 1 else np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mask = np.abs((values - mean) / std) > z_threshold
+        lower = mean - z_threshold * std
+        upper = mean + z_threshold * std
         
     elif method == 'mad':
         # Median Absolute Deviation
         mad_threshold = threshold or 3.5
-        median = col_data.median()
-        mad = np.median(np.abs(col_data - median))
-        modified_z = 0.6745 * (col_data - median) / mad if mad > 0 else pd.Series([0] * len(col_data))
-        anomalies = col_data[np.abs(modified_z) > mad_threshold]
+        median = np.median(values) if n_total else np.nan
+        mad = np.median(np.abs(values - median)) if n_total else np.nan
+        if mad > 0:
+            mask = np.abs(0.6745 * (values - median) / mad) > mad_threshold
+        else:
+            mask = np.zeros(n_total, dtype=bool)
         lower = median - mad_threshold * mad / 0.6745
         upper = median + mad_threshold * mad / 0.6745
         
     else:
         raise ValueError(f"Unknown method: {method}")
     
+    n_anomalies = int(mask.sum())
+    
     return {
         'column': column,
         'method': method,
-        'n_total': len(col_data),
-        'n_anomalies': len(anomalies),
-        'anomaly_percentage': round(len(anomalies) / len(col_data) * 100, 2) if len(col_data) > 0 else 0,
+        'n_total': n_total,
+        'n_anomalies': n_anomalies,
+        'anomaly_percentage': round(n_anomalies / n_total * 100, 2) if n_total > 0 else 0,
         'lower_bound': float(lower),
         'upper_bound': float(upper),
-        'anomaly_indices': anomalies.index.tolist(),
-        'anomaly_values': anomalies.tolist()
+        'anomaly_indices': col_data.index.to_numpy()[mask],
+        'anomaly_values': values[mask]
     }
+
+
+# Kernel fastmath without the no-NaN/no-inf flags: missing values are encoded as NaN
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def _zscore_kernel(X, threshold):
+    """
+    Fused z-score pass: NaN-skipping column mean/std (ddof=1), then the
+    per-row maximum |z| and threshold test. X must be float64; only the
+    scores, which are already centered and scaled, are stored as float32.
+    
+    Returns:
+        Tuple of (is_anomaly, max_zscore); rows with no values score NaN
+    """
+    n, d = X.shape
+    mu = np.empty(d)
+    sd = np.empty(d)
+    for c in prange(d):
+        total = 0.0
+        count = 0
+        for i in range(n):
+            v = X[i, c]
+            if v == v:
+                total += v
+                count += 1
+        mean = total / count if count > 0 else np.nan
+        sq = 0.0
+        for i in range(n):
+            v = X[i, c]
+            if v == v:
+                sq += (v - mean) * (v - mean)
+        std = np.sqrt(sq / (count - 1)) if count > 1 else np.nan
+        mu[c] = mean
+        sd[c] = 1.0 if std == 0 else std
+    
+    is_anomaly = np.zeros(n, dtype=np.bool_)
+    scores = np.empty(n, dtype=np.float32)
+    for i in prange(n):
+        best = np.nan
+        for c in range(d):
+            z = abs((X[i, c] - mu[c]) / sd[c])
+            if z == z and not z <= best:
+                best = z
+        scores[i] = best
+        is_anomaly[i] = best > threshold
+    return is_anomaly, scores
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def _iqr_kernel(X, lower, upper, iqr):
+    """
+    Row-wise IQR combine: flags rows outside the bounds and scores them as
+    the largest normalized distance below plus the largest above.
+    
+    Returns:
+        Tuple of (is_anomaly, anomaly_score); NaN distances are skipped
+    """
+    n, d = X.shape
+    is_anomaly = np.zeros(n, dtype=np.bool_)
+    scores = np.empty(n)
+    for i in prange(n):
+        flagged = False
+        below = np.nan
+        above = np.nan
+        for c in range(d):
+            v = X[i, c]
+            if v < lower[c] or v > upper[c]:
+                flagged = True
+            b = _scaled_distance(lower[c] - v, iqr[c])
+            if b == b and not b <= below:
+                below = b
+            a = _scaled_distance(v - upper[c], iqr[c])
+            if a == a and not a <= above:
+                above = a
+        is_anomaly[i] = flagged
+        scores[i] = below + above
+    return is_anomaly, scores
+
+
+@njit(fastmath=_FASTMATH, cache=True)
+def _scaled_distance(distance, scale):
+    """max(distance, 0) / scale with NumPy's NaN/inf results for scale == 0."""
+    if distance != distance:
+        return np.nan
+    if distance < 0:
+        distance = 0.0
+    if scale == 0:
+        return np.inf if distance > 0 else np.nan
+    return distance / scale
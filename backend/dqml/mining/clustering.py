@@ -12,19 +12,117 @@ Usage:
     # df now has 'cluster' column with cluster assignments
 """
 
+import os
 import pandas as pd
 import numpy as np
 from typing import List, Optional, Dict, Any, Tuple
-from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import silhouette_score
+from sklearn.cluster import (
+    KMeans, MiniBatchKMeans, DBSCAN, AgglomerativeClustering, kmeans_plusplus
+)
+from sklearn.metrics import (
+    silhouette_score, calinski_harabasz_score, pairwise_distances_argmin_min
+)
 from dataclasses import dataclass
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# GPU clustering through cuML is opt-in with DQML_GPU=1
+GPU_AVAILABLE = False
+if os.environ.get('DQML_GPU') == '1':
+    try:
+        import cupy
+        import cuml
+        GPU_AVAILABLE = True
+    except ImportError:
+        pass
+
+# Above this many rows K-Means switches from full-batch Lloyd's to faiss
+# (BLAS distance kernels) or, without faiss, mini-batch updates
+_LARGE_KMEANS_ROWS = 10_000
+
+# k-means++ seeding converges well, so a few restarts are enough
+_KMEANS_N_INIT = 3
+
+# Wide, moderate-sized DBSCAN inputs use a GEMM-computed distance matrix, since
+# tree searches degrade in high dimensions; the cap keeps the float32 N x N
+# matrix at 400 MB
+_DBSCAN_PRECOMPUTED_ROWS = 10_000
+_DBSCAN_PRECOMPUTED_FEATURES = 16
+
+# Agglomerative clustering needs O(N^2) memory; above this many rows it runs
+# on mini-batch K-Means sub-centroids instead of the points (BIRCH-style)
+_HIERARCHICAL_MAX_ROWS = 15_000
+_HIERARCHICAL_SUBCLUSTERS = 256
+
+# The exact silhouette is O(N^2); above this many rows it is estimated on a sample
+_SILHOUETTE_SAMPLE_SIZE = 10_000
+
+
+def _kmeans_algorithm(n_features: int, n_clusters: int) -> str:
+    """
+    Pick Elkan's triangle-inequality variant where it saves distance work.
+    
+    Elkan keeps N x K distance bounds, so it only pays off with enough
+    dimensions and clusters; otherwise plain Lloyd's is faster.
+    """
+    return 'elkan' if n_features >= 4 and n_clusters >= 8 else 'lloyd'
+
+
+def _cluster_score(
+    X: np.ndarray,
+    labels: np.ndarray,
+    method: str = 'sampled',
+    random_state: int = 42
+) -> float:
+    """
+    Score a clustering without the O(N^2) cost of the exact silhouette.
+    
+    Args:
+        X: Feature matrix the labels were fitted on
+        labels: Cluster label per row
+        method: 'sampled' (exact up to _SILHOUETTE_SAMPLE_SIZE rows, estimated
+            on a random sample above), 'exact', or 'ch' (Calinski-Harabasz,
+            O(N*K), on a different scale from the silhouette)
+        random_state: Random seed for the sample
+    
+    Returns:
+        The score
+    """
+    if method == 'ch':
+        return float(calinski_harabasz_score(X, labels))
+    if method not in ('sampled', 'exact'):
+        raise ValueError(f"Unknown silhouette method: {method}")
+    if method == 'exact' or len(labels) <= _SILHOUETTE_SAMPLE_SIZE:
+        return float(silhouette_score(X, labels))
+    return float(silhouette_score(
+        X, labels, sample_size=_SILHOUETTE_SAMPLE_SIZE, random_state=random_state
+    ))
+
 
 
 @dataclass
 class ClusteringResult:
     """Result of clustering operation."""
-    data: pd.DataFrame  # DataFrame with cluster assignments
+    data: pd.DataFrame  # Shallow copy of the input plus a cluster column
     n_clusters: int
     cluster_centers: Optional[np.ndarray] = None
     feature_columns: List[str] = None
@@ -44,7 +142,8 @@ def kmeans_clustering(
     n_clusters: int = 5,
     feature_columns: Optional[List[str]] = None,
     scale_features: bool = True,
-    random_state: int = 42
+    random_state: int = 42,
+    silhouette_method: str = 'sampled'
 ) -> ClusteringResult:
     """
     Perform K-Means clustering on a DataFrame.
@@ -55,6 +154,7 @@ def kmeans_clustering(
         feature_columns: Columns to use for clustering (None for auto-detect numeric)
         scale_features: Whether to standardize features before clustering
         random_state: Random seed for reproducibility
+        silhouette_method: How to score the clusters ('sampled', 'exact' or 'ch')
         
     Returns:
         ClusteringResult with clustered data and metadata
@@ -64,9 +164,6 @@ def kmeans_clustering(
         >>> result = kmeans_clustering(df, n_clusters=2)
         >>> print(result.data['cluster'])
     """
-    # Make a copy to avoid modifying original
-    result_df = df.copy()
-    
     # Auto-detect numeric columns if not specified
     if feature_columns is None:
         feature_columns = df.select_dtypes(include=[np.number]).columns.tolist()
@@ -74,46 +171,67 @@ def kmeans_clustering(
     if not feature_columns:
         raise ValueError("No numeric columns found for clustering")
     
-    # Extract features
-    X = df[feature_columns].values
-    
-    # Handle missing values
-    X = np.nan_to_num(X, nan=0)
-    
-    # Scale features if requested
-    scaler = None
-    if scale_features:
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
+    # Extract features as one centered float32 matrix, scaled if requested
+    X_scaled, mu, sd = _feature_matrix(df, feature_columns, scale_features)
+    
+    # Perform K-Means clustering; a single feature uses the sorted 1-D
+    # algorithm, large inputs use the GPU, faiss or mini-batches and
+    # low-dimensional data uses the Numba kernels
+    if X_scaled.shape[1] == 1 and len(X_scaled) >= n_clusters:
+        cluster_labels, centers, inertia = _kmeans_1d(
+            X_scaled[:, 0], n_clusters, random_state=random_state, n_init=_KMEANS_N_INIT
+        )
+    elif GPU_AVAILABLE and len(X_scaled) > _LARGE_KMEANS_ROWS:
+        cluster_labels, centers, inertia = _gpu_kmeans(
+            X_scaled, n_clusters, random_state=random_state
+        )
+    elif len(X_scaled) > _LARGE_KMEANS_ROWS:
+        if FAISS_AVAILABLE:
+            cluster_labels, centers, inertia = _faiss_kmeans(
+                X_scaled, n_clusters, random_state=random_state
+            )
+        else:
+            kmeans = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                random_state=random_state,
+                batch_size=4096,
+                n_init=3
+            )
+            cluster_labels = kmeans.fit_predict(X_scaled)
+            centers = kmeans.cluster_centers_
+            inertia = kmeans.inertia_
+    elif NUMBA_AVAILABLE and X_scaled.shape[1] in _ASSIGN_KERNELS and len(X_scaled) >= n_clusters:
+        cluster_labels, centers, inertia = _kmeans_lloyd(
+            X_scaled, n_clusters, random_state=random_state, n_init=_KMEANS_N_INIT
+        )
     else:
-        X_scaled = X
-    
-    # Perform K-Means clustering
-    kmeans = KMeans(
-        n_clusters=n_clusters,
-        random_state=random_state,
-        n_init=10
-    )
-    cluster_labels = kmeans.fit_predict(X_scaled)
-    
-    # Add cluster labels to DataFrame
-    result_df['cluster'] = cluster_labels
+        kmeans = KMeans(
+            n_clusters=n_clusters,
+            random_state=random_state,
+            n_init=_KMEANS_N_INIT,
+            algorithm=_kmeans_algorithm(X_scaled.shape[1], n_clusters)
+        )
+        cluster_labels = kmeans.fit_predict(X_scaled)
+        centers = kmeans.cluster_centers_
+        inertia = kmeans.inertia_
+    
+    result_df = _with_clusters(df, cluster_labels)
     
     # Calculate silhouette score if we have more than 1 cluster and enough samples
     silhouette = None
     if n_clusters > 1 and len(df) > n_clusters:
         try:
-            silhouette = silhouette_score(X_scaled, cluster_labels)
+            silhouette = _cluster_score(
+                X_scaled, cluster_labels, silhouette_method, random_state
+            )
         except:
             pass
     
     # Calculate cluster sizes
-    cluster_sizes = dict(result_df['cluster'].value_counts())
+    cluster_sizes = _cluster_sizes(cluster_labels)
     
-    # Get cluster centers (unscaled if scaling was used)
-    centers = kmeans.cluster_centers_
-    if scale_features and scaler:
-        centers = scaler.inverse_transform(centers)
+    # Map the centers back to the original units
+    centers = np.asarray(centers, dtype=np.float64) * sd + mu
     
     return ClusteringResult(
         data=result_df,
@@ -122,7 +240,131 @@ def kmeans_clustering(
         feature_columns=feature_columns,
         silhouette_score=silhouette,
         cluster_sizes=cluster_sizes,
-        inertia=kmeans.inertia_
+        inertia=inertia
+    )
+
+
+def _with_clusters(df: pd.DataFrame, labels: np.ndarray) -> pd.DataFrame:
+    """
+    Return df with a cluster column, leaving df itself unchanged.
+    
+    A shallow copy plus column assignment only allocates the label column;
+    DataFrame.assign deep-copies the whole frame on pandas 2.
+    """
+    result_df = df.copy(deep=False)
+    result_df['cluster'] = labels
+    return result_df
+
+
+def _cluster_sizes(labels: np.ndarray) -> Dict[int, int]:
+    """
+    Size of each cluster, largest first, as value_counts() would order it.
+    
+    The labels are small integers, so they are counted with np.bincount;
+    the offset makes room for DBSCAN's -1 noise label.
+    """
+    labels = np.asarray(labels)
+    if len(labels) == 0:
+        return {}
+    offset = int(labels.min())
+    counts = np.bincount(labels - offset)
+    present = np.flatnonzero(counts)
+    order = present[np.argsort(-counts[present], kind='stable')]
+    return dict(zip((order + offset).tolist(), counts[order].tolist()))
+
+
+def _feature_matrix(
+    df: pd.DataFrame,
+    feature_columns: List[str],
+    scale_features: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build a centered float32 feature matrix with NaNs set to 0.
+    
+    The features are read as float64 and centered (and, when scaling,
+    divided by their standard deviation) before they are narrowed to
+    float32; narrowing first would round away the variation of
+    large-magnitude columns such as epoch seconds. Centering is a
+    translation, so distances, labels and inertia are unchanged. The
+    matrix keeps pandas' column-major layout: forcing it to C order would
+    cost a transposing copy, and the estimators that need rows contiguous
+    make their own.
+    
+    Returns:
+        Tuple of (matrix, mean, std) for mapping centers back with
+        centers * std + mean; std is all ones without scaling
+    """
+    X = df[feature_columns].to_numpy(dtype=np.float64, copy=True, na_value=0.0)
+    mu = np.zeros(X.shape[1])
+    sd = np.ones(X.shape[1])
+    if not len(X):
+        return X.astype(np.float32), mu, sd
+    
+    if NUMBA_AVAILABLE:
+        # Both moments and the narrowing in one kernel, one column per thread
+        out = np.empty_like(X, dtype=np.float32)
+        _standardize_kernel(X, out, mu, sd, scale_features)
+        return out, mu, sd
+    
+    mu = X.mean(axis=0)
+    X -= mu
+    if scale_features:
+        # Centered sum of squares without the temporary X.std() allocates
+        sd = np.sqrt(np.einsum('ij,ij->j', X, X) / len(X))
+        sd[sd == 0] = 1.0
+        X /= sd
+    return X.astype(np.float32), mu, sd
+
+
+def _faiss_kmeans(
+    X: np.ndarray,
+    n_clusters: int,
+    random_state: int = 42,
+    niter: int = 20
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    K-Means with faiss, which computes distances through BLAS matrix products.
+    
+    Returns:
+        Tuple of (labels, centers, inertia)
+    """
+    X32 = np.ascontiguousarray(X, dtype=np.float32)
+    kmeans = faiss.Kmeans(X32.shape[1], n_clusters, niter=niter, nredo=1, seed=random_state)
+    kmeans.train(X32)
+    distances, labels = kmeans.index.search(X32, 1)
+    return (
+        labels[:, 0].astype(np.int64),
+        kmeans.centroids.astype(np.float64),
+        float(distances.sum())
+    )
+
+
+def _gpu_kmeans(
+    X: np.ndarray,
+    n_clusters: int,
+    random_state: int = 42
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    K-Means on the GPU with cuML, seeded with scalable k-means++.
+    
+    The matrix is copied to the device once and only labels and centers
+    come back.
+    
+    Returns:
+        Tuple of (labels, centers, inertia)
+    """
+    kmeans = cuml.KMeans(
+        n_clusters=n_clusters,
+        random_state=random_state,
+        n_init=1,
+        init='scalable-k-means++',
+        output_type='numpy'
+    )
+    labels = kmeans.fit_predict(cupy.asarray(X, dtype=np.float32))
+    return (
+        np.asarray(labels, dtype=np.int64),
+        np.asarray(kmeans.cluster_centers_, dtype=np.float64),
+        float(kmeans.inertia_)
     )
 
 
@@ -131,7 +373,8 @@ def dbscan_clustering(
     eps: float = 0.5,
     min_samples: int = 5,
     feature_columns: Optional[List[str]] = None,
-    scale_features: bool = True
+    scale_features: bool = True,
+    silhouette_method: str = 'sampled'
 ) -> ClusteringResult:
     """
     Perform DBSCAN clustering on a DataFrame.
@@ -145,32 +388,32 @@ def dbscan_clustering(
         min_samples: Minimum samples in a neighborhood for a core point
         feature_columns: Columns to use for clustering
         scale_features: Whether to standardize features
+        silhouette_method: How to score the clusters ('sampled', 'exact' or 'ch')
         
     Returns:
         ClusteringResult with clustered data
     """
-    result_df = df.copy()
-    
     if feature_columns is None:
         feature_columns = df.select_dtypes(include=[np.number]).columns.tolist()
     
     if not feature_columns:
         raise ValueError("No numeric columns found for clustering")
     
-    X = df[feature_columns].values
-    X = np.nan_to_num(X, nan=0)
-    
-    if scale_features:
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-    else:
-        X_scaled = X
+    X_scaled, _, _ = _feature_matrix(df, feature_columns, scale_features)
     
     # Perform DBSCAN
-    dbscan = DBSCAN(eps=eps, min_samples=min_samples)
-    cluster_labels = dbscan.fit_predict(X_scaled)
+    if GPU_AVAILABLE and len(X_scaled) > _LARGE_KMEANS_ROWS:
+        dbscan = cuml.DBSCAN(eps=eps, min_samples=min_samples, output_type='numpy')
+        cluster_labels = dbscan.fit_predict(cupy.asarray(X_scaled, dtype=np.float32))
+    elif (len(X_scaled) <= _DBSCAN_PRECOMPUTED_ROWS
+          and X_scaled.shape[1] >= _DBSCAN_PRECOMPUTED_FEATURES):
+        dbscan = DBSCAN(eps=eps, min_samples=min_samples, metric='precomputed', n_jobs=-1)
+        cluster_labels = dbscan.fit_predict(_euclidean_distances(X_scaled))
+    else:
+        dbscan = DBSCAN(eps=eps, min_samples=min_samples)
+        cluster_labels = dbscan.fit_predict(X_scaled)
     
-    result_df['cluster'] = cluster_labels
+    result_df = _with_clusters(df, cluster_labels)
     
     # Count clusters (excluding noise labeled as -1)
     unique_labels = set(cluster_labels)
@@ -182,11 +425,13 @@ def dbscan_clustering(
         mask = cluster_labels != -1
         if mask.sum() > n_clusters:
             try:
-                silhouette = silhouette_score(X_scaled[mask], cluster_labels[mask])
+                silhouette = _cluster_score(
+                    X_scaled[mask], cluster_labels[mask], silhouette_method
+                )
             except:
                 pass
     
-    cluster_sizes = dict(result_df['cluster'].value_counts())
+    cluster_sizes = _cluster_sizes(cluster_labels)
     
     return ClusteringResult(
         data=result_df,
@@ -197,12 +442,31 @@ def dbscan_clustering(
     )
 
 
+def _euclidean_distances(X: np.ndarray) -> np.ndarray:
+    """
+    Pairwise Euclidean distances via ||x-y||^2 = x.x + y.y - 2 x.y.
+    
+    The cross term is a single BLAS matrix product, and the rest is done
+    in place on its result.
+    """
+    norms = np.einsum('ij,ij->i', X, X)
+    D = X @ X.T
+    D *= -2
+    D += norms[:, np.newaxis]
+    D += norms[np.newaxis, :]
+    # Rounding can leave tiny negatives where the distance is 0
+    np.maximum(D, 0, out=D)
+    np.fill_diagonal(D, 0)
+    return np.sqrt(D, out=D)
+
+
 def hierarchical_clustering(
     df: pd.DataFrame,
     n_clusters: int = 5,
     feature_columns: Optional[List[str]] = None,
     linkage: str = 'ward',
-    scale_features: bool = True
+    scale_features: bool = True,
+    silhouette_method: str = 'sampled'
 ) -> ClusteringResult:
     """
     Perform hierarchical/agglomerative clustering on a DataFrame.
@@ -213,44 +477,47 @@ def hierarchical_clustering(
         feature_columns: Columns to use for clustering
         linkage: Linkage method ('ward', 'complete', 'average', 'single')
         scale_features: Whether to standardize features
+        silhouette_method: How to score the clusters ('sampled', 'exact' or 'ch')
         
     Returns:
         ClusteringResult with clustered data
     """
-    result_df = df.copy()
-    
     if feature_columns is None:
         feature_columns = df.select_dtypes(include=[np.number]).columns.tolist()
     
     if not feature_columns:
         raise ValueError("No numeric columns found for clustering")
     
-    X = df[feature_columns].values
-    X = np.nan_to_num(X, nan=0)
-    
-    if scale_features:
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-    else:
-        X_scaled = X
+    X_scaled, _, _ = _feature_matrix(df, feature_columns, scale_features)
     
-    # Perform hierarchical clustering
+    # Perform hierarchical clustering; large inputs are first reduced to
+    # sub-centroids, and each point takes the cluster of its sub-centroid
     clustering = AgglomerativeClustering(
         n_clusters=n_clusters,
         linkage=linkage
     )
-    cluster_labels = clustering.fit_predict(X_scaled)
+    if len(X_scaled) > _HIERARCHICAL_MAX_ROWS:
+        subclusters = MiniBatchKMeans(
+            n_clusters=max(_HIERARCHICAL_SUBCLUSTERS, 4 * n_clusters),
+            random_state=42,
+            batch_size=4096,
+            n_init=3
+        )
+        sub_labels = subclusters.fit_predict(X_scaled)
+        cluster_labels = clustering.fit_predict(subclusters.cluster_centers_)[sub_labels]
+    else:
+        cluster_labels = clustering.fit_predict(X_scaled)
     
-    result_df['cluster'] = cluster_labels
+    result_df = _with_clusters(df, cluster_labels)
     
     silhouette = None
     if n_clusters > 1 and len(df) > n_clusters:
         try:
-            silhouette = silhouette_score(X_scaled, cluster_labels)
+            silhouette = _cluster_score(X_scaled, cluster_labels, silhouette_method)
         except:
             pass
     
-    cluster_sizes = dict(result_df['cluster'].value_counts())
+    cluster_sizes = _cluster_sizes(cluster_labels)
     
     return ClusteringResult(
         data=result_df,
@@ -265,7 +532,9 @@ def find_optimal_k(
     df: pd.DataFrame,
     k_range: Tuple[int, int] = (2, 10),
     feature_columns: Optional[List[str]] = None,
-    scale_features: bool = True
+    scale_features: bool = True,
+    silhouette_method: str = 'sampled',
+    n_jobs: int = -1
 ) -> Dict[str, Any]:
     """
     Find the optimal number of clusters using the elbow method and silhouette score.
@@ -275,6 +544,8 @@ def find_optimal_k(
         k_range: Range of K values to try (min, max)
         feature_columns: Columns to use for clustering
         scale_features: Whether to standardize features
+        silhouette_method: How to score each K ('sampled', 'exact' or 'ch')
+        n_jobs: Worker processes for scoring the K values (-1 for all CPUs)
         
     Returns:
         Dictionary with optimal K and metrics for each K value
@@ -282,36 +553,51 @@ def find_optimal_k(
     if feature_columns is None:
         feature_columns = df.select_dtypes(include=[np.number]).columns.tolist()
     
-    X = df[feature_columns].values
-    X = np.nan_to_num(X, nan=0)
-    
-    if scale_features:
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-    else:
-        X_scaled = X
+    X_scaled, _, _ = _feature_matrix(df, feature_columns, scale_features)
+    # Every K refits on the matrix, so hand KMeans rows it won't re-copy
+    X_scaled = np.ascontiguousarray(X_scaled)
     
     results = {
         'k_values': [],
         'inertia': [],
         'silhouette_scores': []
     }
+    fitted_labels = []
     
+    # Each K after the first is warm-started from the previous K's centers
+    # plus the point furthest from all of them, so a single run converges
+    prev_centers = None
     for k in range(k_range[0], k_range[1] + 1):
-        kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
+        if prev_centers is None:
+            init, n_init = 'k-means++', _KMEANS_N_INIT
+        else:
+            _, nearest = pairwise_distances_argmin_min(X_scaled, prev_centers)
+            new_idx = int(np.argmax(nearest))
+            init = np.vstack([prev_centers, X_scaled[new_idx:new_idx + 1]])
+            n_init = 1
+        
+        kmeans = KMeans(
+            n_clusters=k,
+            init=init,
+            random_state=42,
+            n_init=n_init,
+            algorithm=_kmeans_algorithm(X_scaled.shape[1], k)
+        )
         labels = kmeans.fit_predict(X_scaled)
+        prev_centers = kmeans.cluster_centers_
         
         results['k_values'].append(k)
         results['inertia'].append(kmeans.inertia_)
-        
-        if k > 1:
-            try:
-                score = silhouette_score(X_scaled, labels)
-                results['silhouette_scores'].append(score)
-            except:
-                results['silhouette_scores'].append(0)
-        else:
-            results['silhouette_scores'].append(0)
+        fitted_labels.append(labels)
+    
+    # The fits chain through their warm starts, but scoring each K is
+    # independent; small inputs aren't worth the worker start-up
+    if len(X_scaled) <= _LARGE_KMEANS_ROWS:
+        n_jobs = 1
+    results['silhouette_scores'] = Parallel(n_jobs=n_jobs, prefer='processes')(
+        delayed(_score_k)(X_scaled, labels, silhouette_method)
+        for labels in fitted_labels
+    )
     
     # Find optimal K based on silhouette score
     if results['silhouette_scores']:
@@ -323,3 +609,231 @@ def find_optimal_k(
         results['best_silhouette'] = 0
     
     return results
+
+
+def _score_k(X: np.ndarray, labels: np.ndarray, method: str) -> float:
+    """Score one K of the elbow sweep, 0 when it can't be scored."""
+    if len(np.unique(labels)) < 2:
+        return 0
+    # One BLAS thread per worker, so parallel workers don't oversubscribe the CPUs
+    with threadpool_limits(1):
+        try:
+            return _cluster_score(X, labels, method)
+        except:
+            return 0
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _assign_d2(X, centers, labels, dists):
+    """Assign each 2-D point to its nearest center."""
+    for i in prange(X.shape[0]):
+        x0 = X[i, 0]
+        x1 = X[i, 1]
+        best = np.inf
+        best_j = 0
+        for j in range(centers.shape[0]):
+            d0 = x0 - centers[j, 0]
+            d1 = x1 - centers[j, 1]
+            d = d0 * d0 + d1 * d1
+            if d < best:
+                best = d
+                best_j = j
+        labels[i] = best_j
+        dists[i] = best
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _assign_d3(X, centers, labels, dists):
+    """Assign each 3-D point to its nearest center."""
+    for i in prange(X.shape[0]):
+        x0 = X[i, 0]
+        x1 = X[i, 1]
+        x2 = X[i, 2]
+        best = np.inf
+        best_j = 0
+        for j in range(centers.shape[0]):
+            d0 = x0 - centers[j, 0]
+            d1 = x1 - centers[j, 1]
+            d2 = x2 - centers[j, 2]
+            d = d0 * d0 + d1 * d1 + d2 * d2
+            if d < best:
+                best = d
+                best_j = j
+        labels[i] = best_j
+        dists[i] = best
+
+
+@njit(cache=True)
+def _update_centers(X, labels, centers):
+    """Move centers to the mean of their points; returns the squared shift."""
+    k, d = centers.shape
+    sums = np.zeros((k, d))
+    counts = np.zeros(k)
+    for i in range(X.shape[0]):
+        j = labels[i]
+        counts[j] += 1
+        for c in range(d):
+            sums[j, c] += X[i, c]
+    
+    shift = 0.0
+    for j in range(k):
+        # Empty clusters keep their previous center
+        if counts[j] > 0:
+            for c in range(d):
+                new = sums[j, c] / counts[j]
+                diff = new - centers[j, c]
+                shift += diff * diff
+                centers[j, c] = new
+    return shift
+
+
+# Assignment kernels specialized on the number of features
+_ASSIGN_KERNELS = {2: _assign_d2, 3: _assign_d3}
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _standardize_kernel(X, out, mu, sd, scale):
+    """
+    Center the float64 columns of X into the float32 matrix out, dividing
+    by the standard deviation when scale is set; one column per thread.
+    
+    The mean and variance are two float64 passes, and values are centered
+    before they are narrowed, so large offsets don't cancel the variation.
+    """
+    n, d = X.shape
+    for j in prange(d):
+        total = 0.0
+        for i in range(n):
+            total += X[i, j]
+        mean = total / n
+        std = 1.0
+        if scale:
+            sq = 0.0
+            for i in range(n):
+                t = X[i, j] - mean
+                sq += t * t
+            var = sq / n
+            std = np.sqrt(var) if var > 0 else 1.0
+        mu[j] = mean
+        sd[j] = std
+        for i in range(n):
+            out[i, j] = (X[i, j] - mean) / std
+
+
+def _kmeans_lloyd(
+    X: np.ndarray,
+    n_clusters: int,
+    random_state: int = 42,
+    n_init: int = 10,
+    max_iter: int = 300,
+    tol: float = 1e-4
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Lloyd's K-Means using the dimension-specialized kernels.
+    
+    Mirrors sklearn's KMeans defaults (k-means++ init, n_init restarts,
+    tolerance relative to the feature variance).
+    
+    Args:
+        X: Feature matrix with 2 or 3 columns
+        n_clusters: Number of clusters (K)
+        random_state: Random seed for reproducibility
+        n_init: Number of restarts; the lowest-inertia run is kept
+        max_iter: Maximum iterations per run
+        tol: Convergence tolerance on the center shift
+    
+    Returns:
+        Tuple of (labels, centers, inertia)
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    assign = _ASSIGN_KERNELS[X.shape[1]]
+    rng = np.random.RandomState(random_state)
+    tol = tol * float(np.var(X, axis=0).mean())
+    
+    labels = np.empty(X.shape[0], dtype=np.int64)
+    dists = np.empty(X.shape[0], dtype=np.float64)
+    best = None
+    for _ in range(n_init):
+        centers, _ = kmeans_plusplus(X, n_clusters, random_state=rng)
+        centers = np.ascontiguousarray(centers)
+        for _ in range(max_iter):
+            assign(X, centers, labels, dists)
+            if _update_centers(X, labels, centers) <= tol:
+                break
+        assign(X, centers, labels, dists)
+        inertia = float(dists.sum())
+        if best is None or inertia < best[2]:
+            best = (labels.copy(), centers.copy(), inertia)
+    
+    return best
+
+
+def _kmeans_1d(
+    x: np.ndarray,
+    n_clusters: int,
+    random_state: int = 42,
+    n_init: int = 10,
+    max_iter: int = 300,
+    tol: float = 1e-4
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Lloyd's K-Means for a single feature on sorted values.
+    
+    In one dimension every cluster is a contiguous run of the sorted
+    values, bounded by the midpoints between neighbouring centers. After
+    one O(N log N) sort, each iteration finds the boundaries by binary
+    search and the cluster sums from prefix sums, so it costs O(K log N)
+    instead of O(N K).
+    
+    Args:
+        x: Feature values
+        n_clusters: Number of clusters (K)
+        random_state: Random seed for reproducibility
+        n_init: Number of restarts; the lowest-inertia run is kept
+        max_iter: Maximum iterations per run
+        tol: Convergence tolerance on the center shift
+    
+    Returns:
+        Tuple of (labels, centers, inertia), centers in ascending order
+    """
+    x = np.asarray(x, dtype=np.float64)
+    xs = np.sort(x)
+    sums = np.concatenate(([0.0], np.cumsum(xs)))
+    squares = np.concatenate(([0.0], np.cumsum(xs * xs)))
+    rng = np.random.RandomState(random_state)
+    tol = tol * float(np.var(xs))
+    
+    def run_bounds(centers):
+        """Start offset of each cluster's run in xs, plus the end."""
+        mids = np.searchsorted(xs, (centers[:-1] + centers[1:]) / 2)
+        return np.concatenate(([0], mids, [len(xs)]))
+    
+    best = None
+    for _ in range(n_init):
+        centers, _ = kmeans_plusplus(xs[:, np.newaxis], n_clusters, random_state=rng)
+        centers = np.sort(centers[:, 0])
+        for _ in range(max_iter):
+            bounds = run_bounds(centers)
+            counts = np.diff(bounds)
+            cluster_sums = sums[bounds[1:]] - sums[bounds[:-1]]
+            # Empty clusters keep their center
+            new_centers = np.where(counts > 0, cluster_sums / np.maximum(counts, 1), centers)
+            shift = float(((new_centers - centers) ** 2).sum())
+            centers = new_centers
+            if shift <= tol:
+                break
+        
+        bounds = run_bounds(centers)
+        counts = np.diff(bounds)
+        cluster_sums = sums[bounds[1:]] - sums[bounds[:-1]]
+        cluster_squares = squares[bounds[1:]] - squares[bounds[:-1]]
+        inertia = float(np.sum(
+            cluster_squares - 2 * centers * cluster_sums + centers * centers * counts
+        ))
+        if best is None or inertia < best[1]:
+            best = (centers, max(inertia, 0.0))
+    
+    centers, inertia = best
+    # Values on a midpoint go to the upper cluster, as in run_bounds
+    labels = np.searchsorted((centers[:-1] + centers[1:]) / 2, x, side='right')
+    return labels, centers[:, np.newaxis], inertia
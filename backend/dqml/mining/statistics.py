@@ -12,12 +12,27 @@ Usage:
     print(stats['summary'])
 """
 
+import warnings
+from itertools import islice
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from scipy import stats as scipy_stats
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
 
 @dataclass
 class StatisticsResult:
@@ -62,36 +77,16 @@ def basic_statistics(df: pd.DataFrame) -> StatisticsResult:
     numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     categorical_cols = df.select_dtypes(exclude=[np.number]).columns.tolist()
     
-    # Calculate summary statistics for numeric columns
-    summary = {}
-    for col in numeric_cols:
-        col_data = df[col].dropna()
-        if len(col_data) > 0:
-            summary[col] = {
-                'count': int(len(col_data)),
-                'mean': float(col_data.mean()),
-                'median': float(col_data.median()),
-                'std': float(col_data.std()) if len(col_data) > 1 else 0.0,
-                'min': float(col_data.min()),
-                'max': float(col_data.max()),
-                'q25': float(col_data.quantile(0.25)),
-                'q50': float(col_data.quantile(0.50)),
-                'q75': float(col_data.quantile(0.75)),
-                'variance': float(col_data.var()) if len(col_data) > 1 else 0.0,
-                'skewness': float(col_data.skew()) if len(col_data) > 2 else 0.0,
-                'kurtosis': float(col_data.kurtosis()) if len(col_data) > 3 else 0.0
-            }
-    
-    # Calculate correlations for numeric columns
-    correlations = None
-    if len(numeric_cols) > 1:
-        correlations = df[numeric_cols].corr()
+    # Calculate summary statistics and correlations for numeric columns
+    # from one shared float64 block
+    X = _numeric_block(df, numeric_cols)
+    summary = _summarize_block(X, numeric_cols)
+    correlations = _pearson_correlations(df, X, numeric_cols)
     
     # Calculate value counts for categorical columns
     value_counts = {}
     for col in categorical_cols:
-        counts = df[col].value_counts().head(20)  # Top 20 values
-        value_counts[col] = counts.to_dict()
+        value_counts[col] = _top_value_counts(df[col], 20)  # Top 20 values
     
     # Calculate missing values
     missing_values = df.isnull().sum().to_dict()
@@ -108,6 +103,200 @@ def basic_statistics(df: pd.DataFrame) -> StatisticsResult:
     )
 
 
+def _numeric_summary(df: pd.DataFrame, numeric_cols: List[str]) -> Dict[str, Dict[str, float]]:
+    """
+    Summary statistics for all numeric columns at once.
+    
+    The columns are converted to one float64 block and reduced along axis
+    0, so each statistic is one vectorized pass over the block rather than
+    a pandas call per column. Missing values are skipped and sample
+    (ddof=1, bias-corrected) estimators are used, as in pandas.
+    """
+    if not numeric_cols:
+        return {}
+    return _summarize_block(_numeric_block(df, numeric_cols), numeric_cols)
+
+
+def _numeric_block(df: pd.DataFrame, numeric_cols: List[str]) -> np.ndarray:
+    """The numeric columns as one float64 matrix, with NaN for missing values."""
+    return df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _pearson_correlations(
+    df: pd.DataFrame,
+    X: np.ndarray,
+    numeric_cols: List[str]
+) -> Optional[pd.DataFrame]:
+    """
+    Pearson correlation matrix of the numeric columns, or None below two.
+    
+    Complete blocks go through np.corrcoef, a single BLAS matrix product.
+    With missing values pandas' pairwise-complete corr() is used instead,
+    since corrcoef would turn every affected pair into NaN.
+    """
+    if len(numeric_cols) < 2:
+        return None
+    if np.isnan(X).any():
+        return df[numeric_cols].corr()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        M = np.corrcoef(X, rowvar=False)
+    return pd.DataFrame(M, index=numeric_cols, columns=numeric_cols)
+
+
+def _summarize_block(X: np.ndarray, names: List[str]) -> Dict[str, Dict[str, float]]:
+    """Compute the _numeric_summary statistics for the columns of a float64 block."""
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        # All-missing columns are dropped below; silence their empty-slice warnings
+        warnings.simplefilter('ignore', RuntimeWarning)
+        if NUMBA_AVAILABLE:
+            # Count, min, max and all four moments in a single pass
+            counts, mean, M2, M3, M4, col_min, col_max = _moments_kernel(X)
+            variance = M2 / (counts - 1)
+            skewness, kurtosis = _corrected_shape(counts, M2 / counts, M3 / counts, M4 / counts)
+        else:
+            has_nan = bool(np.isnan(X).any())
+            counts = X.shape[0] - np.isnan(X).sum(axis=0) if has_nan else np.full(X.shape[1], X.shape[0])
+            mean = np.nanmean(X, axis=0)
+            variance = np.nanvar(X, axis=0, ddof=1)
+            col_min = np.nanmin(X, axis=0)
+            col_max = np.nanmax(X, axis=0)
+            skewness, kurtosis = _sample_skew_kurtosis(X, mean, counts, has_nan)
+        q25, q50, q75 = np.nanpercentile(X, [25, 50, 75], axis=0)
+    
+    # pandas reports 0 rather than NaN for constant columns
+    constant = variance == 0
+    skewness[constant] = 0.0
+    kurtosis[constant] = 0.0
+    
+    summary = {}
+    for i, col in enumerate(names):
+        count = int(counts[i])
+        if count == 0:
+            continue
+        summary[col] = {
+            'count': count,
+            'mean': float(mean[i]),
+            'median': float(q50[i]),
+            'std': float(np.sqrt(variance[i])) if count > 1 else 0.0,
+            'min': float(col_min[i]),
+            'max': float(col_max[i]),
+            'q25': float(q25[i]),
+            'q50': float(q50[i]),
+            'q75': float(q75[i]),
+            'variance': float(variance[i]) if count > 1 else 0.0,
+            'skewness': float(skewness[i]) if count > 2 else 0.0,
+            'kurtosis': float(kurtosis[i]) if count > 3 else 0.0
+        }
+    return summary
+
+
+def _sample_skew_kurtosis(
+    X: np.ndarray,
+    mean: np.ndarray,
+    counts: np.ndarray,
+    has_nan: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bias-corrected skewness and excess kurtosis of each column, NaNs skipped.
+    
+    Matches scipy.stats.skew/kurtosis(bias=False), but the central moments
+    come from one pass over the block with the already computed means;
+    scipy's nan_policy='omit' falls back to a Python loop over the columns.
+    """
+    d = X - mean
+    if has_nan:
+        np.nan_to_num(d, copy=False, nan=0.0)
+    d2 = d * d
+    m2 = d2.sum(axis=0) / counts
+    m3 = (d2 * d).sum(axis=0) / counts
+    m4 = (d2 * d2).sum(axis=0) / counts
+    return _corrected_shape(counts, m2, m3, m4)
+
+
+def _corrected_shape(
+    counts: np.ndarray,
+    m2: np.ndarray,
+    m3: np.ndarray,
+    m4: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Bias-corrected skewness and excess kurtosis from the central moments."""
+    n = counts.astype(np.float64)
+    skewness = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+    kurtosis = ((n * n - 1) * m4 / (m2 * m2) - 3 * (n - 1) ** 2) / ((n - 2) * (n - 3))
+    return skewness, kurtosis
+
+
+@njit(parallel=True, cache=True)
+def _moments_kernel(X):
+    """
+    Per-column count, mean, central moment sums M2-M4, min and max.
+    
+    One Welford-style pass per column (Terriberry's update for the higher
+    moments), one column per thread; NaNs are skipped. No fastmath: it
+    would let LLVM assume the NaN checks away.
+    """
+    n, d = X.shape
+    counts = np.zeros(d, dtype=np.int64)
+    mean = np.full(d, np.nan)
+    M2 = np.zeros(d)
+    M3 = np.zeros(d)
+    M4 = np.zeros(d)
+    col_min = np.full(d, np.nan)
+    col_max = np.full(d, np.nan)
+    for j in prange(d):
+        k = 0
+        mu = 0.0
+        m2 = 0.0
+        m3 = 0.0
+        m4 = 0.0
+        lo = np.inf
+        hi = -np.inf
+        for i in range(n):
+            x = X[i, j]
+            if np.isnan(x):
+                continue
+            k1 = k
+            k += 1
+            delta = x - mu
+            delta_k = delta / k
+            delta_k2 = delta_k * delta_k
+            term = delta * delta_k * k1
+            mu += delta_k
+            m4 += term * delta_k2 * (k * k - 3 * k + 3) + 6 * delta_k2 * m2 - 4 * delta_k * m3
+            m3 += term * delta_k * (k - 2) - 3 * delta_k * m2
+            m2 += term
+            lo = min(lo, x)
+            hi = max(hi, x)
+        counts[j] = k
+        M2[j] = m2
+        M3[j] = m3
+        M4[j] = m4
+        if k > 0:
+            mean[j] = mu
+            col_min[j] = lo
+            col_max[j] = hi
+    return counts, mean, M2, M3, M4, col_min, col_max
+
+
+def _top_value_counts(series: pd.Series, n: int) -> Dict[Any, int]:
+    """
+    The n most frequent non-null values and their counts, most frequent first.
+    
+    Same counts as series.value_counts().head(n), but the values are
+    hashed once by factorize() and counted with np.bincount; only the
+    unique counts are sorted. Ties keep first-appearance order, which
+    value_counts only guarantees from pandas 3 on.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # value_counts also reports unused categories
+        return series.value_counts().head(n).to_dict()
+    
+    codes, uniques = pd.factorize(series)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    top = np.argsort(-counts, kind='stable')[:n]
+    return dict(zip(uniques[top].tolist(), counts[top].tolist()))
+
+
 def column_statistics(
     df: pd.DataFrame,
     column: str
@@ -137,39 +326,43 @@ def column_statistics(
     }
     
     # Numeric column statistics
-    if np.issubdtype(col_data.dtype, np.number):
-        clean_data = col_data.dropna()
-        if len(clean_data) > 0:
+    if pd.api.types.is_numeric_dtype(col_data.dtype) and not pd.api.types.is_bool_dtype(col_data.dtype):
+        # Converted once; the quartiles below are reused for the IQR, the
+        # range and the outlier bounds
+        values = col_data.to_numpy(dtype=np.float64, na_value=np.nan)
+        stats = _summarize_block(values[:, np.newaxis], [column]).get(column)
+        if stats is not None:
+            q1, q3 = stats['q25'], stats['q75']
+            iqr = q3 - q1
             result.update({
-                'mean': float(clean_data.mean()),
-                'median': float(clean_data.median()),
-                'std': float(clean_data.std()) if len(clean_data) > 1 else 0.0,
-                'min': float(clean_data.min()),
-                'max': float(clean_data.max()),
-                'range': float(clean_data.max() - clean_data.min()),
-                'q25': float(clean_data.quantile(0.25)),
-                'q50': float(clean_data.quantile(0.50)),
-                'q75': float(clean_data.quantile(0.75)),
-                'iqr': float(clean_data.quantile(0.75) - clean_data.quantile(0.25)),
-                'variance': float(clean_data.var()) if len(clean_data) > 1 else 0.0,
-                'skewness': float(clean_data.skew()) if len(clean_data) > 2 else 0.0,
-                'kurtosis': float(clean_data.kurtosis()) if len(clean_data) > 3 else 0.0
+                'mean': stats['mean'],
+                'median': stats['median'],
+                'std': stats['std'],
+                'min': stats['min'],
+                'max': stats['max'],
+                'range': stats['max'] - stats['min'],
+                'q25': q1,
+                'q50': stats['q50'],
+                'q75': q3,
+                'iqr': iqr,
+                'variance': stats['variance'],
+                'skewness': stats['skewness'],
+                'kurtosis': stats['kurtosis']
             })
             
             # Detect outliers using IQR method
-            q1 = clean_data.quantile(0.25)
-            q3 = clean_data.quantile(0.75)
-            iqr = q3 - q1
             lower_bound = q1 - 1.5 * iqr
             upper_bound = q3 + 1.5 * iqr
-            outliers = clean_data[(clean_data < lower_bound) | (clean_data > upper_bound)]
-            result['outlier_count'] = int(len(outliers))
+            result['outlier_count'] = int(
+                np.count_nonzero((values < lower_bound) | (values > upper_bound))
+            )
     else:
         # Categorical column statistics
-        value_counts = col_data.value_counts().head(20)
-        result['top_values'] = value_counts.to_dict()
-        result['most_common'] = str(value_counts.index[0]) if len(value_counts) > 0 else None
-        result['most_common_count'] = int(value_counts.iloc[0]) if len(value_counts) > 0 else 0
+        value_counts = _top_value_counts(col_data, 20)
+        most_common = next(iter(value_counts.items()), None)
+        result['top_values'] = value_counts
+        result['most_common'] = str(most_common[0]) if most_common else None
+        result['most_common_count'] = most_common[1] if most_common else 0
     
     return result
 
@@ -177,7 +370,8 @@ def column_statistics(
 def correlation_analysis(
     df: pd.DataFrame,
     method: str = 'pearson',
-    threshold: float = 0.0
+    threshold: float = 0.0,
+    correlations: Optional[pd.DataFrame] = None
 ) -> Dict[str, Any]:
     """
     Perform correlation analysis on numeric columns.
@@ -186,34 +380,46 @@ def correlation_analysis(
         df: Input DataFrame
         method: Correlation method ('pearson', 'spearman', 'kendall')
         threshold: Minimum absolute correlation to include
+        correlations: Precomputed correlation matrix to reuse, such as
+                      StatisticsResult.correlations (Pearson)
         
     Returns:
         Dictionary with correlation matrix and significant correlations
     """
-    numeric_df = df.select_dtypes(include=[np.number])
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     
-    if len(numeric_df.columns) < 2:
+    if len(numeric_cols) < 2:
         return {'error': 'Need at least 2 numeric columns for correlation'}
     
     # Calculate correlation matrix
-    corr_matrix = numeric_df.corr(method=method)
-    
-    # Find significant correlations
-    significant_correlations = []
-    for i, col1 in enumerate(corr_matrix.columns):
-        for j, col2 in enumerate(corr_matrix.columns):
-            if i < j:  # Only upper triangle, excluding diagonal
-                corr_value = corr_matrix.loc[col1, col2]
-                if abs(corr_value) >= threshold:
-                    significant_correlations.append({
-                        'column1': col1,
-                        'column2': col2,
-                        'correlation': round(corr_value, 4),
-                        'strength': _correlation_strength(corr_value)
-                    })
+    if correlations is not None:
+        corr_matrix = correlations
+    elif method == 'pearson':
+        corr_matrix = _pearson_correlations(df, _numeric_block(df, numeric_cols), numeric_cols)
+    else:
+        corr_matrix = df[numeric_cols].corr(method=method)
+    
+    # Find significant correlations in the upper triangle, excluding the diagonal
+    M = corr_matrix.to_numpy()
+    rows, cols = np.triu_indices_from(M, k=1)
+    values = M[rows, cols]
+    keep = np.abs(values) >= threshold
+    rows, cols, values = rows[keep], cols[keep], values[keep]
+    rounded = np.round(values, 4)
+    strengths = np.digitize(np.abs(values), _STRENGTH_BINS)
     
     # Sort by absolute correlation value
-    significant_correlations.sort(key=lambda x: abs(x['correlation']), reverse=True)
+    order = np.argsort(-np.abs(rounded), kind='stable')
+    names = corr_matrix.columns
+    significant_correlations = [
+        {
+            'column1': names[rows[k]],
+            'column2': names[cols[k]],
+            'correlation': float(rounded[k]),
+            'strength': _STRENGTH_LABELS[strengths[k]]
+        }
+        for k in order
+    ]
     
     return {
         'method': method,
@@ -223,6 +429,11 @@ def correlation_analysis(
     }
 
 
+# Lower edges of the correlation strength buckets, and their labels
+_STRENGTH_BINS = [0.2, 0.4, 0.6, 0.8]
+_STRENGTH_LABELS = ('very weak', 'weak', 'moderate', 'strong', 'very strong')
+
+
 def _correlation_strength(corr: float) -> str:
     """Classify correlation strength."""
     abs_corr = abs(corr)
@@ -238,6 +449,11 @@ def _correlation_strength(corr: float) -> str:
         return 'very weak'
 
 
+# Shapiro-Wilk sorts the sample and is only worth it for small samples; from
+# here on the O(N) D'Agostino-Pearson test is as powerful
+_SHAPIRO_MAX_ROWS = 50
+
+
 def distribution_analysis(
     df: pd.DataFrame,
     column: str,
@@ -257,23 +473,29 @@ def distribution_analysis(
     if column not in df.columns:
         raise ValueError(f"Column '{column}' not found")
     
-    col_data = df[column].dropna()
+    col_data = df[column]
     
-    if not np.issubdtype(col_data.dtype, np.number):
+    if not pd.api.types.is_numeric_dtype(col_data.dtype) or pd.api.types.is_bool_dtype(col_data.dtype):
         raise ValueError(f"Column '{column}' is not numeric")
     
-    # Calculate histogram
-    hist_values, bin_edges = np.histogram(col_data, bins=bins)
+    values = col_data.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    stats = _summarize_block(values[:, np.newaxis], [column]).get(column)
     
-    # Normality test (Shapiro-Wilk if sample is small, otherwise D'Agostino-Pearson)
+    # Calculate histogram; passing the range saves numpy its own min/max pass
+    value_range = (stats['min'], stats['max']) if stats is not None else None
+    hist_values, bin_edges = np.histogram(values, bins=bins, range=value_range)
+    
+    # Normality test (Shapiro-Wilk for small samples, otherwise the O(N)
+    # D'Agostino-Pearson test, which needs no sort)
     normality_test = None
-    if len(col_data) >= 8:  # Minimum sample size for tests
+    if len(values) >= 8:  # Minimum sample size for tests
         try:
-            if len(col_data) <= 5000:
-                stat, p_value = scipy_stats.shapiro(col_data)
+            if len(values) < _SHAPIRO_MAX_ROWS:
+                stat, p_value = scipy_stats.shapiro(values)
                 test_name = 'Shapiro-Wilk'
             else:
-                stat, p_value = scipy_stats.normaltest(col_data)
+                stat, p_value = scipy_stats.normaltest(values)
                 test_name = "D'Agostino-Pearson"
             
             normality_test = {
@@ -292,14 +514,28 @@ def distribution_analysis(
             'bin_edges': bin_edges.tolist()
         },
         'normality_test': normality_test,
-        'statistics': {
-            'mean': float(col_data.mean()),
-            'median': float(col_data.median()),
-            'mode': float(col_data.mode().iloc[0]) if len(col_data.mode()) > 0 else None,
-            'std': float(col_data.std()),
-            'skewness': float(col_data.skew()),
-            'kurtosis': float(col_data.kurtosis())
-        }
+        'statistics': _distribution_statistics(values, stats)
+    }
+
+
+def _distribution_statistics(
+    values: np.ndarray,
+    stats: Optional[Dict[str, float]]
+) -> Dict[str, Optional[float]]:
+    """The distribution_analysis statistics, taken from the column summary."""
+    if stats is None:
+        return {'mean': np.nan, 'median': np.nan, 'mode': None,
+                'std': np.nan, 'skewness': np.nan, 'kurtosis': np.nan}
+    
+    # The smallest of the most frequent values, as Series.mode().iloc[0]
+    uniques, counts = np.unique(values, return_counts=True)
+    return {
+        'mean': stats['mean'],
+        'median': stats['median'],
+        'mode': float(uniques[np.argmax(counts)]),
+        'std': stats['std'],
+        'skewness': stats['skewness'],
+        'kurtosis': stats['kurtosis']
     }
 
 
@@ -351,9 +587,16 @@ def data_profile(df: pd.DataFrame) -> Dict[str, Any]:
     Returns:
         Dictionary with comprehensive data profile
     """
+    n = len(df)
+    # Column-wide aggregates are computed once and reused per column
+    null_counts = df.isna().sum()
+    nunique = df.nunique()
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    numeric_summary = _numeric_summary(df, numeric_cols)
+    
     # Basic info
     profile = {
-        'row_count': len(df),
+        'row_count': n,
         'column_count': len(df.columns),
         'memory_usage_bytes': int(df.memory_usage(deep=True).sum()),
         'columns': {}
@@ -361,40 +604,195 @@ def data_profile(df: pd.DataFrame) -> Dict[str, Any]:
     
     # Profile each column
     for col in df.columns:
+        series = df[col]
+        null_count = int(null_counts[col])
+        unique_count = int(nunique[col])
         col_profile = {
-            'dtype': str(df[col].dtype),
-            'non_null_count': int(df[col].notna().sum()),
-            'null_count': int(df[col].isna().sum()),
-            'null_percentage': round(df[col].isna().mean() * 100, 2),
-            'unique_count': int(df[col].nunique()),
-            'unique_percentage': round(df[col].nunique() / len(df) * 100, 2) if len(df) > 0 else 0
+            'dtype': str(series.dtype),
+            'non_null_count': n - null_count,
+            'null_count': null_count,
+            'null_percentage': round(null_count / n * 100, 2) if n > 0 else 0,
+            'unique_count': unique_count,
+            'unique_percentage': round(unique_count / n * 100, 2) if n > 0 else 0
         }
         
-        if pd.api.types.is_numeric_dtype(df[col]):
-            col_data = df[col].dropna()
+        if pd.api.types.is_numeric_dtype(series):
+            col_data = series.dropna()
             if len(col_data) > 0:
-                col_profile['statistics'] = {
-                    'mean': round(float(col_data.mean()), 4),
-                    'std': round(float(col_data.std()), 4) if len(col_data) > 1 else 0,
-                    'min': float(col_data.min()),
-                    'max': float(col_data.max()),
-                    'q25': float(col_data.quantile(0.25)),
-                    'median': float(col_data.median()),
-                    'q75': float(col_data.quantile(0.75))
-                }
-                col_profile['has_negative'] = bool(col_data.min() < 0)
-                col_profile['has_zero'] = bool((col_data == 0).any())
+                col_profile.update(_profile_statistics(col_data, numeric_summary.get(col)))
         else:
             # Top values for categorical
-            top_values = df[col].value_counts().head(5)
+            top_values = _top_value_counts(series, 5)
             col_profile['top_values'] = {
-                str(k): int(v) for k, v in top_values.items()
+                str(k): v for k, v in top_values.items()
             }
         
         profile['columns'][col] = col_profile
     
     # Data quality score (simple heuristic)
-    null_ratio = df.isna().sum().sum() / (len(df) * len(df.columns)) if len(df) > 0 and len(df.columns) > 0 else 0
+    total_cells = n * len(df.columns)
+    null_ratio = null_counts.sum() / total_cells if total_cells > 0 else 0
     profile['data_quality_score'] = round((1 - null_ratio) * 100, 2)
     
     return profile
+
+
+def _profile_statistics(col_data: pd.Series, stats: Optional[Dict[str, float]]) -> Dict[str, Any]:
+    """
+    Profile entries for a non-empty numeric column.
+    
+    Numeric columns pass their _numeric_summary entry; booleans and other
+    numeric-like dtypes (stats=None) are summarized on their own.
+    """
+    count = len(col_data)
+    if stats is None:
+        # Booleans can't be interpolated, so quantiles are taken on floats
+        values = col_data.astype(np.float64)
+        stats = {
+            'mean': float(values.mean()),
+            'std': float(values.std()) if count > 1 else 0.0,
+            'min': float(values.min()),
+            'max': float(values.max()),
+        }
+        stats['q25'], stats['median'], stats['q75'] = (
+            float(q) for q in values.quantile([0.25, 0.5, 0.75])
+        )
+    
+    return {
+        'statistics': {
+            'mean': round(stats['mean'], 4),
+            'std': round(stats['std'], 4) if count > 1 else 0,
+            'min': stats['min'],
+            'max': stats['max'],
+            'q25': stats['q25'],
+            'median': stats['median'],
+            'q75': stats['q75']
+        },
+        'has_negative': stats['min'] < 0,
+        'has_zero': bool((col_data == 0).any())
+    }
+
+
+def optimize_dtypes(df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Downcast numeric columns to the smallest dtype that holds their values exactly.
+    
+    Integers are narrowed to the smallest fitting integer type, and floats
+    go to float32 only when every value round-trips unchanged, so results
+    computed from the narrowed frame are identical. Booleans and nullable
+    extension dtypes are left as they are.
+    
+    Args:
+        df: Input DataFrame
+        columns: Columns to consider (None for all numeric columns)
+    
+    Returns:
+        Shallow copy of df with the narrowed columns replaced (df itself
+        when nothing narrows)
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    
+    narrowed = {}
+    for col in columns:
+        values = df[col].to_numpy()
+        if values.dtype.kind in 'iu' and values.dtype.itemsize > 1:
+            small = pd.to_numeric(df[col], downcast='integer' if values.dtype.kind == 'i' else 'unsigned')
+            if small.dtype != values.dtype:
+                narrowed[col] = small
+        elif values.dtype == np.float64:
+            small = values.astype(np.float32)
+            with np.errstate(over='ignore', invalid='ignore'):
+                exact = (small == values) | (np.isnan(small) & np.isnan(values))
+            if exact.all():
+                narrowed[col] = small
+    
+    if not narrowed:
+        return df
+    # A shallow copy plus column assignment keeps the untouched columns
+    # shared even without copy-on-write, and accepts non-string labels
+    result = df.copy(deep=False)
+    for col, values in narrowed.items():
+        result[col] = values
+    return result
+
+
+def summary_and_profile(df: pd.DataFrame) -> Tuple[StatisticsResult, Dict[str, Any]]:
+    """
+    Compute basic_statistics() and data_profile() in one pass over the columns.
+    
+    Each column is scanned once and the shared aggregates (null counts,
+    min/max, quantiles, value counts) are reused for both results, instead
+    of every column being rescanned by two separate functions.
+    
+    Args:
+        df: Input DataFrame
+    
+    Returns:
+        Tuple of (StatisticsResult, profile dictionary)
+    """
+    n = len(df)
+    null_counts = df.isna().sum()
+    nunique = df.nunique()
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    numeric_set = set(numeric_cols)
+    categorical_cols = [col for col in df.columns if col not in numeric_set]
+    
+    X = _numeric_block(df, numeric_cols)
+    summary = _summarize_block(X, numeric_cols)
+    value_counts = {}
+    profile_columns = {}
+    
+    for col in df.columns:
+        series = df[col]
+        null_count = int(null_counts[col])
+        unique_count = int(nunique[col])
+        col_profile = {
+            'dtype': str(series.dtype),
+            'non_null_count': n - null_count,
+            'null_count': null_count,
+            'null_percentage': round(null_count / n * 100, 2) if n > 0 else 0,
+            'unique_count': unique_count,
+            'unique_percentage': round(unique_count / n * 100, 2) if n > 0 else 0
+        }
+        
+        is_numeric = pd.api.types.is_numeric_dtype(series)
+        if is_numeric:
+            col_data = series.dropna()
+            if len(col_data) > 0:
+                col_profile.update(_profile_statistics(col_data, summary.get(col)))
+        
+        if col not in numeric_set:
+            counts = _top_value_counts(series, 20)
+            value_counts[col] = counts
+            if not is_numeric:
+                col_profile['top_values'] = {
+                    str(k): v for k, v in islice(counts.items(), 5)
+                }
+        
+        profile_columns[col] = col_profile
+    
+    correlations = _pearson_correlations(df, X, numeric_cols)
+    missing_values = {k: int(v) for k, v in null_counts.items() if v > 0}
+    
+    stats_result = StatisticsResult(
+        count=n,
+        numeric_columns=numeric_cols,
+        categorical_columns=categorical_cols,
+        summary=summary,
+        correlations=correlations,
+        value_counts=value_counts,
+        missing_values=missing_values
+    )
+    
+    total_cells = n * len(df.columns)
+    null_ratio = null_counts.sum() / total_cells if total_cells > 0 else 0
+    profile = {
+        'row_count': n,
+        'column_count': len(df.columns),
+        'memory_usage_bytes': int(df.memory_usage(deep=True).sum()),
+        'columns': profile_columns,
+        'data_quality_score': round((1 - null_ratio) * 100, 2)
+    }
+    
+    return stats_result, profile
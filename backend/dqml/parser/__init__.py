@@ -15,18 +15,31 @@ Usage:
 
 from .dmql_parser import (
     parse_query,
-    DMQLQueryVisitor,
+    parse_query_template,
     DMQLQuery,
     Condition,
+    ConditionTable,
+    Display,
     MiningOperation,
     InterestMeasure
 )
 
 __all__ = [
     'parse_query',
+    'parse_query_template',
     'DMQLQueryVisitor',
     'DMQLQuery',
     'Condition',
+    'ConditionTable',
+    'Display',
     'MiningOperation',
     'InterestMeasure'
 ]
+
+
+def __getattr__(name):
+    # The visitor pulls in the generated parser, so it's loaded on demand
+    if name == 'DMQLQueryVisitor':
+        from .dmql_parser import DMQLQueryVisitor
+        return DMQLQueryVisitor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
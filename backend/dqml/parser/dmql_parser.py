@@ -16,24 +16,53 @@ Usage:
     
     result = parse_query(query)
     print(result.database)  # 'sales_data'
-    print(result.tables)    # ['customers']
+    print(result.tables)    # ('customers',)
 """
 
-from typing import Optional, List, Dict, Any, Union
+import dataclasses
+import re
+import sys
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
-from antlr4 import CommonTokenStream, InputStream
-from antlr4.error.ErrorListener import ErrorListener
+from enum import IntEnum
 
-from .DMQLLexer import DMQLLexer
-from .DMQLParser import DMQLParser
-from .DMQLVisitor import DMQLVisitor
+# The ANTLR runtime, the generated lexer/parser and the visitor are loaded
+# by _ensure_parser() on the first parse: deserializing the grammar's ATN
+# dominates import time, and the executor and API only need the AST
+# classes below until a query actually arrives
+DMQLLexer = DMQLParser = None
 
 
 # ============================================================================
 # DATA CLASSES FOR AST REPRESENTATION
 # ============================================================================
 
-@dataclass
+# Slotted nodes keep their fields in a fixed array instead of a per-instance
+# __dict__, which matters with hundreds of cached queries; dataclass only
+# supports slots from Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class Display(IntEnum):
+    """Integer codes for DISPLAY AS types; CUSTOM covers any other identifier."""
+    TABLE = 0
+    BAR_CHART = 1
+    LINE_CHART = 2
+    SCATTER_PLOT = 3
+    HEATMAP = 4
+    PIE_CHART = 5
+    HISTOGRAM = 6
+    BOX_PLOT = 7
+    CUSTOM = 8
+
+
+_DISPLAY_MAP = {member.name.lower(): member for member in Display if member is not Display.CUSTOM}
+
+
+@dataclass(**_SLOTS)
 class Condition:
     """Represents a WHERE clause condition."""
     left: str
@@ -43,14 +72,52 @@ class Condition:
     nested: Optional[List['Condition']] = None
 
 
-@dataclass 
+@dataclass(**_SLOTS)
+class ConditionTable:
+    """
+    A Condition tree flattened into parallel columns, one row per node.
+    
+    Rows are in pre-order, so a scan visits every group before its
+    children; groups (AND/OR) have an operator in ops and a child count
+    in arity, comparisons have arity 0. parents holds each row's parent
+    row, -1 for the root.
+    """
+    ops: List[str] = field(default_factory=list)
+    lefts: List[str] = field(default_factory=list)
+    rights: List[Any] = field(default_factory=list)
+    parents: List[int] = field(default_factory=list)
+    arity: List[int] = field(default_factory=list)
+    
+    @classmethod
+    def from_condition(cls, condition: Condition) -> 'ConditionTable':
+        """Flatten a Condition tree without recursion."""
+        table = cls()
+        stack = [(condition, -1)]
+        while stack:
+            node, parent = stack.pop()
+            row = len(table.ops)
+            children = node.nested or []
+            if children:
+                table.ops.append(node.logical_op or 'AND')
+            else:
+                table.ops.append(node.operator)
+            table.lefts.append(node.left)
+            table.rights.append(node.right)
+            table.parents.append(parent)
+            table.arity.append(len(children))
+            # Reversed, so the first child is the next row
+            stack.extend((child, row) for child in reversed(children))
+        return table
+
+
+@dataclass(**_SLOTS)
 class MiningOperation:
     """Represents a MINE clause operation."""
     operation_type: str  # CLUSTER, STATISTICS, ANOMALIES, etc.
     parameters: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class InterestMeasure:
     """Represents interest measures in WITH clause."""
     confidence: Optional[float] = None
@@ -60,294 +127,86 @@ class InterestMeasure:
     confidence_level: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class DMQLQuery:
-    """Complete parsed DMQL query representation."""
+    """
+    Complete parsed DMQL query representation.
+    
+    Queries are immutable, so the parse cache hands the same instance to
+    every caller; use replace() to get a modified copy. The nested
+    Condition and MiningOperation objects are shared as well and must be
+    treated as read-only.
+    """
     database: str
-    tables: List[str]
-    columns: List[str] = field(default_factory=list)
+    tables: Tuple[str, ...]
+    columns: Tuple[str, ...] = ()
     conditions: Optional[Condition] = None
-    group_by: List[str] = field(default_factory=list)
-    order_by: List[tuple] = field(default_factory=list)  # [(col, ASC/DESC), ...]
+    group_by: Tuple[str, ...] = ()
+    order_by: Tuple[Tuple[str, str], ...] = ()  # ((col, ASC/DESC), ...)
     mining_operation: Optional[MiningOperation] = None
     interest_measures: Optional[InterestMeasure] = None
     display_type: str = 'table'
     raw_query: str = ''
-    errors: List[str] = field(default_factory=list)
-
-
-# ============================================================================
-# ERROR LISTENER
-# ============================================================================
-
-class DMQLErrorListener(ErrorListener):
-    """Custom error listener to collect parsing errors."""
+    errors: Tuple[str, ...] = ()
     
-    def __init__(self):
-        super().__init__()
-        self.errors: List[str] = []
+    @property
+    def display(self) -> Display:
+        """The display type as a Display code."""
+        return _DISPLAY_MAP.get(self.display_type, Display.CUSTOM)
     
-    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
-        self.errors.append(f"Line {line}:{column} - {msg}")
+    def replace(self, **changes) -> 'DMQLQuery':
+        """Return a copy of the query with the given fields changed."""
+        return dataclasses.replace(self, **changes)
 
 
-# ============================================================================
-# AST VISITOR
-# ============================================================================
+# INT and FLOAT literals, as the lexer defines them
+_NUMBER_RE = re.compile(r'[0-9]+(\.[0-9]+)?')
 
-class DMQLQueryVisitor(DMQLVisitor):
-    """Visitor that builds a DMQLQuery from the parse tree."""
-    
-    def __init__(self):
-        self.query = DMQLQuery(database='', tables=[])
-    
-    def visitQuery(self, ctx: DMQLParser.QueryContext):
-        """Visit the root query node."""
-        # Visit all children
-        self.visitChildren(ctx)
-        return self.query
-    
-    def visitUseClause(self, ctx: DMQLParser.UseClauseContext):
-        """Extract database name from USE clause."""
-        if ctx and ctx.IDENTIFIER():
-            self.query.database = ctx.IDENTIFIER().getText()
-        return self.visitChildren(ctx)
-    
-    def visitRelevanceClause(self, ctx: DMQLParser.RelevanceClauseContext):
-        """Extract columns from RELEVANCE TO clause."""
-        attr_list = ctx.attributeList()
-        if attr_list:
-            self.query.columns = self._extractAttributeList(attr_list)
-        return self.visitChildren(ctx)
-    
-    def visitFromClause(self, ctx: DMQLParser.FromClauseContext):
-        """Extract table names from FROM clause."""
-        relation_list = ctx.relationList()
-        if relation_list:
-            for relation in relation_list.relation():
-                # Get the first identifier (table name)
-                identifiers = relation.IDENTIFIER()
-                if identifiers:
-                    self.query.tables.append(identifiers[0].getText())
-        return self.visitChildren(ctx)
-    
-    def visitWhereClause(self, ctx: DMQLParser.WhereClauseContext):
-        """Extract conditions from WHERE clause."""
-        condition_ctx = ctx.condition()
-        if condition_ctx:
-            self.query.conditions = self._extractCondition(condition_ctx)
-        return self.visitChildren(ctx)
-    
-    def visitGroupByClause(self, ctx: DMQLParser.GroupByClauseContext):
-        """Extract GROUP BY columns."""
-        attr_list = ctx.attributeList()
-        if attr_list:
-            self.query.group_by = self._extractAttributeList(attr_list)
-        return self.visitChildren(ctx)
-    
-    def visitOrderByClause(self, ctx: DMQLParser.OrderByClauseContext):
-        """Extract ORDER BY columns with direction."""
-        order_list = ctx.orderList()
-        if order_list:
-            for order_item in order_list.orderItem():
-                col = order_item.IDENTIFIER().getText()
-                direction = 'ASC'
-                if order_item.DESC():
-                    direction = 'DESC'
-                self.query.order_by.append((col, direction))
-        return self.visitChildren(ctx)
-    
-    def visitMineClause(self, ctx: DMQLParser.MineClauseContext):
-        """Extract mining operation from MINE clause."""
-        mining_op = ctx.miningOperation()
-        if mining_op:
-            self.query.mining_operation = self._extractMiningOperation(mining_op)
-        return self.visitChildren(ctx)
-    
-    def visitWithClause(self, ctx: DMQLParser.WithClauseContext):
-        """Extract interest measures from WITH clause."""
-        interest = ctx.interestMeasure()
-        if interest:
-            self.query.interest_measures = self._extractInterestMeasures(interest)
-        return self.visitChildren(ctx)
-    
-    def visitDisplayClause(self, ctx: DMQLParser.DisplayClauseContext):
-        """Extract display type from DISPLAY AS clause."""
-        display_type = ctx.displayType()
-        if display_type:
-            self.query.display_type = display_type.getText().lower()
-        return self.visitChildren(ctx)
-    
-    # ========================================================================
-    # HELPER METHODS
-    # ========================================================================
-    
-    def _extractAttributeList(self, ctx) -> List[str]:
-        """Extract list of attribute names."""
-        attributes = []
-        for attr in ctx.attribute():
-            identifiers = attr.IDENTIFIER()
-            if identifiers:
-                if len(identifiers) == 2:
-                    # table.column notation
-                    attributes.append(f"{identifiers[0].getText()}.{identifiers[1].getText()}")
-                else:
-                    attributes.append(identifiers[0].getText())
-            elif attr.STAR():
-                attributes.append('*')
-        return attributes
-    
-    def _extractCondition(self, ctx) -> Condition:
-        """Recursively extract conditions from condition context."""
-        # Get the text representation for simple parsing
-        text = ctx.getText()
-        
-        # Handle different condition types based on context type
-        if hasattr(ctx, 'comparisonCondition') and ctx.comparisonCondition():
-            comp = ctx.comparisonCondition()
-            return self._extractComparisonCondition(comp)
-        
-        # For AND/OR conditions
-        if ctx.AND():
-            conditions = ctx.condition()
-            if len(conditions) >= 2:
-                left = self._extractCondition(conditions[0])
-                right = self._extractCondition(conditions[1])
-                return Condition(
-                    left='',
-                    operator='AND',
-                    right=None,
-                    logical_op='AND',
-                    nested=[left, right]
-                )
-        
-        if ctx.OR():
-            conditions = ctx.condition()
-            if len(conditions) >= 2:
-                left = self._extractCondition(conditions[0])
-                right = self._extractCondition(conditions[1])
-                return Condition(
-                    left='',
-                    operator='OR', 
-                    right=None,
-                    logical_op='OR',
-                    nested=[left, right]
-                )
-        
-        # Handle parenthesized condition
-        if hasattr(ctx, 'LPAREN') and ctx.LPAREN():
-            inner_conditions = ctx.condition()
-            if inner_conditions:
-                if isinstance(inner_conditions, list):
-                    return self._extractCondition(inner_conditions[0])
-                return self._extractCondition(inner_conditions)
-        
-        # Handle comparison condition child
-        children = list(ctx.getChildren())
-        for child in children:
-            if hasattr(child, 'comparisonCondition'):
-                return self._extractComparisonCondition(child.comparisonCondition())
-            if isinstance(child, DMQLParser.ComparisonConditionContext):
-                return self._extractComparisonCondition(child)
-        
-        # Fallback: return raw text as condition
-        return Condition(left=text, operator='=', right=text)
-    
-    def _extractComparisonCondition(self, ctx) -> Condition:
-        """Extract a simple comparison condition."""
-        expressions = ctx.expression()
-        op_ctx = ctx.comparisonOperator()
-        
-        left = expressions[0].getText() if expressions else ''
-        operator = op_ctx.getText() if op_ctx else '='
-        right_val = expressions[1].getText() if len(expressions) > 1 else ''
-        
-        # Try to convert right value to appropriate type
-        right: Any = right_val
-        if right_val.isdigit():
-            right = int(right_val)
-        elif right_val.replace('.', '').isdigit():
-            right = float(right_val)
-        elif right_val.startswith("'") and right_val.endswith("'"):
-            right = right_val[1:-1]
-        elif right_val.startswith('"') and right_val.endswith('"'):
-            right = right_val[1:-1]
-        
-        return Condition(left=left, operator=operator, right=right)
-    
-    def _extractMiningOperation(self, ctx) -> MiningOperation:
-        """Extract mining operation details."""
-        # Check for cluster operation
-        if ctx.clusterOperation():
-            cluster = ctx.clusterOperation()
-            k_value = int(cluster.INT().getText())
-            return MiningOperation(
-                operation_type='CLUSTER',
-                parameters={'k': k_value}
-            )
-        
-        # Check for statistics
-        if ctx.statisticsOperation():
-            return MiningOperation(operation_type='STATISTICS')
-        
-        # Check for anomaly detection
-        if ctx.anomalyOperation():
-            return MiningOperation(operation_type='ANOMALIES')
-        
-        # Check for association rules
-        if ctx.associationRulesOperation():
-            return MiningOperation(operation_type='ASSOCIATION_RULES')
-        
-        # Check for classification
-        if ctx.classificationOperation():
-            classification = ctx.classificationOperation()
-            target = classification.IDENTIFIER().getText()
-            return MiningOperation(
-                operation_type='CLASSIFICATION',
-                parameters={'target': target}
-            )
-        
-        # Check for regression
-        if ctx.regressionOperation():
-            regression = ctx.regressionOperation()
-            target = regression.IDENTIFIER().getText()
-            return MiningOperation(
-                operation_type='REGRESSION',
-                parameters={'target': target}
-            )
-        
-        return MiningOperation(operation_type='UNKNOWN')
-    
-    def _extractInterestMeasures(self, ctx) -> InterestMeasure:
-        """Extract interest measures from WITH clause."""
-        measures = InterestMeasure()
-        
-        for item in ctx.measureItem():
-            text = item.getText().lower()
-            
-            # Extract the value
-            float_val = item.FLOAT()
-            int_val = item.INT()
-            value = float(float_val.getText()) if float_val else float(int_val.getText()) if int_val else 0.0
-            
-            if 'confidence_level' in text:
-                measures.confidence_level = value
-            elif 'confidence' in text:
-                measures.confidence = value
-            elif 'support' in text:
-                measures.support = value
-            elif 'lift' in text:
-                measures.lift = value
-            elif 'threshold' in text:
-                measures.threshold = value
-        
-        return measures
+
+def _literal_value(text: str) -> Any:
+    """Convert a condition operand's text to an int, float or unquoted string."""
+    quote = text[:1]
+    if quote == "'" or quote == '"':
+        if len(text) > 1 and text[-1] == quote:
+            return text[1:-1]
+        return text
+    number = _NUMBER_RE.fullmatch(text)
+    if number is not None:
+        return float(text) if number.group(1) else int(text)
+    return text
 
 
 # ============================================================================
 # PUBLIC API
 # ============================================================================
 
+# Parsed queries by query text, least recently used first. Dashboards and
+# repeated API calls send the same text again and again, and ANTLR parsing
+# is by far the most expensive step for those
+_PARSE_CACHE_SIZE = 512
+_parse_cache: 'OrderedDict[str, DMQLQuery]' = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+# Parsed queries by template: the text with every literal replaced by ?.
+# Queries that differ only in their literals (the same saved report or
+# dashboard panel with other filter values) reuse the cached parse and
+# only have their condition operands swapped. Each entry holds the query
+# and, per literal in text order, the path to its Condition and whether
+# it is a LIKE pattern
+_template_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+
+# String/number literals as the lexer sees them; comments are matched so
+# that their contents are skipped, and ? marks a template placeholder
+_LITERAL_RE = re.compile(
+    r"""'(?:[^'\r\n]|'')*'|"(?:[^"\r\n]|"")*"|--[^\r\n]*|/\*.*?\*/|\b\d+(?:\.\d+)?\b|\?""",
+    re.DOTALL
+)
+
+# One set of ANTLR objects per thread, reset for each query; a single
+# ANTLR parser instance is not thread-safe
+_thread_state = threading.local()
+
+
 def parse_query(query: str) -> DMQLQuery:
     """
     Parse a DMQL query string and return a DMQLQuery object.
@@ -368,35 +227,255 @@ def parse_query(query: str) -> DMQLQuery:
         >>> print(result.database)
         'sales_data'
     """
-    # Create input stream
-    input_stream = InputStream(query)
+    key = query.rstrip()
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            _parse_cache.move_to_end(key)
+    
+    if cached is None:
+        template, literals = _split_literals(key)
+        with _parse_cache_lock:
+            entry = _template_cache.get(template)
+            if entry is not None:
+                _template_cache.move_to_end(template)
+        
+        if entry is not None:
+            cached = _splice_literals(entry, literals, query)
+        if cached is None:
+            slots: List[tuple] = []
+            cached = _parse(query, slots)
+            entry = _template_entry(cached, slots, literals)
+        
+        with _parse_cache_lock:
+            _cache_put(_parse_cache, key, cached)
+            if entry is not None:
+                _cache_put(_template_cache, template, entry)
+    
+    # Queries are immutable, so the cached instance itself is returned;
+    # only text differing in trailing whitespace needs a shallow copy
+    if cached.raw_query != query:
+        return cached.replace(raw_query=query)
+    return cached
+
+
+def parse_query_template(template: str, values: List[Any]) -> DMQLQuery:
+    """
+    Parse a DMQL query with ? placeholders for its condition values.
     
-    # Create lexer
-    lexer = DMQLLexer(input_stream)
-    lexer.removeErrorListeners()
-    error_listener = DMQLErrorListener()
-    lexer.addErrorListener(error_listener)
+    Args:
+        template: DMQL query text with ? where a literal would go
+        values: Values for the placeholders, in order (str, int or float)
     
-    # Create token stream
-    stream = CommonTokenStream(lexer)
+    Returns:
+        DMQLQuery object for the query with the values filled in
     
-    # Create parser
-    parser = DMQLParser(stream)
-    parser.removeErrorListeners()
-    parser.addErrorListener(error_listener)
+    Example:
+        >>> result = parse_query_template(
+        ...     "USE DATABASE sales FROM customers WHERE city = ? AND age > ?",
+        ...     ['Mumbai', 30]
+        ... )
+        >>> result.conditions.nested[1].right
+        30
+    """
+    placeholders = [m for m in _LITERAL_RE.finditer(template) if m.group() == '?']
+    if len(placeholders) != len(values):
+        raise ValueError(f"Template has {len(placeholders)} placeholders, got {len(values)} values")
     
-    # Parse the query
-    tree = parser.query()
+    parts = []
+    pos = 0
+    for match, value in zip(placeholders, values):
+        parts.append(template[pos:match.start()])
+        parts.append(_format_literal(value))
+        pos = match.end()
+    parts.append(template[pos:])
+    return parse_query(''.join(parts))
+
+
+def _format_literal(value: Any) -> str:
+    """Format a placeholder value as a DMQL literal."""
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, (int, float)) and not isinstance(value, bool) \
+            and value >= 0 and value != float('inf'):
+        text = repr(value)
+        # DMQL has no exponent notation
+        return format(Decimal(text), 'f') if 'e' in text else text
+    raise ValueError(f"Can't write {value!r} as a DMQL literal")
+
+
+def _split_literals(text: str) -> tuple:
+    """Return the text with its literals replaced by ?, and the literals."""
+    literals = []
+    parts = []
+    pos = 0
+    for match in _LITERAL_RE.finditer(text):
+        literal = match.group()
+        if literal.startswith(('--', '/*')):
+            continue
+        parts.append(text[pos:match.start()])
+        parts.append('?')
+        literals.append((match.start(), literal))
+        pos = match.end()
+    parts.append(text[pos:])
+    return ''.join(parts), literals
+
+
+def _template_entry(query: DMQLQuery, slots: List[tuple], literals: List[tuple]) -> Optional[tuple]:
+    """
+    Build a template cache entry, or None if the query can't be reused.
+    
+    Every literal in the text must be a condition operand the visitor
+    recorded; literals anywhere else (CLUSTER k, WITH measures, inside
+    an expression) would not be substituted.
+    """
+    if query.errors or '?' in (literal for _, literal in literals):
+        return None
+    slots = sorted(slots)
+    if [offset for offset, _, _ in slots] != [offset for offset, _ in literals]:
+        return None
+    return query, tuple((path, like) for _, path, like in slots)
+
+
+def _splice_literals(entry: tuple, literals: List[tuple], raw_query: str) -> Optional[DMQLQuery]:
+    """Copy a template's query with new literals in its conditions."""
+    query, slots = entry
+    if len(slots) != len(literals):
+        return None
+    
+    changes: Dict[tuple, dict] = {}
+    for (path, like), (_, literal) in zip(slots, literals):
+        if like:
+            # LIKE takes a string only; anything else is a syntax error
+            # the full parse has to report
+            if literal[0] not in '\'"':
+                return None
+            pattern = literal[1:-1]
+            changes[path] = {'right': pattern}
+        else:
+            changes[path] = {'right': _literal_value(literal)}
+    
+    return query.replace(
+        conditions=_replace_conditions(query.conditions, changes, ()),
+        raw_query=raw_query
+    )
+
+
+def _replace_conditions(node: Condition, changes: Dict[tuple, dict], path: tuple) -> Condition:
+    """Rebuild a condition tree with the given fields changed per path."""
+    if path in changes:
+        return dataclasses.replace(node, **changes[path])
+    if not node.nested:
+        return node
+    return dataclasses.replace(node, nested=[
+        _replace_conditions(child, changes, path + (i,))
+        for i, child in enumerate(node.nested)
+    ])
+
+
+def _cache_put(cache: OrderedDict, key: str, value: Any) -> None:
+    """Insert into an LRU cache, evicting the oldest entry past the limit."""
+    cache[key] = value
+    if len(cache) > _PARSE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _ensure_parser() -> None:
+    """Import the ANTLR runtime, generated parser and visitor once."""
+    global DMQLLexer, DMQLParser, DMQLQueryVisitor, DMQLErrorListener
+    global CommonTokenStream, InputStream, PredictionMode
+    global BailErrorStrategy, DefaultErrorStrategy
+    global ParseCancellationException, RecognitionException
+    if DMQLParser is not None:
+        return
+    
+    from antlr4 import CommonTokenStream, InputStream
+    from antlr4.atn.PredictionMode import PredictionMode
+    from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+    from antlr4.error.Errors import ParseCancellationException, RecognitionException
+    from .DMQLLexer import DMQLLexer as lexer_cls
+    from .DMQLParser import DMQLParser as parser_cls
+    from .dmql_visitor import DMQLQueryVisitor, DMQLErrorListener
+    # DMQLParser is the loaded flag, so it's assigned last
+    DMQLLexer = lexer_cls
+    DMQLParser = parser_cls
+
+
+def __getattr__(name: str) -> Any:
+    """Load the parser on first access to the names that need it."""
+    if name in ('DMQLQueryVisitor', 'DMQLErrorListener'):
+        _ensure_parser()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _parse(query: str, literals: Optional[List[tuple]] = None) -> DMQLQuery:
+    """
+    Run the ANTLR lexer, parser and visitor on a query string.
+    
+    If a literals list is given, the visitor's literal operands are added
+    to it as (char offset, condition path, LIKE pattern?).
+    """
+    state = _thread_parser()
+    lexer, stream, parser = state.lexer, state.stream, state.parser
+    state.listener.reset()
+    state.visitor.reset()
+    
+    # Point the lexer at the query; the setter resets its state
+    lexer.inputStream = InputStream(query)
+    
+    # Empty the token stream and hand it back to the parser, which resets
+    # the parser as well
+    stream.setTokenSource(lexer)
+    parser.setTokenStream(stream)
+    
+    # Parse the query in two stages: SLL prediction skips full-context
+    # lookahead and is enough for any valid DMQL query, bailing out on the
+    # first error. Only then is it re-parsed in full LL mode with error
+    # recovery, which also reports the syntax errors
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    try:
+        tree = parser.query()
+    except (RecognitionException, ParseCancellationException):
+        stream.seek(0)
+        parser.setTokenStream(stream)
+        parser._interp.predictionMode = PredictionMode.LL
+        parser._errHandler = DefaultErrorStrategy()
+        tree = parser.query()
     
     # Visit the parse tree to build AST
-    visitor = DMQLQueryVisitor()
-    result = visitor.visit(tree)
+    result = state.visitor.visit(tree)
+    if literals is not None:
+        literals.extend(state.visitor.literals)
     
     # Store raw query and any errors
-    result.raw_query = query
-    result.errors = error_listener.errors
+    return result.replace(raw_query=query, errors=tuple(state.listener.errors))
+
+
+class _ParserState:
+    """A thread's reusable lexer, token stream, parser, error listener and visitor."""
+    
+    __slots__ = ('lexer', 'stream', 'parser', 'listener', 'visitor')
     
-    return result
+    def __init__(self):
+        self.lexer = DMQLLexer(InputStream(''))
+        self.stream = CommonTokenStream(self.lexer)
+        self.parser = DMQLParser(self.stream)
+        self.listener = DMQLErrorListener()
+        self.visitor = DMQLQueryVisitor()
+        for recognizer in (self.lexer, self.parser):
+            recognizer.removeErrorListeners()
+            recognizer.addErrorListener(self.listener)
+
+
+def _thread_parser() -> _ParserState:
+    """This thread's parser state, created on first use."""
+    _ensure_parser()
+    state = getattr(_thread_state, 'state', None)
+    if state is None:
+        state = _thread_state.state = _ParserState()
+    return state
 
 
 def validate_query(query: str) -> tuple[bool, List[str]]:
@@ -411,4 +490,4 @@ def validate_query(query: str) -> tuple[bool, List[str]]:
     """
     result = parse_query(query)
     is_valid = len(result.errors) == 0
-    return is_valid, result.errors
+    return is_valid, list(result.errors)
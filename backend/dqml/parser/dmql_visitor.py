@@ -0,0 +1,410 @@
+"""
+DMQL Query Visitor - Builds DMQLQuery objects from ANTLR parse trees.
+
+This module holds everything that needs the generated lexer/parser: the
+error listener and the visitor. Loading it deserializes the grammar's
+ATN, so dmql_parser only imports it on the first parse.
+
+Usage:
+    from backend.dqml.parser.dmql_visitor import DMQLQueryVisitor
+    
+    query = DMQLQueryVisitor().visit(DMQLParser(stream).query())
+"""
+
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.tree.Tree import ErrorNode, TerminalNode
+
+from .DMQLParser import DMQLParser
+from .DMQLVisitor import DMQLVisitor
+from .dmql_parser import (
+    Condition,
+    DMQLQuery,
+    InterestMeasure,
+    MiningOperation,
+    _literal_value,
+)
+
+
+# ============================================================================
+# ERROR LISTENER
+# ============================================================================
+
+class DMQLErrorListener(ErrorListener):
+    """
+    Custom error listener to collect parsing errors.
+    
+    ANTLR calls syntaxError for every error it recovers from, so the
+    callback only records the position and message; they are formatted
+    when errors is read.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._errors: List[tuple] = []
+    
+    def reset(self) -> None:
+        """Forget the collected errors, so the listener can be reused."""
+        self._errors.clear()
+    
+    @property
+    def errors(self) -> List[str]:
+        """The collected errors as 'Line <line>:<column> - <message>'."""
+        return [f"Line {line}:{column} - {msg}" for line, column, msg in self._errors]
+    
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self._errors.append((line, column, msg))
+
+
+# ============================================================================
+# AST VISITOR
+# ============================================================================
+
+class DMQLQueryVisitor(DMQLVisitor):
+    """
+    Visitor that builds a DMQLQuery from the parse tree.
+    
+    The tree is walked in a single pass: the clause visitors pull what
+    they need out of their subtree with the _extract helpers and don't
+    descend into it, so only the query node and its clauses go through
+    visit(). A subclass that overrides a rule below the clause level has
+    to call visitChildren from the clause visitor itself.
+    
+    Dispatch is cached: instead of ANTLR's accept(), which looks the
+    visit method up by name on every call, each node class is resolved
+    once to a function and kept in a per-class table. Subclasses get
+    their own table, so overridden visit methods are never shadowed by a
+    parent's entries.
+    """
+    
+    _dispatch: Dict[type, Callable] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear the collected parts, so the visitor can be reused."""
+        # DMQLQuery is frozen, so clauses collect their parts here and
+        # visitQuery builds the query once the whole tree is visited
+        self.parts: Dict[str, Any] = {'database': '', 'tables': [], 'order_by': []}
+        # Literal condition operands as (char offset, path, LIKE pattern?),
+        # where path is the nested index of the Condition from the root
+        self.literals: List[Tuple[int, Tuple[int, ...], bool]] = []
+    
+    def visit(self, tree):
+        """Visit a node through the cached dispatch table."""
+        method = self._dispatch.get(tree.__class__)
+        if method is None:
+            method = self._dispatch[tree.__class__] = self._resolve(tree.__class__)
+        return method(self, tree)
+    
+    def visitChildren(self, node):
+        """
+        Visit each child and return the last child's result.
+        
+        Same as ParseTreeVisitor.visitChildren with its default
+        defaultResult/aggregateResult/shouldVisitNextChild, but children
+        go through the dispatch table instead of accept().
+        """
+        result = None
+        for child in node.children or ():
+            result = self.visit(child)
+        return result
+    
+    @classmethod
+    def _resolve(cls, node_class: type) -> Callable:
+        """Find the function accept() would call for nodes of this class."""
+        if issubclass(node_class, ErrorNode):
+            return cls.visitErrorNode
+        if issubclass(node_class, TerminalNode):
+            return cls.visitTerminal
+        # Rule contexts are named <Rule>Context and visited by visit<Rule>
+        name = node_class.__name__
+        if name.endswith('Context'):
+            name = name[:-len('Context')]
+        method = getattr(cls, 'visit' + name, None)
+        # The generated DMQLVisitor methods only call visitChildren; go
+        # straight there for every rule this class doesn't override
+        if method is None or method is getattr(DMQLVisitor, 'visit' + name, None):
+            return cls.visitChildren
+        return method
+    
+    def visitQuery(self, ctx: DMQLParser.QueryContext):
+        """Visit the root query node."""
+        # Visit all children
+        self.visitChildren(ctx)
+        parts = self.parts
+        return DMQLQuery(
+            database=parts['database'],
+            tables=tuple(parts['tables']),
+            columns=tuple(parts.get('columns', ())),
+            conditions=parts.get('conditions'),
+            group_by=tuple(parts.get('group_by', ())),
+            order_by=tuple(parts['order_by']),
+            mining_operation=parts.get('mining_operation'),
+            interest_measures=parts.get('interest_measures'),
+            display_type=parts.get('display_type', 'table')
+        )
+    
+    def visitUseClause(self, ctx: DMQLParser.UseClauseContext):
+        """Extract database name from USE clause."""
+        if ctx and ctx.IDENTIFIER():
+            self.parts['database'] = _text(ctx.IDENTIFIER())
+    
+    def visitRelevanceClause(self, ctx: DMQLParser.RelevanceClauseContext):
+        """Extract columns from RELEVANCE TO clause."""
+        attr_list = ctx.attributeList()
+        if attr_list:
+            self.parts['columns'] = self._extractAttributeList(attr_list)
+    
+    def visitFromClause(self, ctx: DMQLParser.FromClauseContext):
+        """Extract table names from FROM clause."""
+        relation_list = ctx.relationList()
+        if relation_list:
+            for relation in relation_list.relation():
+                # Get the first identifier (table name)
+                identifiers = relation.IDENTIFIER()
+                if identifiers:
+                    self.parts['tables'].append(_text(identifiers[0]))
+    
+    def visitWhereClause(self, ctx: DMQLParser.WhereClauseContext):
+        """Extract conditions from WHERE clause."""
+        condition_ctx = ctx.condition()
+        if condition_ctx:
+            self.parts['conditions'] = self._extractCondition(condition_ctx)
+    
+    def visitGroupByClause(self, ctx: DMQLParser.GroupByClauseContext):
+        """Extract GROUP BY columns."""
+        attr_list = ctx.attributeList()
+        if attr_list:
+            self.parts['group_by'] = self._extractAttributeList(attr_list)
+    
+    def visitOrderByClause(self, ctx: DMQLParser.OrderByClauseContext):
+        """Extract ORDER BY columns with direction."""
+        order_list = ctx.orderList()
+        if order_list:
+            for order_item in order_list.orderItem():
+                col = _text(order_item.IDENTIFIER())
+                direction = 'ASC'
+                if order_item.DESC():
+                    direction = 'DESC'
+                self.parts['order_by'].append((col, direction))
+    
+    def visitMineClause(self, ctx: DMQLParser.MineClauseContext):
+        """Extract mining operation from MINE clause."""
+        mining_op = ctx.miningOperation()
+        if mining_op:
+            self.parts['mining_operation'] = self._extractMiningOperation(mining_op)
+    
+    def visitWithClause(self, ctx: DMQLParser.WithClauseContext):
+        """Extract interest measures from WITH clause."""
+        interest = ctx.interestMeasure()
+        if interest:
+            self.parts['interest_measures'] = self._extractInterestMeasures(interest)
+    
+    def visitDisplayClause(self, ctx: DMQLParser.DisplayClauseContext):
+        """Extract display type from DISPLAY AS clause."""
+        display_type = ctx.displayType()
+        if display_type:
+            self.parts['display_type'] = sys.intern(display_type.getText().lower())
+    
+    # ========================================================================
+    # HELPER METHODS
+    # ========================================================================
+    
+    def _extractAttributeList(self, ctx) -> List[str]:
+        """Extract list of attribute names."""
+        attributes = []
+        for attr in ctx.attribute():
+            identifiers = attr.IDENTIFIER()
+            if identifiers:
+                if len(identifiers) == 2:
+                    # table.column notation
+                    attributes.append(sys.intern(f"{identifiers[0].getText()}.{identifiers[1].getText()}"))
+                else:
+                    attributes.append(_text(identifiers[0]))
+            elif attr.STAR():
+                attributes.append('*')
+        return attributes
+    
+    def _extractCondition(self, ctx, path: Tuple[int, ...] = ()) -> Condition:
+        """
+        Recursively extract conditions from condition context.
+        
+        Each labeled alternative of the condition rule has its own context
+        class, so the extractor is found with one lookup on the exact class
+        rather than probing the context with hasattr/isinstance checks.
+        path is the condition's position in the tree, recorded with each
+        literal operand so the query can be reused as a template.
+        """
+        extract = self._CONDITION_EXTRACTORS.get(ctx.__class__)
+        if extract is not None:
+            return extract(self, ctx, path)
+        
+        # NOT, IN, BETWEEN and IS NULL aren't modelled yet: keep the raw text
+        text = ctx.getText()
+        return Condition(left=text, operator='=', right=text)
+    
+    def _extractLogicalCondition(self, ctx, path: Tuple[int, ...], logical_op: str) -> Condition:
+        """Extract an AND/OR condition with its two operands nested."""
+        left, right = ctx.condition()
+        return Condition(
+            left='',
+            operator=logical_op,
+            right=None,
+            logical_op=logical_op,
+            nested=[self._extractCondition(left, path + (0,)),
+                    self._extractCondition(right, path + (1,))]
+        )
+    
+    def _extractLikeCondition(self, ctx, path: Tuple[int, ...]) -> Condition:
+        """Extract a [NOT] LIKE condition."""
+        string = ctx.STRING()
+        if string is None:
+            # Error recovery can leave the pattern out
+            text = ctx.getText()
+            return Condition(left=text, operator='=', right=text)
+        token = string.symbol
+        self.literals.append((token.start, path, True))
+        pattern = token.text[1:-1]
+        return Condition(
+            left=_text(ctx.IDENTIFIER()),
+            operator='NOT LIKE' if ctx.NOT() else 'LIKE',
+            right=pattern
+        )
+    
+    def _extractComparisonCondition(self, ctx, path: Tuple[int, ...]) -> Condition:
+        """Extract a simple comparison condition."""
+        expressions = ctx.expression()
+        op_ctx = ctx.comparisonOperator()
+        
+        left = sys.intern(_rule_text(expressions[0])) if expressions else ''
+        operator = sys.intern(_rule_text(op_ctx)) if op_ctx else '='
+        right_val = _rule_text(expressions[1]) if len(expressions) > 1 else ''
+        
+        # A single INT/FLOAT/STRING token is a literal that a template can
+        # substitute
+        if len(expressions) > 1 and isinstance(expressions[1], DMQLParser.ValueExprContext):
+            token = expressions[1].start
+            if token.type in _LITERAL_TOKENS:
+                self.literals.append((token.start, path, False))
+        
+        return Condition(left=left, operator=operator, right=_literal_value(right_val))
+    
+    # Condition alternative context class -> extractor
+    _CONDITION_EXTRACTORS: Dict[type, Callable] = {
+        DMQLParser.AndConditionContext:
+            lambda self, ctx, path: self._extractLogicalCondition(ctx, path, 'AND'),
+        DMQLParser.OrConditionContext:
+            lambda self, ctx, path: self._extractLogicalCondition(ctx, path, 'OR'),
+        DMQLParser.ParenConditionContext:
+            lambda self, ctx, path: self._extractCondition(ctx.condition(), path),
+        DMQLParser.CompareConditionContext:
+            lambda self, ctx, path: self._extractComparisonCondition(ctx.comparisonCondition(), path),
+        DMQLParser.LikeCondContext:
+            lambda self, ctx, path: self._extractLikeCondition(ctx.likeCondition(), path),
+    }
+    
+    def _extractMiningOperation(self, ctx) -> MiningOperation:
+        """Extract mining operation details."""
+        # Check for cluster operation
+        if ctx.clusterOperation():
+            cluster = ctx.clusterOperation()
+            k_value = int(cluster.INT().getText())
+            return MiningOperation(
+                operation_type='CLUSTER',
+                parameters={'k': k_value}
+            )
+        
+        # Check for statistics
+        if ctx.statisticsOperation():
+            return MiningOperation(operation_type='STATISTICS')
+        
+        # Check for anomaly detection
+        if ctx.anomalyOperation():
+            return MiningOperation(operation_type='ANOMALIES')
+        
+        # Check for association rules
+        if ctx.associationRulesOperation():
+            return MiningOperation(operation_type='ASSOCIATION_RULES')
+        
+        # Check for classification
+        if ctx.classificationOperation():
+            classification = ctx.classificationOperation()
+            target = _text(classification.IDENTIFIER())
+            return MiningOperation(
+                operation_type='CLASSIFICATION',
+                parameters={'target': target}
+            )
+        
+        # Check for regression
+        if ctx.regressionOperation():
+            regression = ctx.regressionOperation()
+            target = _text(regression.IDENTIFIER())
+            return MiningOperation(
+                operation_type='REGRESSION',
+                parameters={'target': target}
+            )
+        
+        return MiningOperation(operation_type='UNKNOWN')
+    
+    def _extractInterestMeasures(self, ctx) -> InterestMeasure:
+        """Extract interest measures from WITH clause."""
+        measures = InterestMeasure()
+        
+        for item in ctx.measureItem():
+            # Every alternative starts with the measure's keyword token
+            name = _MEASURE_FIELDS.get(item.start.type)
+            if name is None:
+                continue
+            
+            # Extract the value
+            float_val = item.FLOAT()
+            int_val = item.INT()
+            value = float(float_val.getText()) if float_val else float(int_val.getText()) if int_val else 0.0
+            setattr(measures, name, value)
+        
+        return measures
+
+
+# measureItem keyword token -> InterestMeasure field
+_MEASURE_FIELDS = {
+    DMQLParser.CONFIDENCE: 'confidence',
+    DMQLParser.SUPPORT: 'support',
+    DMQLParser.LIFT: 'lift',
+    DMQLParser.THRESHOLD: 'threshold',
+    DMQLParser.CONFIDENCE_LEVEL: 'confidence_level',
+}
+
+
+def _text(node) -> str:
+    """
+    Return a parse-tree node's text as an interned string.
+    
+    Identifiers and operators repeat across conditions and cached queries,
+    so interning keeps one copy of each and lets equality checks short-cut
+    on identity.
+    """
+    return sys.intern(node.getText())
+
+
+def _rule_text(ctx) -> str:
+    """
+    Return a rule context's text, same as ctx.getText().
+    
+    getText() rebuilds the text by walking the whole subtree, but almost
+    every condition operand and operator is a single token, whose text
+    can be read directly.
+    """
+    start = ctx.start
+    if start is ctx.stop and start is not None:
+        return start.text
+    return ctx.getText()
+
+
+_LITERAL_TOKENS = frozenset((DMQLParser.INT, DMQLParser.FLOAT, DMQLParser.STRING))
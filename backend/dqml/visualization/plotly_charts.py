@@ -14,8 +14,10 @@ Usage:
 import pandas as pd
 import numpy as np
 from typing import Dict, Any, List, Optional, Union
+from functools import cached_property
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import json
 
@@ -41,6 +43,16 @@ class ChartResult:
         """Convert figure to dictionary."""
         return json.loads(self.figure.to_json())
     
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Figure as a dictionary, built once and cached.
+        
+        The cached dict is shared, so callers must not modify it (or the
+        figure after first access); use to_dict() for a private copy.
+        """
+        return self.to_dict()
+    
     def to_html(self, full_html: bool = False) -> str:
         """Convert figure to HTML string."""
         return self.figure.to_html(full_html=full_html)
@@ -50,6 +62,45 @@ class ChartResult:
         self.figure.show()
 
 
+class _ColumnKinds:
+    """
+    Numeric and non-numeric column names of a DataFrame.
+    
+    Each list is computed on first access and then reused, so a chart
+    that auto-detects several columns runs select_dtypes at most once per
+    kind, and one that is given all its columns never runs it.
+    """
+    
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+    
+    @cached_property
+    def numeric(self) -> List[str]:
+        return self._df.select_dtypes(include=[np.number]).columns.tolist()
+    
+    @cached_property
+    def categorical(self) -> List[str]:
+        return self._df.select_dtypes(exclude=[np.number]).columns.tolist()
+
+
+def _downcast_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df with float64 columns cast to float32 where no value changes.
+    
+    A column is only narrowed when every value round-trips through float32
+    exactly (whole numbers below 2**24, halves, quarters, ...), so hover
+    labels and axis ranges show the same numbers either way. df itself is
+    returned when no column qualifies.
+    """
+    float_cols = {}
+    for name, col in df.items():
+        if col.dtype == np.float64:
+            values = col.to_numpy()
+            if np.array_equal(values.astype(np.float32), values, equal_nan=True):
+                float_cols[name] = np.float32
+    return df.astype(float_cols) if float_cols else df
+
+
 def generate_chart(
     df: pd.DataFrame,
     chart_type: str,
@@ -78,31 +129,22 @@ def generate_chart(
     # Normalize chart type
     chart_type = chart_type.lower().replace('-', '_')
     
-    # Map to generation function
-    chart_functions = {
-        'bar_chart': _generate_bar_chart,
-        'bar': _generate_bar_chart,
-        'scatter_plot': _generate_scatter_plot,
-        'scatter': _generate_scatter_plot,
-        'line_chart': _generate_line_chart,
-        'line': _generate_line_chart,
-        'heatmap': _generate_heatmap,
-        'histogram': _generate_histogram,
-        'box_plot': _generate_box_plot,
-        'box': _generate_box_plot,
-        'pie_chart': _generate_pie_chart,
-        'pie': _generate_pie_chart,
-        'table': _generate_table,
-    }
-    
-    if chart_type not in chart_functions:
+    if chart_type not in _CHART_FUNCTIONS:
         # Default to table if chart type not recognized
         chart_type = 'table'
     
+    # float32 arrays serialize to half the size; only columns that lose
+    # nothing are narrowed, and tables are left alone
+    if chart_type != 'table':
+        df = _downcast_floats(df)
+    
     # Generate the chart
-    fig = chart_functions[chart_type](
+    # Column types are detected at most once, however many columns the
+    # generator has to pick; auto_visualize passes in the ones it used
+    column_kinds = kwargs.pop('column_kinds', None) or _ColumnKinds(df)
+    fig = _CHART_FUNCTIONS[chart_type](
         df, x_col=x_col, y_col=y_col, color_col=color_col, 
-        title=title, **kwargs
+        title=title, column_kinds=column_kinds, **kwargs
     )
     
     # Apply common styling
@@ -118,18 +160,20 @@ def _generate_bar_chart(
     color_col: Optional[str] = None,
     title: Optional[str] = None,
     orientation: str = 'v',
+    column_kinds: Optional[_ColumnKinds] = None,
     **kwargs
 ) -> go.Figure:
     """Generate a bar chart."""
+    column_kinds = column_kinds or _ColumnKinds(df)
     # Auto-detect columns if not specified
     if x_col is None:
         # Use first categorical column for x
-        cat_cols = df.select_dtypes(exclude=[np.number]).columns
+        cat_cols = column_kinds.categorical
         x_col = cat_cols[0] if len(cat_cols) > 0 else df.columns[0]
     
     if y_col is None:
         # Use first numeric column for y
-        num_cols = df.select_dtypes(include=[np.number]).columns
+        num_cols = column_kinds.numeric
         y_col = num_cols[0] if len(num_cols) > 0 else df.columns[1] if len(df.columns) > 1 else df.columns[0]
     
     fig = px.bar(
@@ -148,11 +192,13 @@ def _generate_scatter_plot(
     color_col: Optional[str] = None,
     title: Optional[str] = None,
     size_col: Optional[str] = None,
+    column_kinds: Optional[_ColumnKinds] = None,
     **kwargs
 ) -> go.Figure:
     """Generate a scatter plot."""
+    column_kinds = column_kinds or _ColumnKinds(df)
     # Auto-detect numeric columns
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    num_cols = column_kinds.numeric
     
     if x_col is None and len(num_cols) >= 1:
         x_col = num_cols[0]
@@ -181,9 +227,11 @@ def _generate_line_chart(
     y_col: Optional[str] = None,
     color_col: Optional[str] = None,
     title: Optional[str] = None,
+    column_kinds: Optional[_ColumnKinds] = None,
     **kwargs
 ) -> go.Figure:
     """Generate a line chart."""
+    column_kinds = column_kinds or _ColumnKinds(df)
     # Auto-detect columns
     if x_col is None:
         # Try to find a date/time column or index
@@ -194,7 +242,7 @@ def _generate_line_chart(
             x_col = df.columns[0]
     
     if y_col is None:
-        num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        num_cols = column_kinds.numeric
         y_col = num_cols[0] if num_cols else df.columns[1] if len(df.columns) > 1 else df.columns[0]
     
     fig = px.line(
@@ -211,11 +259,13 @@ def _generate_heatmap(
     y_col: Optional[str] = None,
     color_col: Optional[str] = None,
     title: Optional[str] = None,
+    column_kinds: Optional[_ColumnKinds] = None,
     **kwargs
 ) -> go.Figure:
     """Generate a heatmap."""
+    column_kinds = column_kinds or _ColumnKinds(df)
     # If correlation matrix needed
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    num_cols = column_kinds.numeric
     
     if x_col is None and y_col is None:
         # Generate correlation matrix heatmap
@@ -245,11 +295,13 @@ def _generate_histogram(
     color_col: Optional[str] = None,
     title: Optional[str] = None,
     nbins: int = 30,
+    column_kinds: Optional[_ColumnKinds] = None,
     **kwargs
 ) -> go.Figure:
     """Generate a histogram."""
+    column_kinds = column_kinds or _ColumnKinds(df)
     if x_col is None:
-        num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        num_cols = column_kinds.numeric
         x_col = num_cols[0] if num_cols else df.columns[0]
     
     fig = px.histogram(
@@ -267,15 +319,17 @@ def _generate_box_plot(
     y_col: Optional[str] = None,
     color_col: Optional[str] = None,
     title: Optional[str] = None,
+    column_kinds: Optional[_ColumnKinds] = None,
     **kwargs
 ) -> go.Figure:
     """Generate a box plot."""
+    column_kinds = column_kinds or _ColumnKinds(df)
     if y_col is None:
-        num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        num_cols = column_kinds.numeric
         y_col = num_cols[0] if num_cols else df.columns[0]
     
     if x_col is None:
-        cat_cols = df.select_dtypes(exclude=[np.number]).columns.tolist()
+        cat_cols = column_kinds.categorical
         x_col = cat_cols[0] if cat_cols else None
     
     fig = px.box(
@@ -292,16 +346,18 @@ def _generate_pie_chart(
     y_col: Optional[str] = None,
     color_col: Optional[str] = None,
     title: Optional[str] = None,
+    column_kinds: Optional[_ColumnKinds] = None,
     **kwargs
 ) -> go.Figure:
     """Generate a pie chart."""
+    column_kinds = column_kinds or _ColumnKinds(df)
     # x_col is names, y_col is values
     if x_col is None:
-        cat_cols = df.select_dtypes(exclude=[np.number]).columns.tolist()
+        cat_cols = column_kinds.categorical
         x_col = cat_cols[0] if cat_cols else df.columns[0]
     
     if y_col is None:
-        num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+        num_cols = column_kinds.numeric
         y_col = num_cols[0] if num_cols else 'count'
     
     # Aggregate if needed
@@ -327,11 +383,15 @@ def _generate_table(
     color_col: Optional[str] = None,
     title: Optional[str] = None,
     max_rows: int = 100,
+    column_kinds: Optional[_ColumnKinds] = None,
     **kwargs
 ) -> go.Figure:
     """Generate a table visualization."""
     # Limit rows for display
     display_df = df.head(max_rows)
+    # Plain lists, one per column, serialize without going back through
+    # pandas; items() keeps duplicate column names apart
+    cell_values = [col.tolist() for _, col in display_df.items()]
     
     fig = go.Figure(data=[go.Table(
         header=dict(
@@ -341,7 +401,7 @@ def _generate_table(
             font=dict(size=12)
         ),
         cells=dict(
-            values=[display_df[col] for col in display_df.columns],
+            values=cell_values,
             fill_color='lavender',
             align='left',
             font=dict(size=11)
@@ -356,13 +416,36 @@ def _generate_table(
     return fig
 
 
+# Chart type (as normalized by generate_chart) -> generation function
+_CHART_FUNCTIONS = {
+    'bar_chart': _generate_bar_chart,
+    'bar': _generate_bar_chart,
+    'scatter_plot': _generate_scatter_plot,
+    'scatter': _generate_scatter_plot,
+    'line_chart': _generate_line_chart,
+    'line': _generate_line_chart,
+    'heatmap': _generate_heatmap,
+    'histogram': _generate_histogram,
+    'box_plot': _generate_box_plot,
+    'box': _generate_box_plot,
+    'pie_chart': _generate_pie_chart,
+    'pie': _generate_pie_chart,
+    'table': _generate_table,
+}
+
+
+# plotly_white with the DMQL font and legend, merged once and registered
+# by name; a copy, so plotly_white itself is left alone
+_TEMPLATE = go.layout.Template(pio.templates['plotly_white'])
+_TEMPLATE.layout.update(font=dict(family='Arial, sans-serif', size=12), showlegend=True)
+pio.templates['dqml'] = _TEMPLATE
+
+
 def _apply_common_styling(fig: go.Figure, title: Optional[str] = None) -> go.Figure:
     """Apply common styling to all charts."""
     fig.update_layout(
-        template='plotly_white',
-        margin=dict(l=40, r=40, t=60 if title else 40, b=40),
-        font=dict(family='Arial, sans-serif', size=12),
-        showlegend=True
+        template='dqml',
+        margin=dict(l=40, r=40, t=60 if title else 40, b=40)
     )
     
     return fig
@@ -423,13 +506,15 @@ def generate_anomaly_visualization(
         row_heights=[0.7, 0.3]
     )
     
-    # Scatter plot
-    colors = df[anomaly_col].map({True: 'red', False: 'blue'})
+    # Scatter plot; arrays go to Plotly as-is instead of as Series
+    colors = np.where(df[anomaly_col].to_numpy(dtype=bool), 'red', 'blue')
+    x = df[feature_cols[0]].to_numpy()
+    y = df[feature_cols[1]].to_numpy() if len(feature_cols) > 1 else x
     
     fig.add_trace(
         go.Scatter(
-            x=df[feature_cols[0]],
-            y=df[feature_cols[1]] if len(feature_cols) > 1 else df[feature_cols[0]],
+            x=x,
+            y=y,
             mode='markers',
             marker=dict(
                 color=colors,
@@ -518,15 +603,17 @@ def auto_visualize(
     
     Uses heuristics based on column types and data characteristics.
     """
-    num_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-    cat_cols = df.select_dtypes(exclude=[np.number]).columns.tolist()
+    column_kinds = _ColumnKinds(df)
+    num_cols = column_kinds.numeric
+    cat_cols = column_kinds.categorical
     
     # Check for cluster column
     if 'cluster' in df.columns:
         if len(num_cols) >= 2:
             return generate_chart(df, 'scatter_plot', 
                                   x_col=num_cols[0], y_col=num_cols[1],
-                                  color_col='cluster', title=title)
+                                  color_col='cluster', title=title,
+                                  column_kinds=column_kinds)
     
     # Check for anomaly column
     if 'is_anomaly' in df.columns:
@@ -535,23 +622,24 @@ def auto_visualize(
     
     # Small dataset: table
     if len(df) <= 20:
-        return generate_chart(df, 'table', title=title)
+        return generate_chart(df, 'table', title=title, column_kinds=column_kinds)
     
     # Only numeric columns: correlation heatmap or scatter
     if len(num_cols) >= 2 and len(cat_cols) == 0:
         if len(num_cols) <= 10:
-            return generate_chart(df, 'heatmap', title=title or 'Correlation Heatmap')
+            return generate_chart(df, 'heatmap', title=title or 'Correlation Heatmap',
+                                  column_kinds=column_kinds)
         else:
             return generate_chart(df, 'scatter_plot', 
                                   x_col=num_cols[0], y_col=num_cols[1],
-                                  title=title)
+                                  title=title, column_kinds=column_kinds)
     
     # Mix of numeric and categorical
     if len(num_cols) >= 1 and len(cat_cols) >= 1:
         # Bar chart with categorical x, numeric y
         return generate_chart(df, 'bar_chart',
                               x_col=cat_cols[0], y_col=num_cols[0],
-                              title=title)
+                              title=title, column_kinds=column_kinds)
     
     # Default: table
-    return generate_chart(df, 'table', title=title)
+    return generate_chart(df, 'table', title=title, column_kinds=column_kinds)
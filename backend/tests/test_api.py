@@ -12,7 +12,7 @@ import os
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from api.main import app, executor
+from api.main import app, get_executor
 
 
 @pytest.fixture
@@ -34,7 +34,7 @@ def sample_data():
         'value': np.random.randint(10, 100, 20),
         'score': np.random.rand(20) * 100
     })
-    executor.load_dataframe(df, 'test_data')
+    get_executor().load_dataframe(df, 'test_data')
     return df
 
 
@@ -49,6 +49,23 @@ class TestHealthEndpoint:
         data = response.json()
         assert data["status"] == "healthy"
         assert data["version"] == "0.1.0"
+        assert "max-age" in response.headers["cache-control"]
+    
+    def test_request_id_header(self, client):
+        """Test responses carry a request ID, echoing the client's if sent."""
+        generated = client.get("/api/health")
+        echoed = client.get("/api/health", headers={"X-Request-ID": "abc123"})
+        
+        assert len(generated.headers["x-request-id"]) == 32
+        assert echoed.headers["x-request-id"] == "abc123"
+    
+    def test_cors_allows_dev_origins(self, client):
+        """Test the frontend dev-server origins pass CORS and others don't."""
+        allowed = client.get("/api/health", headers={"Origin": "http://localhost:5173"})
+        denied = client.get("/api/health", headers={"Origin": "http://example.com"})
+        
+        assert allowed.headers["access-control-allow-origin"] == "http://localhost:5173"
+        assert "access-control-allow-origin" not in denied.headers
 
 
 class TestExecuteEndpoint:
@@ -75,6 +92,24 @@ class TestExecuteEndpoint:
         assert data["success"] is True
         assert data["row_count"] == 3
     
+    def test_execute_requires_query(self, client):
+        """Test a body without a query is rejected by validation."""
+        response = client.post("/api/execute", json={"data": {"a": [1]}})
+        
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "query"]
+    
+    def test_inline_data_missing_values(self, client):
+        """Test inline numeric columns with missing values load as nulls."""
+        response = client.post("/api/execute", json={
+            "query": "FROM inline_data",
+            "data": {"x": [1, None, 3], "y": [0.5, 1.5, 2.5]}
+        })
+        
+        data = response.json()
+        assert data["success"] is True
+        assert [row["x"] for row in data["data"]] == [1, None, 3]
+    
     def test_execute_basic_select(self, client, sample_data):
         """Test basic SELECT query."""
         response = client.post("/api/execute", json={
@@ -87,6 +122,21 @@ class TestExecuteEndpoint:
         assert data["row_count"] == 20
         assert "id" in data["columns"]
     
+    def test_execute_split_orient(self, client, sample_data):
+        """Test the 'split' orient returns one array per row."""
+        response = client.post("/api/execute", json={
+            "query": "FROM test_data",
+            "orient": "split"
+        })
+        
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"] is None
+        assert len(data["rows"]) == 20
+        row = dict(zip(data["columns"], data["rows"][0]))
+        assert row["id"] == 1
+        assert row["category"] == "A"
+    
     def test_execute_with_where(self, client, sample_data):
         """Test query with WHERE clause."""
         response = client.post("/api/execute", json={
@@ -98,6 +148,51 @@ class TestExecuteEndpoint:
         assert data["success"] is True
         assert data["row_count"] == 5
     
+    def test_failed_query_reports_error(self, client, sample_data):
+        """Test a query the database rejects is reported as a failure."""
+        response = client.post("/api/execute", json={
+            "query": "FROM test_data WHERE no_such_column = 1"
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is False
+        assert data["error"]
+    
+    def test_default_backend_is_sqlite(self, monkeypatch):
+        """Test the API uses SQLite unless DQML_BACKEND asks for DuckDB."""
+        from dqml.executor import SQLiteExecutor, DuckDBExecutor
+        
+        monkeypatch.delenv("DQML_BACKEND", raising=False)
+        executor = get_executor.__wrapped__()
+        assert type(executor) is SQLiteExecutor
+        
+        if DuckDBExecutor is not None:
+            monkeypatch.setenv("DQML_BACKEND", "duckdb")
+            assert isinstance(get_executor.__wrapped__(), DuckDBExecutor)
+    
+    def test_execute_empty_result(self, client, sample_data):
+        """Test a query matching no rows returns an empty successful result."""
+        response = client.post("/api/execute", json={
+            "query": "FROM test_data WHERE value > 1000"
+        })
+        
+        data = response.json()
+        assert data["success"] is True
+        assert data["row_count"] == 0
+        assert data["data"] == []
+        assert data["sql"].endswith("WHERE value > ?")
+    
+    def test_mining_empty_result(self, client, sample_data):
+        """Test mining a query with no rows reports an error."""
+        response = client.post("/api/execute", json={
+            "query": "FROM test_data WHERE value > 1000 MINE STATISTICS"
+        })
+        
+        data = response.json()
+        assert data["success"] is False
+        assert data["error"] == "No data returned from query"
+    
     def test_execute_with_display(self, client, sample_data):
         """Test query with DISPLAY AS."""
         response = client.post("/api/execute", json={
@@ -108,6 +203,86 @@ class TestExecuteEndpoint:
         data = response.json()
         assert data["success"] is True
         assert data["chart"] is not None
+    
+    def test_large_response_is_compressed(self, client, sample_data):
+        """Test large responses are gzip-encoded when the client accepts it."""
+        response = client.post(
+            "/api/execute",
+            json={"query": "FROM test_data"},
+            headers={"Accept-Encoding": "gzip"}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["row_count"] == 20
+    
+    def test_large_result_is_streamed(self, client, sample_data, monkeypatch):
+        """Test results above the threshold are streamed as NDJSON."""
+        import json
+        import api.main
+        
+        monkeypatch.setattr(api.main, "STREAM_ROW_THRESHOLD", 10)
+        monkeypatch.setattr(api.main, "_STREAM_CHUNK_ROWS", 8)
+        response = client.post("/api/execute", json={
+            "query": "FROM test_data"
+        })
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert response.headers["x-dqml-row-count"] == "20"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        meta, chunks = lines[0], lines[1:]
+        assert meta["success"] is True
+        assert meta["row_count"] == 20
+        assert "data" not in meta
+        assert [len(chunk) for chunk in chunks] == [8, 8, 4]
+        assert chunks[0][0]["id"] == 1
+
+
+class TestSerialization:
+    """Tests for the numpy/pandas value converter."""
+    
+    def test_to_serializable_nested(self):
+        """Test nested numpy/pandas values become plain Python types."""
+        import numpy as np
+        import pandas as pd
+        from api.main import to_serializable
+        
+        result = to_serializable({
+            'count': np.int64(3),
+            'values': [np.float64(1.5), np.bool_(True), pd.NaT],
+            'array': np.array([1, 2]),
+            'frame': pd.DataFrame({'a': [1]})
+        })
+        
+        assert result == {
+            'count': 3,
+            'values': [1.5, True, None],
+            'array': [1, 2],
+            'frame': [{'a': 1}]
+        }
+        assert type(result['count']) is int
+
+
+class TestQueryCache:
+    """Tests for parsing queries through the parser's cache."""
+    
+    def test_repeated_query_reuses_parse(self):
+        """Test a repeated query text is parsed once."""
+        from dqml.parser import parse_query
+        
+        assert parse_query("FROM test_data") is parse_query("FROM test_data")
+    
+    def test_query_with_line_comment(self, client, sample_data):
+        """Test a -- comment only runs to the end of its line."""
+        response = client.post("/api/execute", json={
+            "query": "-- category filter\nFROM test_data\nWHERE category = 'A' -- A only\n"
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["row_count"] == 5
 
 
 class TestMiningOperations:
@@ -149,6 +324,73 @@ class TestMiningOperations:
         assert data["success"] is True
         assert data["query_type"] == "mining"
         assert data["mining_result"]["type"] == "anomaly_detection"
+        flagged = [i for i, row in enumerate(data["data"]) if row["is_anomaly"]]
+        assert data["mining_result"]["anomaly_indices"] == flagged
+
+
+class TestMiningPool:
+    """Tests for dispatching mining work to the process pool."""
+    
+    def test_small_input_runs_inline(self, monkeypatch):
+        """Test inputs below POOL_MIN_ROWS skip the process pool."""
+        import asyncio
+        import pandas as pd
+        import api.main as main
+        
+        def no_pool(*args):
+            raise AssertionError("pool path taken for a small input")
+        
+        monkeypatch.setattr(main, 'get_process_pool', no_pool)
+        monkeypatch.setattr(main, 'optimize_dtypes', no_pool)
+        df = pd.DataFrame({'x': range(10)})
+        assert asyncio.run(main._run_in_pool(len, df, narrow_columns=['x'])) == 10
+    
+    def test_large_input_uses_pool(self, monkeypatch):
+        """Test inputs at POOL_MIN_ROWS are sent to the pool."""
+        import asyncio
+        import pandas as pd
+        from concurrent.futures import ThreadPoolExecutor
+        import api.main as main
+        
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(main, 'get_process_pool', lambda: pool)
+        monkeypatch.setattr(main, 'POOL_MIN_ROWS', 5)
+        df = pd.DataFrame({'x': range(10)})
+        try:
+            assert asyncio.run(main._run_in_pool(len, df)) == 10
+        finally:
+            pool.shutdown()
+    
+    def test_pool_input_is_narrowed(self, monkeypatch):
+        """Test only inputs sent to the pool get their columns downcast."""
+        import asyncio
+        import pandas as pd
+        from concurrent.futures import ThreadPoolExecutor
+        import api.main as main
+        
+        def dtypes(df):
+            return df['x'].dtype.name
+        
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(main, 'get_process_pool', lambda: pool)
+        monkeypatch.setattr(main, 'POOL_MIN_ROWS', 5)
+        df = pd.DataFrame({'x': range(10)})
+        try:
+            assert asyncio.run(main._run_in_pool(dtypes, df)) == 'int64'
+            assert asyncio.run(main._run_in_pool(dtypes, df, narrow_columns=['x'])) == 'int8'
+        finally:
+            pool.shutdown()
+    
+    def test_pool_size_split_between_workers(self, monkeypatch):
+        """Test each uvicorn worker's pool gets its share of the CPUs."""
+        import api.main as main
+        
+        monkeypatch.setattr(main.os, 'cpu_count', lambda: 8)
+        for workers, expected in ((1, 8), (3, 2), (16, 1)):
+            monkeypatch.setattr(main, 'WEB_CONCURRENCY', workers)
+            pool = main.get_process_pool.__wrapped__()
+            assert pool._max_workers == expected
+            pool.shutdown()
 
 
 class TestDataManagement:
@@ -171,6 +413,25 @@ class TestDataManagement:
         })
         
         assert response.status_code == 404
+    
+    def test_load_csv(self, client, tmp_path):
+        """Test loading a CSV file and querying it."""
+        csv_path = tmp_path / "people.csv"
+        csv_path.write_text("name,age\nAlice,25\nBob,30\n")
+        
+        response = client.post("/api/load-csv", json={
+            "file_path": str(csv_path),
+            "table_name": "people"
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["row_count"] == 2
+        assert data["columns"] == ["name", "age"]
+        
+        result = client.post("/api/execute", json={"query": "FROM people"}).json()
+        assert result["row_count"] == 2
 
 
 class TestErrorHandling:
@@ -13,6 +13,7 @@ import tempfile
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 import pytest
+import numpy as np
 import pandas as pd
 from backend.dqml.executor.sqlite_executor import SQLiteExecutor, ExecutionResult
 from backend.dqml.parser.dmql_parser import parse_query
@@ -34,6 +35,15 @@ class TestSQLiteExecutorBasics:
         with SQLiteExecutor(':memory:') as executor:
             assert executor.conn is not None
     
+    def test_connection_pragmas(self, tmp_path):
+        """Test file databases are opened in WAL mode with memory temp store."""
+        with SQLiteExecutor(str(tmp_path / 'test.db')) as executor:
+            journal_mode = executor.conn.execute("PRAGMA journal_mode").fetchone()[0]
+            temp_store = executor.conn.execute("PRAGMA temp_store").fetchone()[0]
+            
+            assert journal_mode == 'wal'
+            assert temp_store == 2  # MEMORY
+    
     def test_load_csv(self):
         """Test loading CSV data into table."""
         with SQLiteExecutor(':memory:') as executor:
@@ -58,6 +68,60 @@ class TestSQLiteExecutorBasics:
             finally:
                 os.unlink(temp_path)
     
+    def test_load_csv_in_chunks(self, tmp_path, monkeypatch):
+        """Test chunked CSV loading inserts every row and restores pragmas."""
+        from backend.dqml.executor import sqlite_executor
+        
+        monkeypatch.setattr(sqlite_executor, 'pa_csv', None)
+        monkeypatch.setattr(sqlite_executor, '_CSV_CHUNK_ROWS', 10)
+        monkeypatch.setattr(sqlite_executor, '_INSERT_BATCH_ROWS', 4)
+        csv_path = tmp_path / 'numbers.csv'
+        pd.DataFrame({'n': range(25), 'sq': [i * i for i in range(25)]}).to_csv(csv_path, index=False)
+        
+        with SQLiteExecutor(':memory:') as executor:
+            loaded_df = executor.load_csv(str(csv_path), 'numbers')
+            synchronous = executor.conn.execute("PRAGMA synchronous").fetchone()[0]
+            
+            assert len(loaded_df) == 25
+            assert list(loaded_df.index) == list(range(25))
+            assert executor.get_row_count('numbers') == 25
+            assert synchronous == 1  # NORMAL
+    
+    def test_concurrent_loads(self, tmp_path, monkeypatch):
+        """Test loads from several threads don't interleave on the shared connection."""
+        from concurrent.futures import ThreadPoolExecutor
+        from backend.dqml.executor import sqlite_executor
+        
+        monkeypatch.setattr(sqlite_executor, 'pa_csv', None)
+        monkeypatch.setattr(sqlite_executor, '_CSV_CHUNK_ROWS', 1000)
+        paths = []
+        for i in range(4):
+            paths.append(tmp_path / f'numbers{i}.csv')
+            pd.DataFrame({'n': range(20_000)}).to_csv(paths[i], index=False)
+        
+        with SQLiteExecutor(':memory:') as executor:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = [pool.submit(executor.load_csv, str(path), f'numbers{i}')
+                           for i, path in enumerate(paths)]
+                for future in futures:
+                    future.result()
+            
+            assert [executor.get_row_count(f'numbers{i}') for i in range(4)] == [20_000] * 4
+    
+    def test_load_csv_arrow_ingest(self, tmp_path):
+        """Test CSVs are bulk ingested through ADBC into a file database."""
+        pytest.importorskip('pyarrow')
+        pytest.importorskip('adbc_driver_sqlite')
+        csv_path = tmp_path / 'numbers.csv'
+        pd.DataFrame({'n': range(25), 'label': list('ab' * 12) + ['c']}).to_csv(csv_path, index=False)
+        
+        with SQLiteExecutor(str(tmp_path / 'db.sqlite')) as executor:
+            loaded_df = executor.load_csv(str(csv_path), 'numbers')
+            
+            assert len(loaded_df) == 25
+            assert executor.get_row_count('numbers') == 25
+            assert executor._table_exists('numbers')
+    
     def test_load_dataframe(self):
         """Test loading DataFrame directly."""
         with SQLiteExecutor(':memory:') as executor:
@@ -179,6 +243,107 @@ class TestDMQLQueryExecution:
         assert result.data is not None
         assert len(result.data) == 4  # Alice, Bob, Diana, Eve (age > 25)
     
+    def test_execute_in_chunks(self, executor_with_data):
+        """Test chunked fetching returns the same frame as a single fetch."""
+        parsed = parse_query("USE DATABASE sales_data FROM customers WHERE age > 25")
+        
+        whole = executor_with_data.execute_query(parsed)
+        chunked = executor_with_data.execute_query(parsed, chunksize=2)
+        
+        assert chunked.success
+        pd.testing.assert_frame_equal(chunked.data, whole.data)
+    
+    def test_conditions_are_parameterized(self, executor_with_data):
+        """Test WHERE values are bound as parameters, not inlined."""
+        parsed = parse_query(
+            "USE DATABASE sales_data FROM customers "
+            "WHERE city = 'Mumbai' AND age > 30"
+        )
+        result = executor_with_data.execute_query(parsed)
+        
+        assert result.success
+        assert result.sql_query.endswith("WHERE (city = ? AND age > ?)")
+        assert result.metadata['params'] == ['Mumbai', 30]
+        assert list(result.data['name']) == ['Diana']
+    
+    def test_like_condition(self, executor_with_data):
+        """Test LIKE conditions bind their pattern."""
+        parsed = parse_query("USE DATABASE sales_data FROM customers WHERE name LIKE '%e'")
+        result = executor_with_data.execute_query(parsed)
+        
+        assert result.success
+        assert result.sql_query.endswith("WHERE name LIKE ?")
+        assert result.metadata['params'] == ['%e']
+        assert list(result.data['name']) == ['Alice', 'Charlie', 'Eve']
+    
+    def test_columnar_fetch(self, executor_with_data):
+        """Test columnar fetching gives typed arrays and the same frame."""
+        executor_with_data.load_dataframe(
+            pd.DataFrame({'n': [1, None, 3], 's': ['a', None, 'c']}), 'nulls'
+        )
+        arrays = executor_with_data.fetch_columnar(
+            "SELECT * FROM sales_data__customers WHERE age > ?", [25], batch_size=2
+        )
+        assert arrays['age'].dtype == np.int64
+        assert arrays['name'].tolist() == ['Alice', 'Bob', 'Diana', 'Eve']
+        
+        nulls = executor_with_data.fetch_columnar("SELECT * FROM nulls")
+        assert nulls['n'].dtype == np.float64
+        assert nulls['s'].tolist() == ['a', None, 'c']
+        
+        parsed = parse_query("USE DATABASE sales_data FROM customers WHERE age > 25")
+        columnar = executor_with_data.execute_query(parsed, columnar=True)
+        pd.testing.assert_frame_equal(columnar.data, executor_with_data.execute_query(parsed).data)
+    
+    def test_query_shape_cache(self, executor_with_data):
+        """Test queries differing only in values reuse the cached SQL text."""
+        first = executor_with_data.execute_query(
+            parse_query("USE DATABASE sales_data FROM customers WHERE age > 25")
+        )
+        second = executor_with_data.execute_query(
+            parse_query("USE DATABASE sales_data FROM customers WHERE age > 40")
+        )
+        
+        assert first.sql_query is second.sql_query
+        assert second.metadata['params'] == [40]
+        assert list(second.data['name']) == ['Diana']
+        assert len(executor_with_data._stmt_cache) == 1
+        
+        # Loading a table can change name resolution, so the cache is dropped
+        executor_with_data.load_dataframe(pd.DataFrame({'x': [1]}), 'customers')
+        third = executor_with_data.execute_query(
+            parse_query("USE DATABASE sales_data FROM customers WHERE age > 40")
+        )
+        assert third.sql_query == second.sql_query
+        assert third.sql_query is not second.sql_query
+    
+    def test_nested_condition_to_sql(self):
+        """Test nested AND/OR trees keep their grouping and parameter order."""
+        from backend.dqml.parser.dmql_parser import Condition
+        
+        tree = Condition(left='', operator='AND', right=None, logical_op='AND', nested=[
+            Condition(left='', operator='OR', right=None, logical_op='OR', nested=[
+                Condition(left='city', operator='=', right='Mumbai'),
+                Condition(left='city', operator='=', right='Delhi')
+            ]),
+            Condition(left='age', operator='>', right=30)
+        ])
+        
+        sql, params = SQLiteExecutor()._condition_to_sql(tree)
+        
+        assert sql == "((city = ? OR city = ?) AND age > ?)"
+        assert params == ['Mumbai', 'Delhi', 30]
+    
+    def test_quoted_value_is_not_injected(self, executor_with_data):
+        """Test a value containing a quote is matched literally."""
+        parsed = parse_query(
+            "USE DATABASE sales_data FROM customers WHERE name = \"x' OR '1'='1\""
+        )
+        result = executor_with_data.execute_query(parsed)
+        
+        assert result.success
+        assert len(result.data) == 0
+    
     def test_execute_with_order_by(self, executor_with_data):
         """Test DMQL query with ORDER BY."""
         query_str = """
@@ -276,6 +441,67 @@ class TestTableManagement:
             sample = executor.sample_data('big_table', n=5)
             
             assert len(sample) == 5
+    
+    def test_load_dataframe_types_and_nulls(self):
+        """Test bulk loading maps dtypes and stores missing values as NULL."""
+        with SQLiteExecutor(':memory:') as executor:
+            df = pd.DataFrame({
+                'a': [1, 2],
+                'b': [1.5, None],
+                'c': ['x', None],
+                'd': pd.to_datetime(['2024-01-01', None])
+            })
+            executor.load_dataframe(df, 'typed')
+            executor.load_dataframe(df, 'typed')  # Replaces the table
+            
+            types = {col['name']: col['type'] for col in executor.get_table_info('typed')}
+            rows = executor.conn.execute("SELECT * FROM typed").fetchall()
+            
+            assert types == {'a': 'INTEGER', 'b': 'REAL', 'c': 'TEXT', 'd': 'TIMESTAMP'}
+            assert [tuple(row) for row in rows] == [
+                (1, 1.5, 'x', '2024-01-01 00:00:00'),
+                (2, None, None, None)
+            ]
+    
+    def test_table_cache_tracks_changes(self):
+        """Test cached table names are refreshed after tables change."""
+        with SQLiteExecutor(':memory:') as executor:
+            assert not executor._table_exists('t1')
+            
+            executor.load_dataframe(pd.DataFrame({'a': [1]}), 't1')
+            assert executor._table_exists('t1')
+            
+            executor.execute_query("CREATE TABLE t2 (b INTEGER)")
+            assert executor._table_exists('t2')
+    
+    def test_metadata_cursors_are_reused(self):
+        """Test metadata helpers reuse one cursor per SQL text."""
+        with SQLiteExecutor(':memory:') as executor:
+            executor.load_dataframe(pd.DataFrame({'a': [1, 2]}), 't1')
+            
+            assert executor.get_row_count('t1') == 2
+            cursor = executor._cursors['SELECT COUNT(*) FROM "t1"']
+            executor.load_dataframe(pd.DataFrame({'a': [1, 2, 3]}), 't1')
+            assert executor.get_row_count('t1') == 3
+            assert executor._cursors['SELECT COUNT(*) FROM "t1"'] is cursor
+            
+            assert executor.list_tables() == ['t1']
+            assert executor.list_tables() == ['t1']
+    
+    def test_identifiers_are_quoted(self):
+        """Test table helpers work with names that need quoting."""
+        with SQLiteExecutor(':memory:') as executor:
+            df = pd.DataFrame({'first name': ['Ann', 'Ben', 'Cal'], 'order': [3, 1, 2]})
+            executor.load_dataframe(df, 'my table')
+            
+            assert executor.get_row_count('my table') == 3
+            assert [c['name'] for c in executor.get_table_info('my table')] == ['first name', 'order']
+            assert len(executor.sample_data('my table', n=2)) == 2
+            
+            result = executor.execute_select(
+                'my table', columns=['first name'], order_by=[('order', 'asc')], limit=2
+            )
+            assert result['first name'].tolist() == ['Ben', 'Cal']
 
 
 class TestErrorHandling:
@@ -298,6 +524,55 @@ class TestErrorHandling:
             assert result.error is not None
 
 
+class TestDuckDBExecutor:
+    """Test the DuckDB backend."""
+    
+    @pytest.fixture
+    def executor_with_data(self):
+        """Create DuckDB executor with sample data."""
+        duckdb_executor = pytest.importorskip('backend.dqml.executor.duckdb_executor')
+        executor = duckdb_executor.DuckDBExecutor(':memory:')
+        executor.connect()
+        
+        customers_df = pd.DataFrame({
+            'id': [1, 2, 3, 4, 5],
+            'name': ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve'],
+            'age': [28, 35, 22, 45, 31],
+            'purchase_amount': [5000, 7500, 3000, 12000, 6000]
+        })
+        executor.load_dataframe(customers_df, 'customers', database_name='sales_data')
+        
+        yield executor
+        executor.close()
+    
+    def test_registered_dataframe_is_listed(self, executor_with_data):
+        """Test registered DataFrames show up as tables."""
+        assert 'customers' in executor_with_data.list_tables('sales_data')
+        assert executor_with_data.get_row_count('sales_data__customers') == 5
+    
+    def test_execute_dmql_query(self, executor_with_data):
+        """Test executing a parsed DMQL query on DuckDB."""
+        parsed = parse_query("""
+        USE DATABASE sales_data
+        FROM customers
+        WHERE age > 25
+        ORDER BY purchase_amount DESC
+        """)
+        result = executor_with_data.execute_query(parsed)
+        
+        assert result.success
+        assert len(result.data) == 4
+        amounts = result.data['purchase_amount'].tolist()
+        assert amounts == sorted(amounts, reverse=True)
+    
+    def test_invalid_table(self, executor_with_data):
+        """Test querying a non-existent table."""
+        result = executor_with_data.execute_query("SELECT * FROM nonexistent")
+        
+        assert not result.success
+        assert result.error is not None
+
+
 # ============================================================================
 # RUN TESTS
 # ============================================================================
@@ -90,7 +90,7 @@ class TestEndToEndPipeline:
         # 1. Parse query
         query = parse_query("SELECT * FROM customers WHERE age > 30")
         assert query is not None
-        assert query.tables == ["customers"]
+        assert query.tables == ("customers",)
         assert query.conditions is not None
         
         # 2. Execute query
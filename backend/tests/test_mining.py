@@ -14,7 +14,11 @@ from backend.dqml.mining import (
     kmeans_clustering,
     basic_statistics,
     detect_anomalies,
-    data_profile
+    detect_anomalies_async,
+    detect_univariate_anomalies,
+    data_profile,
+    summary_and_profile,
+    optimize_dtypes
 )
 
 
@@ -62,6 +66,242 @@ class TestClustering:
         assert result.cluster_sizes is not None
         total = sum(result.cluster_sizes.values())
         assert total == len(sample_data)
+    
+    def test_large_input_uses_minibatch(self, monkeypatch):
+        """Test inputs over the size threshold cluster with mini-batch K-Means."""
+        from backend.dqml.mining import clustering
+        
+        monkeypatch.setattr(clustering, '_LARGE_KMEANS_ROWS', 100)
+        monkeypatch.setattr(clustering, 'FAISS_AVAILABLE', False)
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(np.vstack([
+            rng.normal(loc, 0.1, size=(100, 2)) for loc in (0, 5, 10)
+        ]), columns=['x', 'y'])
+        
+        result = kmeans_clustering(df, n_clusters=3)
+        
+        assert sorted(result.cluster_sizes.values()) == [100, 100, 100]
+        assert result.cluster_centers.shape == (3, 2)
+        assert result.inertia > 0
+    
+    @pytest.mark.parametrize('method', ['kmeans', 'dbscan', 'hierarchical'])
+    def test_result_shares_input_columns(self, sample_data, method):
+        """Test clustering adds the label column without copying the input."""
+        from backend.dqml.mining import dbscan_clustering, hierarchical_clustering
+        
+        run = {
+            'kmeans': lambda df: kmeans_clustering(df, n_clusters=3),
+            'dbscan': lambda df: dbscan_clustering(df),
+            'hierarchical': lambda df: hierarchical_clustering(df, n_clusters=3),
+        }[method]
+        result = run(sample_data)
+        
+        assert 'cluster' in result.data.columns
+        assert 'cluster' not in sample_data.columns
+        assert np.shares_memory(result.data['x'].to_numpy(), sample_data['x'].to_numpy())
+    
+    def test_centers_in_original_units(self, sample_data):
+        """Test K-means centers are mapped back from the scaled float32 space."""
+        sample_data.loc[0, 'y'] = np.nan
+        result = kmeans_clustering(sample_data, n_clusters=3)
+        
+        centers = sorted(map(tuple, np.round(result.cluster_centers)))
+        assert centers == [(0.0, 0.0), (5.0, 5.0), (10.0, 0.0)]
+        assert sorted(result.cluster_sizes.values()) == [30, 30, 30]
+    
+    def test_elkan_for_wide_inputs(self):
+        """Test wide, many-cluster inputs use Elkan and still recover the blobs."""
+        from backend.dqml.mining.clustering import _kmeans_algorithm
+        
+        assert _kmeans_algorithm(2, 10) == 'lloyd'
+        assert _kmeans_algorithm(6, 4) == 'lloyd'
+        assert _kmeans_algorithm(6, 8) == 'elkan'
+        
+        rng = np.random.default_rng(0)
+        centers = rng.uniform(-50, 50, size=(8, 5))
+        df = pd.DataFrame(np.vstack([rng.normal(c, 0.5, size=(30, 5)) for c in centers]))
+        df.columns = [f'f{i}' for i in range(5)]
+        
+        result = kmeans_clustering(df, n_clusters=8)
+        assert sorted(result.cluster_sizes.values()) == [30] * 8
+    
+    def test_lloyd_kernels_match_sklearn(self, sample_data):
+        """Test the dimension-specialized K-means matches sklearn's KMeans."""
+        from sklearn.cluster import KMeans
+        from backend.dqml.mining.clustering import _kmeans_lloyd
+        
+        X = sample_data[['x', 'y']].to_numpy()
+        labels, centers, inertia = _kmeans_lloyd(X, 3, n_init=3)
+        expected = KMeans(n_clusters=3, random_state=42, n_init=10).fit(X)
+        
+        assert inertia == pytest.approx(expected.inertia_)
+        assert sorted(np.bincount(labels)) == sorted(np.bincount(expected.labels_))
+    
+    def test_one_feature_uses_sorted_kmeans(self):
+        """Test the 1-D K-means matches sklearn and reports consistent labels."""
+        from sklearn.cluster import KMeans
+        from backend.dqml.mining.clustering import _kmeans_1d
+        
+        rng = np.random.default_rng(4)
+        x = np.concatenate([rng.normal(loc, 1.0, 200) for loc in (0, 8, 15, 30)])
+        labels, centers, inertia = _kmeans_1d(x, 4, n_init=3)
+        expected = KMeans(n_clusters=4, random_state=0, n_init=10).fit(x[:, np.newaxis])
+        
+        assert inertia == pytest.approx(expected.inertia_)
+        assert inertia == pytest.approx(((x - centers[labels, 0]) ** 2).sum())
+        assert np.all(np.diff(centers[:, 0]) > 0)
+        
+        result = kmeans_clustering(pd.DataFrame({'v': x}), n_clusters=4)
+        assert sorted(result.cluster_sizes.values()) == sorted(np.bincount(labels))
+        assert result.cluster_centers[:, 0] == pytest.approx(centers[:, 0], rel=1e-4)
+    
+    def test_wide_dbscan_uses_precomputed_distances(self):
+        """Test wide DBSCAN inputs on the GEMM distance matrix match sklearn."""
+        from sklearn.cluster import DBSCAN
+        from backend.dqml.mining import dbscan_clustering
+        from backend.dqml.mining.clustering import _euclidean_distances, _feature_matrix
+        
+        rng = np.random.default_rng(2)
+        df = pd.DataFrame(np.vstack([
+            rng.normal(loc, 0.3, size=(60, 20)) for loc in (0, 3)
+        ]), columns=[f'f{i}' for i in range(20)])
+        X, _, _ = _feature_matrix(df, df.columns.tolist(), True)
+        
+        np.testing.assert_allclose(
+            _euclidean_distances(X),
+            np.linalg.norm(X[:, np.newaxis] - X[np.newaxis], axis=2), atol=1e-4
+        )
+        result = dbscan_clustering(df, eps=3.0, min_samples=5)
+        expected = DBSCAN(eps=3.0, min_samples=5).fit_predict(X)
+        assert result.data['cluster'].tolist() == expected.tolist()
+        assert result.n_clusters == 2
+    
+    def test_standardize_kernel_matches_numpy(self, monkeypatch):
+        """Test the fused scaling kernel matches the NumPy feature matrix."""
+        from backend.dqml.mining import clustering
+        
+        rng = np.random.default_rng(6)
+        df = pd.DataFrame({
+            'a': rng.normal(1e4, 2.0, 50), 'b': rng.normal(size=50), 'c': np.full(50, 3.0)
+        })
+        df.loc[[2, 11], 'b'] = np.nan
+        
+        monkeypatch.setattr(clustering, 'NUMBA_AVAILABLE', False)
+        expected = clustering._feature_matrix(df, ['a', 'b', 'c'], True)
+        
+        X = df.to_numpy(dtype=np.float64, na_value=0.0)
+        out = np.empty_like(X, dtype=np.float32)
+        mu, sd = np.zeros(3), np.ones(3)
+        clustering._standardize_kernel(X, out, mu, sd, True)
+        
+        np.testing.assert_allclose(out, expected[0], atol=1e-4)
+        np.testing.assert_allclose(mu, expected[1], rtol=1e-6)
+        np.testing.assert_allclose(sd, expected[2], rtol=1e-4)
+        assert sd[2] == 1.0
+    
+    @pytest.mark.parametrize('numba_kernel', [False, True])
+    def test_feature_matrix_large_magnitude(self, monkeypatch, numba_kernel):
+        """Test standardizing keeps the variation of a column far from zero."""
+        from backend.dqml.mining import clustering
+        
+        # Without numba the kernel runs as plain Python
+        monkeypatch.setattr(clustering, 'NUMBA_AVAILABLE', numba_kernel)
+        rng = np.random.default_rng(8)
+        seconds = 1.6e9 + np.concatenate([rng.normal(0, 20, 100), rng.normal(500, 20, 100)])
+        df = pd.DataFrame({'ts': seconds})
+        
+        X, mu, sd = clustering._feature_matrix(df, ['ts'], True)
+        
+        assert len(np.unique(X)) == 200
+        np.testing.assert_allclose(sd, [seconds.std()], rtol=1e-6)
+        np.testing.assert_allclose(mu, [seconds.mean()], rtol=1e-12)
+        
+        monkeypatch.setattr(clustering, 'NUMBA_AVAILABLE', False)
+        centers = np.sort(clustering.kmeans_clustering(df, n_clusters=2).cluster_centers[:, 0])
+        np.testing.assert_allclose(centers - 1.6e9, [0, 500], atol=10)
+    
+    def test_feature_matrix_is_one_writable_copy(self):
+        """Test the feature matrix fills NaNs and never aliases the frame."""
+        from backend.dqml.mining.clustering import _feature_matrix
+        
+        df = pd.DataFrame({'a': np.arange(5, dtype=np.float32), 'b': [1.0, np.nan, 3.0, 4.0, 5.0]})
+        single = df[['a']]
+        
+        X, mu, sd = _feature_matrix(df, ['a', 'b'], False)
+        assert X.dtype == np.float32 and X.flags.writeable
+        assert sd.tolist() == [1.0, 1.0]
+        np.testing.assert_allclose(X[1] + mu, [1.0, 0.0], atol=1e-6)
+        
+        X, _, _ = _feature_matrix(single, ['a'], False)
+        assert X.flags.writeable
+        assert not np.shares_memory(X, single['a'].to_numpy())
+    
+    def test_large_hierarchical_uses_subclusters(self, monkeypatch):
+        """Test large inputs are clustered through K-Means sub-centroids."""
+        from backend.dqml.mining import clustering
+        
+        monkeypatch.setattr(clustering, '_HIERARCHICAL_MAX_ROWS', 100)
+        monkeypatch.setattr(clustering, '_HIERARCHICAL_SUBCLUSTERS', 20)
+        rng = np.random.default_rng(1)
+        df = pd.DataFrame(np.vstack([
+            rng.normal(loc, 0.2, size=(100, 2)) for loc in (0, 5, 10)
+        ]), columns=['x', 'y'])
+        
+        result = clustering.hierarchical_clustering(df, n_clusters=3)
+        
+        assert sorted(result.cluster_sizes.values()) == [100, 100, 100]
+        assert result.data['cluster'].nunique() == 3
+    
+    def test_cluster_sizes_match_value_counts(self):
+        """Test bincount cluster sizes match value_counts, noise label included."""
+        from backend.dqml.mining.clustering import _cluster_sizes
+        
+        labels = np.array([2, -1, 0, 2, 2, -1, 5, 0, 2])
+        sizes = _cluster_sizes(labels)
+        
+        assert sizes == pd.Series(labels).value_counts().to_dict()
+        assert list(sizes.values()) == sorted(sizes.values(), reverse=True)
+        assert _cluster_sizes(np.array([], dtype=int)) == {}
+    
+    def test_find_optimal_k_warm_start(self, sample_data):
+        """Test the warm-started elbow scan finds the three blobs."""
+        from backend.dqml.mining import find_optimal_k
+        
+        results = find_optimal_k(sample_data, k_range=(2, 6))
+        
+        assert results['k_values'] == [2, 3, 4, 5, 6]
+        assert results['optimal_k'] == 3
+        assert all(a >= b for a, b in zip(results['inertia'], results['inertia'][1:]))
+    
+    def test_find_optimal_k_parallel_scoring(self, sample_data, monkeypatch):
+        """Test scoring the K values in worker processes matches the serial scan."""
+        from backend.dqml.mining import clustering
+        
+        serial = clustering.find_optimal_k(sample_data, k_range=(2, 4))
+        monkeypatch.setattr(clustering, '_LARGE_KMEANS_ROWS', 10)
+        parallel = clustering.find_optimal_k(sample_data, k_range=(2, 4), n_jobs=2)
+        
+        assert parallel['silhouette_scores'] == pytest.approx(serial['silhouette_scores'])
+        assert parallel['optimal_k'] == serial['optimal_k'] == 3
+    
+    def test_silhouette_sampled_for_large_inputs(self, sample_data, monkeypatch):
+        """Test the silhouette is exact for small inputs and sampled above the cap."""
+        from sklearn.metrics import silhouette_score, calinski_harabasz_score
+        from backend.dqml.mining import clustering
+        
+        X = sample_data[['x', 'y']].to_numpy()
+        labels = np.repeat([0, 1, 2], 30)
+        exact = silhouette_score(X, labels)
+        
+        assert clustering._cluster_score(X, labels) == pytest.approx(exact)
+        assert clustering._cluster_score(X, labels, 'ch') == \
+            pytest.approx(calinski_harabasz_score(X, labels))
+        
+        monkeypatch.setattr(clustering, '_SILHOUETTE_SAMPLE_SIZE', 60)
+        sampled = clustering._cluster_score(X, labels)
+        assert sampled != exact
+        assert sampled == pytest.approx(exact, abs=0.1)
+        assert clustering._cluster_score(X, labels, 'exact') == pytest.approx(exact)
 
 
 class TestStatistics:
@@ -101,6 +341,244 @@ class TestStatistics:
         assert profile['column_count'] == 3
         assert 'age' in profile['columns']
         assert 'data_quality_score' in profile
+    
+    def test_summary_matches_pandas(self):
+        """Test the vectorized summary matches per-column pandas statistics."""
+        rng = np.random.default_rng(3)
+        df = pd.DataFrame({
+            'a': rng.exponential(size=50),
+            'b': rng.integers(0, 100, size=50),
+            'const': np.full(50, 2.0),
+        })
+        df.loc[[4, 9], 'a'] = np.nan
+        summary = basic_statistics(df).summary
+        
+        for col in df.columns:
+            data = df[col].dropna()
+            expected = {
+                'count': len(data), 'mean': data.mean(), 'median': data.median(),
+                'std': data.std(), 'min': data.min(), 'max': data.max(),
+                'q25': data.quantile(0.25), 'q50': data.quantile(0.5),
+                'q75': data.quantile(0.75), 'variance': data.var(),
+                'skewness': data.skew(), 'kurtosis': data.kurtosis()
+            }
+            assert summary[col] == pytest.approx(expected, abs=1e-9)
+    
+    def test_moments_kernel_matches_numpy(self, monkeypatch):
+        """Test the single-pass moments summary matches the NumPy reductions."""
+        from backend.dqml.mining import statistics
+        
+        rng = np.random.default_rng(9)
+        X = np.column_stack([
+            rng.gamma(2.0, size=80) + 1e3, rng.normal(size=80),
+            np.full(80, 4.0), np.full(80, np.nan)
+        ])
+        X[[1, 30, 55], 1] = np.nan
+        names = ['a', 'b', 'const', 'empty']
+        
+        monkeypatch.setattr(statistics, 'NUMBA_AVAILABLE', False)
+        expected = statistics._summarize_block(X, names)
+        monkeypatch.setattr(statistics, 'NUMBA_AVAILABLE', True)
+        summary = statistics._summarize_block(X, names)
+        
+        assert summary.keys() == expected.keys() == {'a', 'b', 'const'}
+        for col in expected:
+            assert summary[col] == pytest.approx(expected[col], rel=1e-9, abs=1e-12)
+    
+    def test_distribution_analysis(self):
+        """Test the histogram, summary and normality test of a numeric column."""
+        from scipy import stats as scipy_stats
+        from backend.dqml.mining import distribution_analysis
+        
+        rng = np.random.default_rng(5)
+        df = pd.DataFrame({'v': np.round(rng.normal(size=400), 1)})
+        df.loc[[3, 7], 'v'] = np.nan
+        data = df['v'].dropna()
+        
+        result = distribution_analysis(df, 'v', bins=10)
+        
+        hist, edges = np.histogram(data, bins=10)
+        assert result['histogram']['values'] == hist.tolist()
+        assert result['histogram']['bin_edges'] == pytest.approx(edges.tolist())
+        assert result['normality_test']['test_name'] == "D'Agostino-Pearson"
+        assert result['normality_test']['p_value'] == pytest.approx(scipy_stats.normaltest(data).pvalue)
+        assert result['statistics'] == pytest.approx({
+            'mean': data.mean(), 'median': data.median(), 'mode': data.mode().iloc[0],
+            'std': data.std(), 'skewness': data.skew(), 'kurtosis': data.kurtosis()
+        })
+        
+        small = distribution_analysis(df.head(20), 'v')
+        assert small['normality_test']['test_name'] == 'Shapiro-Wilk'
+    
+    def test_skew_kurtosis_match_scipy(self):
+        """Test the one-pass moments match scipy's bias-corrected estimators."""
+        from scipy import stats as scipy_stats
+        from backend.dqml.mining.statistics import _sample_skew_kurtosis
+        
+        rng = np.random.default_rng(8)
+        X = rng.gamma(2.0, size=(200, 4))
+        X[rng.random(X.shape) < 0.1] = np.nan
+        counts = (~np.isnan(X)).sum(axis=0)
+        
+        skewness, kurtosis = _sample_skew_kurtosis(X, np.nanmean(X, axis=0), counts, True)
+        
+        expected_skew = scipy_stats.skew(X, axis=0, bias=False, nan_policy='omit')
+        expected_kurt = scipy_stats.kurtosis(X, axis=0, bias=False, nan_policy='omit')
+        np.testing.assert_allclose(skewness, expected_skew, rtol=1e-10)
+        np.testing.assert_allclose(kurtosis, expected_kurt, rtol=1e-10)
+    
+    def test_column_statistics(self):
+        """Test single-column statistics and the IQR outlier count."""
+        from backend.dqml.mining import column_statistics
+        
+        df = pd.DataFrame({'v': [1.0, 2.0, 3.0, 4.0, np.nan, 100.0], 'c': list('aabbcc')})
+        result = column_statistics(df, 'v')
+        data = df['v'].dropna()
+        
+        assert result['null_count'] == 1
+        assert result['q25'] == data.quantile(0.25)
+        assert result['iqr'] == pytest.approx(data.quantile(0.75) - data.quantile(0.25))
+        assert result['range'] == 99.0
+        assert result['outlier_count'] == 1
+        assert column_statistics(df, 'c')['most_common_count'] == 2
+    
+    def test_correlation_analysis(self):
+        """Test significant correlations come from the upper triangle, strongest first."""
+        from backend.dqml.mining import correlation_analysis
+        from backend.dqml.mining.statistics import _correlation_strength
+        
+        rng = np.random.default_rng(5)
+        x = rng.normal(size=200)
+        df = pd.DataFrame({
+            'x': x,
+            'y': x + rng.normal(scale=0.1, size=200),
+            'z': rng.normal(size=200),
+            'w': -x + rng.normal(scale=1.0, size=200),
+        })
+        result = correlation_analysis(df, threshold=0.1)
+        pairs = result['significant_correlations']
+        corr = df.corr()
+        
+        assert (pairs[0]['column1'], pairs[0]['column2']) == ('x', 'y')
+        assert [abs(p['correlation']) for p in pairs] == sorted(
+            (abs(p['correlation']) for p in pairs), reverse=True
+        )
+        for p in pairs:
+            value = corr.loc[p['column1'], p['column2']]
+            assert p['correlation'] == round(value, 4)
+            assert p['strength'] == _correlation_strength(value)
+            assert list(df.columns).index(p['column1']) < list(df.columns).index(p['column2'])
+    
+    def test_data_profile_columns(self):
+        """Test profile counts for numeric, boolean and categorical columns."""
+        df = pd.DataFrame({
+            'n': [1.0, np.nan, 0.0, -2.0],
+            'flag': [True, False, True, True],
+            'c': ['a', 'b', None, 'a'],
+        })
+        columns = data_profile(df)['columns']
+        
+        assert columns['n']['null_count'] == 1
+        assert columns['n']['non_null_count'] == 3
+        assert columns['n']['statistics']['median'] == 0.0
+        assert columns['n']['has_negative'] and columns['n']['has_zero']
+        assert columns['flag']['statistics']['mean'] == 0.75
+        assert columns['c']['unique_count'] == 2
+        assert columns['c']['top_values'] == {'a': 2, 'b': 1}
+        assert data_profile(df)['data_quality_score'] == round(10 / 12 * 100, 2)
+    
+    def test_correlations_match_pandas(self):
+        """Test BLAS correlations match pandas, with and without missing values."""
+        from backend.dqml.mining import correlation_analysis
+        
+        rng = np.random.default_rng(7)
+        df = pd.DataFrame(rng.normal(size=(60, 4)), columns=list('abcd'))
+        df['d'] = df['a'] * 2 + rng.normal(size=60)
+        df['const'] = 1.0
+        
+        stats = basic_statistics(df)
+        pd.testing.assert_frame_equal(stats.correlations, df.corr())
+        
+        reused = correlation_analysis(df, correlations=stats.correlations)
+        fresh = correlation_analysis(df)
+        assert reused['significant_correlations'] == fresh['significant_correlations']
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(reused['correlation_matrix']), pd.DataFrame(fresh['correlation_matrix'])
+        )
+        
+        df.loc[3, 'b'] = np.nan
+        pd.testing.assert_frame_equal(basic_statistics(df).correlations, df.corr())
+    
+    def test_top_value_counts_matches_value_counts(self):
+        """Test factorized top-value counts match value_counts, ties in appearance order."""
+        from backend.dqml.mining.statistics import _top_value_counts
+        
+        rng = np.random.default_rng(11)
+        series = pd.Series(rng.choice(list('abcdefghijklmnopqrstuvwxyz'), size=300))
+        series[[5, 17]] = None
+        expected = series.value_counts()
+        
+        top = _top_value_counts(series, 26)
+        assert top == expected.to_dict()
+        assert list(top.values()) == expected.tolist()
+        
+        first_seen = {v: i for i, v in reversed(list(enumerate(series)))}
+        ranks = [(-count, first_seen[value]) for value, count in top.items()]
+        assert ranks == sorted(ranks)
+        assert list(_top_value_counts(series, 5).values()) == expected.head(5).tolist()
+        
+        flags = pd.Series([True, False, True])
+        assert _top_value_counts(flags, 20) == {True: 2, False: 1}
+    
+    def test_summary_and_profile_matches(self, sample_data):
+        """Test that the fused pass matches the separate functions."""
+        sample_data.loc[1, 'income'] = np.nan
+        stats, profile = summary_and_profile(sample_data)
+        expected = basic_statistics(sample_data)
+        
+        assert stats.summary.keys() == expected.summary.keys()
+        for col, col_stats in expected.summary.items():
+            assert stats.summary[col] == pytest.approx(col_stats)
+        assert stats.value_counts == expected.value_counts
+        assert stats.missing_values == expected.missing_values
+        assert stats.categorical_columns == expected.categorical_columns
+        assert profile == data_profile(sample_data)
+    
+    def test_optimize_dtypes_is_lossless(self):
+        """Test that downcasting only narrows columns whose values survive it."""
+        df = pd.DataFrame({
+            'small': np.arange(10, dtype=np.int64),
+            'big': np.arange(10, dtype=np.int64) * 10**10,
+            'half': np.arange(10) / 2,
+            'third': np.arange(10) / 3,
+            'flag': np.arange(10) % 2 == 0,
+            'name': list('abcdefghij')
+        })
+        df.loc[3, 'half'] = np.nan
+        
+        optimized = optimize_dtypes(df)
+        
+        assert optimized['small'].dtype == np.int8
+        assert optimized['big'].dtype == np.int64
+        assert optimized['half'].dtype == np.float32
+        assert optimized['third'].dtype == np.float64
+        assert optimized['flag'].dtype == bool
+        pd.testing.assert_frame_equal(optimized.astype(df.dtypes), df)
+    
+    def test_optimize_dtypes_shares_untouched_columns(self):
+        """Test that non-string labels work and untouched columns are not copied."""
+        df = pd.DataFrame({
+            0: np.arange(10, dtype=np.int64),
+            1: np.arange(10) / 3,
+            2: np.arange(10) / 2
+        })
+        
+        optimized = optimize_dtypes(df)
+        
+        assert optimized[0].dtype == np.int8
+        assert optimized[2].dtype == np.float32
+        assert df[0].dtype == np.int64
+        assert np.shares_memory(optimized[1].to_numpy(), df[1].to_numpy())
 
 
 class TestAnomalyDetection:
@@ -130,6 +608,125 @@ class TestAnomalyDetection:
         assert result.n_anomalies > 0
         assert result.method == 'isolation_forest'
     
+    def test_isolation_forest_matches_predict(self, sample_data):
+        """Test single-pass scoring matches sklearn's predict/decision_function."""
+        from sklearn.ensemble import IsolationForest
+        
+        result = detect_anomalies(
+            sample_data, method='isolation_forest', contamination=0.05, scale_features=False
+        )
+        X = sample_data[['value']].to_numpy(dtype=np.float32)
+        iso = IsolationForest(contamination=0.05, random_state=42, n_estimators=100).fit(X)
+        
+        np.testing.assert_array_equal(result.data['is_anomaly'], iso.predict(X) == -1)
+        np.testing.assert_allclose(result.anomaly_scores, -iso.decision_function(X))
+    
+    def test_isolation_forest_large_magnitude_column(self):
+        """Test scaling happens before the float32 cast, keeping a column far from zero intact."""
+        from sklearn.ensemble import IsolationForest
+        
+        rng = np.random.default_rng(5)
+        seconds = 1.6e9 + rng.normal(0, 20, 500)
+        seconds[:5] += 300
+        df = pd.DataFrame({'ts': seconds})
+        result = detect_anomalies(df, method='isolation_forest', contamination=0.01)
+        
+        X = ((seconds - seconds.mean()) / seconds.std()).reshape(-1, 1)
+        iso = IsolationForest(contamination=0.01, random_state=42, n_estimators=100).fit(X)
+        np.testing.assert_array_equal(result.data['is_anomaly'], iso.predict(X) == -1)
+        np.testing.assert_allclose(result.anomaly_scores, -iso.decision_function(X), atol=1e-6)
+        assert result.data['is_anomaly'][:5].all()
+    
+    def test_lof_matches_default_search(self, sample_data):
+        """Test the threaded ball-tree LOF gives the default search's results."""
+        from sklearn.neighbors import LocalOutlierFactor
+        
+        result = detect_anomalies(sample_data, method='lof', scale_features=False)
+        lof = LocalOutlierFactor(contamination=0.1, n_neighbors=20)
+        predictions = lof.fit_predict(sample_data[['value']].to_numpy())
+        
+        np.testing.assert_array_equal(result.data['is_anomaly'], predictions == -1)
+        np.testing.assert_allclose(result.anomaly_scores, -lof.negative_outlier_factor_)
+    
+    def test_detect_anomalies_async(self, sample_data):
+        """Test background detection resolves to the synchronous result."""
+        future = detect_anomalies_async(sample_data, method='isolation_forest', contamination=0.05)
+        expected = detect_anomalies(sample_data, method='isolation_forest', contamination=0.05)
+        
+        result = future.result(timeout=60)
+        pd.testing.assert_frame_equal(result.data, expected.data)
+    
+    def test_anomaly_mask_selects_rows(self, sample_data):
+        """Test get_anomalies/get_normal split the rows using the stored mask."""
+        sample_data.index = sample_data.index * 2
+        result = detect_anomalies(sample_data, method='iqr')
+        
+        assert result.mask.dtype == bool
+        assert result.get_anomalies()['is_anomaly'].all()
+        assert not result.get_normal()['is_anomaly'].any()
+        assert len(result.get_anomalies()) + len(result.get_normal()) == len(sample_data)
+        assert {0, 2} <= set(result.get_anomalies().index)
+    
+    def test_isolation_forest_keeps_input(self, sample_data):
+        """Test Isolation Forest labels missing values without changing the input."""
+        sample_data['other'] = np.arange(100, dtype=float)
+        sample_data.loc[5, 'other'] = np.nan
+        original = sample_data.copy()
+        
+        result = detect_anomalies(sample_data, method='isolation_forest', contamination=0.05)
+        
+        pd.testing.assert_frame_equal(sample_data, original)
+        assert result.data.index.equals(sample_data.index)
+        assert bool(result.data.loc[0, 'is_anomaly'])
+        assert result.data['is_anomaly'].sum() == result.n_anomalies
+    
+    @pytest.mark.parametrize('method', ['isolation_forest', 'lof', 'zscore', 'iqr'])
+    def test_result_shares_input_columns(self, sample_data, method):
+        """Test detectors attach labels without copying the input columns."""
+        result = detect_anomalies(sample_data, method=method)
+        
+        assert list(result.data.columns) == ['value', 'is_anomaly', 'anomaly_score']
+        assert np.shares_memory(result.data['value'].to_numpy(), sample_data['value'].to_numpy())
+        assert 'is_anomaly' not in sample_data.columns
+    
+    @pytest.mark.parametrize('method', ['iqr', 'zscore', 'mad'])
+    def test_univariate_anomalies(self, sample_data, method):
+        """Test univariate detection returns the outliers as arrays."""
+        sample_data.index = sample_data.index + 1000
+        sample_data.loc[1050, 'value'] = np.nan
+        result = detect_univariate_anomalies(sample_data, 'value', method=method)
+        
+        assert isinstance(result['anomaly_indices'], np.ndarray)
+        assert {1000, 1001} <= set(result['anomaly_indices'].tolist())
+        assert result['n_total'] == 99
+        assert result['n_anomalies'] == len(result['anomaly_values'])
+        np.testing.assert_array_equal(
+            result['anomaly_values'], sample_data.loc[result['anomaly_indices'], 'value']
+        )
+    
+    @pytest.mark.parametrize('n', [1, 2, 5, 8, 101])
+    def test_q13_matches_percentile(self, n):
+        """Test partition-based quartiles match np.percentile."""
+        from backend.dqml.mining.anomaly_detection import _q13
+        
+        X = np.random.default_rng(n).normal(size=(n, 3))
+        q1, q3 = _q13(X)
+        
+        np.testing.assert_allclose(q1, np.percentile(X, 25, axis=0))
+        np.testing.assert_allclose(q3, np.percentile(X, 75, axis=0))
+    
+    def test_standardize_inplace_matches_scaler(self):
+        """Test in-place standardization matches sklearn's StandardScaler."""
+        from sklearn.preprocessing import StandardScaler
+        from backend.dqml.mining.anomaly_detection import _standardize_inplace
+        
+        X = np.random.default_rng(1).normal(5, 3, size=(50, 3))
+        X[:, 2] = 7.0  # Zero-variance column
+        expected = StandardScaler().fit_transform(X)
+        
+        _standardize_inplace(X)
+        np.testing.assert_allclose(X, expected, atol=1e-12)
+    
     def test_iqr_detection(self, sample_data):
         """Test IQR-based anomaly detection."""
         result = detect_anomalies(sample_data, method='iqr')
@@ -137,12 +734,83 @@ class TestAnomalyDetection:
         assert 'is_anomaly' in result.data.columns
         assert result.n_anomalies >= 2  # Should detect our outliers
     
+    def test_iqr_matches_pandas(self, sample_data):
+        """Test IQR labels and scores match the pandas formulation."""
+        sample_data['other'] = np.arange(100, dtype=float)
+        sample_data.loc[3, 'other'] = np.nan
+        sample_data.loc[7, 'other'] = 500.0
+        result = detect_anomalies(sample_data, method='iqr')
+        
+        X = sample_data[['value', 'other']]
+        q1, q3 = X.quantile(0.25), X.quantile(0.75)
+        iqr = q3 - q1
+        lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+        expected_score = ((lower - X).clip(lower=0) / iqr).max(axis=1) \
+            + ((X - upper).clip(lower=0) / iqr).max(axis=1)
+        
+        np.testing.assert_array_equal(
+            result.data['is_anomaly'], ((X < lower) | (X > upper)).any(axis=1)
+        )
+        np.testing.assert_allclose(result.anomaly_scores, expected_score)
+    
+    def test_kernels_match_numpy(self):
+        """Test the compiled z-score and IQR kernels match the NumPy paths."""
+        from backend.dqml.mining.anomaly_detection import _iqr_kernel, _zscore_kernel
+        
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(40, 3)).astype(np.float32)
+        X[0, 0] = 8.0
+        X[5, 1] = np.nan
+        X[:, 2] = 1.0  # Zero-variance column
+        
+        is_anom, scores = _zscore_kernel(X, np.float32(3.0))
+        sd = np.nanstd(X, axis=0, ddof=1)
+        sd[sd == 0] = 1
+        z = np.abs((X - np.nanmean(X, axis=0)) / sd)
+        np.testing.assert_array_equal(is_anom, (z > 3.0).any(axis=1))
+        np.testing.assert_allclose(scores, np.fmax.reduce(z, axis=1), rtol=1e-5)
+        
+        q1, q3 = np.nanpercentile(X, [25, 75], axis=0)
+        iqr = q3 - q1
+        lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+        is_anom, scores = _iqr_kernel(X, lower, upper, iqr)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            below = np.fmax.reduce(np.maximum(lower - X, 0) / iqr, axis=1)
+            above = np.fmax.reduce(np.maximum(X - upper, 0) / iqr, axis=1)
+        np.testing.assert_array_equal(is_anom, ((X < lower) | (X > upper)).any(axis=1))
+        np.testing.assert_allclose(scores, below + above, rtol=1e-5)
+    
     def test_zscore_detection(self, sample_data):
         """Test Z-score anomaly detection."""
         result = detect_anomalies(sample_data, method='zscore')
         
         assert 'is_anomaly' in result.data.columns
         assert result.method == 'zscore'
+    
+    def test_zscore_matches_pandas(self, sample_data):
+        """Test Z-score labels match the pandas formulation."""
+        sample_data['other'] = np.arange(100, dtype=float)
+        sample_data.loc[3, 'other'] = np.nan
+        result = detect_anomalies(sample_data, method='zscore')
+        
+        X = sample_data[['value', 'other']]
+        expected = ((X - X.mean()) / X.std()).abs()
+        
+        np.testing.assert_array_equal(result.data['is_anomaly'], (expected > 3.0).any(axis=1))
+        np.testing.assert_allclose(result.anomaly_scores, expected.max(axis=1), rtol=1e-5)
+        assert bool(result.data.loc[0, 'is_anomaly'])
+    
+    def test_zscore_large_magnitude_column(self):
+        """Test Z-scores keep the variation of a column far from zero, like epoch seconds."""
+        rng = np.random.default_rng(5)
+        seconds = 1.6e9 + rng.normal(0, 20, 1000)
+        seconds[:10] += 200
+        df = pd.DataFrame({'ts': seconds})
+        result = detect_anomalies(df, method='zscore')
+        
+        expected = ((df['ts'] - df['ts'].mean()) / df['ts'].std()).abs() > 3.0
+        assert expected.sum() == 10
+        np.testing.assert_array_equal(result.data['is_anomaly'], expected)
 
 
 # ============================================================================
@@ -5,6 +5,7 @@ These tests verify that the ANTLR4-generated parser correctly handles
 various DMQL query patterns.
 """
 
+import dataclasses
 import sys
 import os
 
@@ -12,7 +13,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 import pytest
-from backend.dqml.parser.dmql_parser import parse_query, validate_query, DMQLQuery
+from backend.dqml.parser.dmql_parser import parse_query, validate_query, DMQLQuery, ConditionTable
 
 
 class TestBasicQueries:
@@ -261,6 +262,23 @@ class TestComplexQueries:
         assert 'customers' in result.tables
         assert 'orders' in result.tables
         assert 'products' in result.tables
+    
+    def test_or_and_parenthesized_conditions(self):
+        """Test OR groups and parentheses nest under the enclosing AND."""
+        query = """
+        USE DATABASE sales_data
+        FROM customers
+        WHERE (city = 'Mumbai' OR city = 'Delhi') AND age > 30
+        """
+        
+        result = parse_query(query)
+        
+        assert len(result.errors) == 0
+        assert result.conditions.logical_op == 'AND'
+        either, age = result.conditions.nested
+        assert either.logical_op == 'OR'
+        assert [(c.left, c.right) for c in either.nested] == [('city', 'Mumbai'), ('city', 'Delhi')]
+        assert (age.left, age.operator, age.right) == ('age', '>', 30)
 
 
 class TestQueryValidation:
@@ -347,6 +365,267 @@ class TestEdgeCases:
         
         assert result.database == 'sales_data'
         assert len(result.errors) == 0
+    
+    def test_literal_types(self):
+        """Test condition literals become int, float or unquoted strings."""
+        result = parse_query(
+            "USE DATABASE db FROM t WHERE a = 7 AND b > 10.50 AND c = 'x' AND d = \"y\" AND e = f"
+        )
+        table = ConditionTable.from_condition(result.conditions)
+        rights = [r for r, n in zip(table.rights, table.arity) if not n]
+        
+        assert rights == [7, 10.5, 'x', 'y', 'f']
+        assert [type(r) for r in rights[:2]] == [int, float]
+    
+    def test_like_condition(self):
+        """Test LIKE conditions keep the unquoted pattern."""
+        result = parse_query("USE DATABASE db FROM t WHERE name NOT LIKE 'a_c%'")
+        condition = result.conditions
+        
+        assert (condition.left, condition.operator, condition.right) == ('name', 'NOT LIKE', 'a_c%')
+    
+    def test_identifiers_interned(self):
+        """Test identifiers and operators are shared interned strings."""
+        import sys
+        
+        result = parse_query(
+            "USE DATABASE db FROM orders WHERE amount >= 10 ORDER BY amount DISPLAY AS TABLE"
+        )
+        
+        assert result.tables[0] is sys.intern('orders')
+        assert result.order_by[0][0] is result.conditions.left
+        assert result.conditions.operator is sys.intern('>=')
+        assert result.display_type is sys.intern('table')
+    
+    def test_display_codes(self):
+        """Test display types map to integer codes."""
+        from backend.dqml.parser import Display
+        
+        result = parse_query("USE DATABASE db FROM t DISPLAY AS HEATMAP")
+        
+        assert result.display is Display.HEATMAP
+        assert parse_query("USE DATABASE db FROM t").display is Display.TABLE
+        assert parse_query("USE DATABASE db FROM t DISPLAY AS sankey").display is Display.CUSTOM
+
+
+class TestParseCache:
+    """Test the parse_query result cache."""
+    
+    def test_repeat_query_served_from_cache(self, monkeypatch):
+        """Test repeated text is parsed once and the frozen result is shared."""
+        from backend.dqml.parser import dmql_parser
+        
+        calls = []
+        real_parse = dmql_parser._parse
+        monkeypatch.setattr(dmql_parser, '_parse', lambda q, *a: calls.append(q) or real_parse(q, *a))
+        monkeypatch.setattr(dmql_parser, '_parse_cache', dmql_parser.OrderedDict())
+        query = "USE DATABASE sales FROM customers WHERE age > 25"
+        
+        first = parse_query(query)
+        again = parse_query(query)
+        second = parse_query(query + "\n")
+        
+        assert len(calls) == 1
+        assert again is first
+        assert second.conditions is first.conditions
+        assert second.raw_query == query + "\n"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.columns = ('poisoned',)
+    
+    def test_replace_returns_modified_copy(self):
+        """Test replace() leaves the cached query untouched."""
+        query = parse_query("USE DATABASE db FROM t GROUP BY city")
+        changed = query.replace(tables=('u',))
+        
+        assert changed.tables == ('u',)
+        assert changed.group_by is query.group_by
+        assert query.tables == ('t',)
+    
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test the least recently used query is evicted past the size limit."""
+        from backend.dqml.parser import dmql_parser
+        
+        monkeypatch.setattr(dmql_parser, '_PARSE_CACHE_SIZE', 2)
+        monkeypatch.setattr(dmql_parser, '_parse_cache', dmql_parser.OrderedDict())
+        queries = [f"USE DATABASE db{i} FROM t" for i in range(3)]
+        
+        parse_query(queries[0])
+        parse_query(queries[1])
+        parse_query(queries[0])
+        parse_query(queries[2])
+        
+        assert list(dmql_parser._parse_cache) == [queries[0], queries[2]]
+    
+    def test_template_reused_for_new_literals(self, monkeypatch):
+        """Test queries differing only in condition literals skip the parser."""
+        from backend.dqml.parser import dmql_parser
+        
+        calls = []
+        real_parse = dmql_parser._parse
+        monkeypatch.setattr(dmql_parser, '_parse', lambda q, *a: calls.append(q) or real_parse(q, *a))
+        monkeypatch.setattr(dmql_parser, '_parse_cache', dmql_parser.OrderedDict())
+        monkeypatch.setattr(dmql_parser, '_template_cache', dmql_parser.OrderedDict())
+        template = "USE DATABASE db FROM t WHERE (city = {} OR age > {}) AND name LIKE {} -- db 1"
+        
+        parse_query(template.format("'Pune'", 30, "'A%'"))
+        spliced = parse_query(template.format('"it\'s"', 2.5, "'_b%'"))
+        
+        assert len(calls) == 1
+        assert spliced == real_parse(template.format('"it\'s"', 2.5, "'_b%'"))
+        assert spliced.conditions.nested[1].right == '_b%'
+        assert spliced.raw_query.endswith("'_b%' -- db 1")
+    
+    def test_template_requires_condition_literals(self, monkeypatch):
+        """Test literals outside conditions, or invalid swaps, get a full parse."""
+        from backend.dqml.parser import dmql_parser
+        
+        monkeypatch.setattr(dmql_parser, '_parse_cache', dmql_parser.OrderedDict())
+        monkeypatch.setattr(dmql_parser, '_template_cache', dmql_parser.OrderedDict())
+        
+        parse_query("USE DATABASE db FROM t WHERE a > 1 MINE CLUSTER k = 3")
+        assert not dmql_parser._template_cache
+        
+        parse_query("USE DATABASE db FROM t WHERE name LIKE 'a%'")
+        assert len(dmql_parser._template_cache) == 1
+        assert parse_query("USE DATABASE db FROM t WHERE name LIKE 5").errors
+    
+    def test_parse_query_template(self):
+        """Test placeholder values are written as literals and parsed."""
+        from backend.dqml.parser import parse_query_template
+        
+        result = parse_query_template(
+            "USE DATABASE db FROM t WHERE name = ? AND score >= ? AND note = '?'",
+            ["O'Neil", 0.5]
+        )
+        
+        assert result.errors == ()
+        assert [c.right for c in result.conditions.nested[0].nested] == ["O''Neil", 0.5]
+        assert result.conditions.nested[1].right == '?'
+        with pytest.raises(ValueError):
+            parse_query_template("USE DATABASE db FROM t WHERE a > ?", [-1])
+    
+    def test_parser_loaded_on_first_parse(self):
+        """Test importing the parser package leaves the generated parser unloaded."""
+        import subprocess
+        
+        code = (
+            "import sys\n"
+            "from backend.dqml.parser import parse_query\n"
+            "assert 'backend.dqml.parser.DMQLParser' not in sys.modules\n"
+            "assert parse_query('USE DATABASE db FROM t').tables == ('t',)\n"
+            "assert 'backend.dqml.parser.DMQLParser' in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+    
+    def test_parser_reused_across_queries(self, monkeypatch):
+        """Test the per-thread parser is reset between queries and threads."""
+        from concurrent.futures import ThreadPoolExecutor
+        from backend.dqml.parser import dmql_parser
+        
+        monkeypatch.setattr(dmql_parser, '_parse_cache', dmql_parser.OrderedDict())
+        bad = dmql_parser._parse("USE DATABASE FROM")
+        good = dmql_parser._parse("USE DATABASE db FROM customers")
+        
+        assert bad.errors
+        assert good.errors == ()
+        assert good.tables == ('customers',)
+        assert dmql_parser._thread_parser() is dmql_parser._thread_parser()
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(
+                dmql_parser._parse, [f"USE DATABASE db FROM t{i}" for i in range(20)]
+            ))
+        assert [r.tables for r in results] == [(f't{i}',) for i in range(20)]
+    
+    def test_invalid_query_falls_back_to_ll(self, monkeypatch):
+        """Test SLL bails on errors and the LL re-parse reports and recovers."""
+        from antlr4.atn.PredictionMode import PredictionMode
+        from backend.dqml.parser import dmql_parser
+        
+        valid = dmql_parser._parse("USE DATABASE db FROM t WHERE a > 5 AND b < 3 MINE STATISTICS")
+        parser = dmql_parser._thread_parser().parser
+        assert parser._interp.predictionMode == PredictionMode.SLL
+        assert valid.errors == ()
+        
+        invalid = dmql_parser._parse("USE DATABASE db FROM t GROUP city")
+        assert parser._interp.predictionMode == PredictionMode.LL
+        assert invalid.errors == ("Line 1:29 - missing BY at 'city'",)
+        assert invalid.tables == ('t',)
+        assert invalid.group_by == ('city',)
+
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_ast_nodes_are_slotted(self):
+        """Test parsed nodes carry no per-instance __dict__."""
+        result = parse_query("USE DATABASE db FROM t WHERE a > 5 AND b < 3 MINE STATISTICS")
+        
+        for node in (result, result.conditions, result.mining_operation):
+            assert not hasattr(node, '__dict__')
+
+
+class TestConditionTable:
+    """Test the flat condition representation."""
+    
+    def test_flattened_in_preorder(self):
+        """Test groups precede their children and parents point back."""
+        from backend.dqml.parser import ConditionTable
+        
+        result = parse_query("USE DATABASE db FROM t WHERE a > 5 AND b < 3 AND c = 'x'")
+        table = ConditionTable.from_condition(result.conditions)
+        
+        assert len(table.ops) == 5
+        assert table.parents[0] == -1
+        for row, parent in enumerate(table.parents[1:], start=1):
+            assert parent < row
+            assert table.arity[parent] > 0
+        assert sum(table.arity) == len(table.ops) - 1
+        leaves = [(l, o, r) for l, o, r, n in zip(table.lefts, table.ops, table.rights, table.arity) if not n]
+        assert leaves == [('a', '>', 5), ('b', '<', 3), ('c', '=', 'x')]
+
+
+class TestVisitorDispatch:
+    """Test the cached visitor dispatch."""
+    
+    def test_subclass_gets_own_dispatch_table(self):
+        """Test subclass overrides are dispatched and don't leak to the parent."""
+        from antlr4 import CommonTokenStream, InputStream
+        from backend.dqml.parser.dmql_parser import DMQLQueryVisitor
+        from backend.dqml.parser.DMQLLexer import DMQLLexer
+        from backend.dqml.parser.DMQLParser import DMQLParser
+        
+        class CountingVisitor(DMQLQueryVisitor):
+            def __init__(self):
+                super().__init__()
+                self.from_clauses = 0
+            
+            def visitFromClause(self, ctx):
+                self.from_clauses += 1
+                return super().visitFromClause(ctx)
+        
+        def tree():
+            stream = CommonTokenStream(DMQLLexer(InputStream("USE DATABASE db FROM t1, t2")))
+            return DMQLParser(stream).query()
+        
+        counting = CountingVisitor()
+        result = counting.visit(tree())
+        plain = DMQLQueryVisitor().visit(tree())
+        
+        assert counting.from_clauses == 1
+        assert result.tables == plain.tables == ('t1', 't2')
+        assert CountingVisitor._dispatch is not DMQLQueryVisitor._dispatch
+        assert DMQLQueryVisitor._dispatch[DMQLParser.FromClauseContext] is \
+            DMQLQueryVisitor.visitFromClause
+    
+    def test_pass_through_rules_dispatch_to_visit_children(self):
+        """Test rules without an override skip the generated pass-through method."""
+        from backend.dqml.parser.dmql_parser import DMQLQueryVisitor
+        from backend.dqml.parser.DMQLParser import DMQLParser
+        
+        assert DMQLQueryVisitor._resolve(DMQLParser.RelationListContext) is \
+            DMQLQueryVisitor.visitChildren
+        assert DMQLQueryVisitor._resolve(DMQLParser.WhereClauseContext) is \
+            DMQLQueryVisitor.visitWhereClause
 
 
 # ============================================================================
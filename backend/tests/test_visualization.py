@@ -101,6 +101,13 @@ class TestChartResult:
         assert 'data' in result_dict
         assert 'layout' in result_dict
     
+    def test_as_dict_is_cached(self, sample_df):
+        """Test the cached dictionary matches to_dict() and is built once."""
+        result = generate_chart(sample_df, 'bar_chart')
+        
+        assert result.as_dict == result.to_dict()
+        assert result.as_dict is result.as_dict
+    
     def test_to_html(self, sample_df):
         """Test conversion to HTML."""
         result = generate_chart(sample_df, 'bar_chart')
@@ -250,6 +257,14 @@ class TestTable:
         result = generate_chart(df, 'table', max_rows=50)
         
         assert result.chart_type == 'table'
+    
+    def test_table_cell_values(self):
+        """Test that each column, duplicates included, becomes one list of cells."""
+        df = pd.DataFrame([[1, 2.5, 'a'], [2, None, 'b']], columns=['x', 'x', 'y'])
+        result = generate_chart(df, 'table')
+        
+        cells = result.to_dict()['data'][0]['cells']['values']
+        assert cells == [[1, 2], [2.5, None], ['a', 'b']]
 
 
 class TestSpecializedCharts:
@@ -295,6 +310,10 @@ class TestSpecializedCharts:
         
         assert isinstance(result, ChartResult)
         assert result.chart_type == 'anomaly_visualization'
+        
+        colors = list(result.figure.data[0].marker.color)
+        expected = ['red' if a else 'blue' for a in anomaly_df['is_anomaly']]
+        assert colors == expected
 
 
 class TestAutoVisualize:
@@ -358,3 +377,55 @@ class TestEdgeCases:
         
         fig_dict = result.to_dict()
         assert fig_dict['layout']['title']['text'] == title
+    
+    def test_common_styling_template(self, sample_df):
+        """Test that charts use the registered DMQL template."""
+        import plotly.io as pio
+        
+        result = generate_chart(sample_df, 'bar_chart')
+        
+        layout = result.to_dict()['layout']
+        assert layout['template']['layout']['font']['family'] == 'Arial, sans-serif'
+        assert layout['template']['layout']['showlegend'] is True
+        assert pio.templates['plotly_white'].layout.showlegend is None
+    
+    def test_chart_floats_downcast(self):
+        """Test that exactly representable floats are sent as float32 without touching the input."""
+        df = pd.DataFrame({'x': [1.0, 2.5, np.nan], 'y': [0.25, -3.0, 8.0]})
+        result = generate_chart(df, 'scatter_plot', x_col='x', y_col='y')
+        
+        assert result.figure.data[0].x.dtype == np.float32
+        assert df['x'].dtype == np.float64
+    
+    def test_chart_keeps_values_float32_would_round(self):
+        """Test that columns float32 can't hold exactly keep double precision."""
+        df = pd.DataFrame({'x': [1.0, 2.0, 3.0], 'y': [1234567.891, 0.1, 2.0]})
+        result = generate_chart(df, 'scatter_plot', x_col='x', y_col='y')
+        
+        assert result.figure.data[0].x.dtype == np.float32
+        assert result.figure.data[0].y.dtype == np.float64
+        assert result.figure.data[0].y[0] == 1234567.891
+    
+    def test_table_keeps_float64(self):
+        """Test that table cells show the original values."""
+        df = pd.DataFrame({'x': [0.1, 0.2]})
+        result = generate_chart(df, 'table')
+        
+        assert result.to_dict()['data'][0]['cells']['values'] == [[0.1, 0.2]]
+    
+    def test_column_types_detected_once(self, sample_df, monkeypatch):
+        """Test that auto-detection runs select_dtypes once per column kind."""
+        calls = []
+        original = pd.DataFrame.select_dtypes
+        
+        def counting(self, *args, **kwargs):
+            calls.append(kwargs)
+            return original(self, *args, **kwargs)
+        
+        monkeypatch.setattr(pd.DataFrame, 'select_dtypes', counting)
+        generate_chart(sample_df, 'pie_chart')
+        assert len(calls) == 2
+        
+        calls.clear()
+        generate_chart(sample_df, 'bar_chart', x_col='category', y_col='value')
+        assert calls == []
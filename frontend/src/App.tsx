@@ -6,6 +6,7 @@ import Plot from 'react-plotly.js'
 interface QueryResponse {
   success: boolean
   data?: Record<string, unknown>[]
+  rows?: unknown[][]
   columns?: string[]
   row_count: number
   mining_result?: MiningResult
@@ -59,6 +60,27 @@ const SAMPLE_QUERIES = [
   }
 ]
 
+// Large results are streamed as NDJSON: the first line is the response
+// without rows, each following line is an array with the next chunk of rows.
+// Queries are sent with orient 'split', so rows arrive as arrays.
+async function readQueryResponse(response: Response): Promise<QueryResponse> {
+  const contentType = response.headers.get('Content-Type') || ''
+  if (!contentType.includes('application/x-ndjson')) {
+    return response.json()
+  }
+  
+  const lines = (await response.text()).split('\n').filter(line => line)
+  const data: QueryResponse = JSON.parse(lines[0])
+  data.rows = []
+  for (const line of lines.slice(1)) {
+    const rows: unknown[][] = JSON.parse(line)
+    for (const row of rows) {
+      data.rows.push(row)
+    }
+  }
+  return data
+}
+
 function App() {
   const [query, setQuery] = useState<string>(`-- DQML Query Editor
 -- Example queries:
@@ -85,10 +107,10 @@ FROM customers MINE CLUSTER K=3 DISPLAY AS scatter_plot`)
         headers: {
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify({ query }),
+        body: JSON.stringify({ query, orient: 'split' }),
       })
       
-      const data: QueryResponse = await response.json()
+      const data = await readQueryResponse(response)
       
       if (!data.success) {
         setError(data.error || 'Query execution failed')
@@ -226,7 +248,7 @@ FROM customers MINE CLUSTER K=3 DISPLAY AS scatter_plot`)
             )}
 
             {result && activeTab === 'data' && (
-              <DataTable data={result.data || []} columns={result.columns || []} />
+              <DataTable rows={result.rows || []} columns={result.columns || []} />
             )}
 
             {result && activeTab === 'chart' && result.chart && (
@@ -262,8 +284,8 @@ FROM customers MINE CLUSTER K=3 DISPLAY AS scatter_plot`)
 }
 
 // Data Table Component
-function DataTable({ data, columns }: { data: Record<string, unknown>[], columns: string[] }) {
-  if (!data.length) {
+function DataTable({ rows, columns }: { rows: unknown[][], columns: string[] }) {
+  if (!rows.length) {
     return (
       <div className="empty-state">
         <div className="empty-state-icon">📭</div>
@@ -283,18 +305,18 @@ function DataTable({ data, columns }: { data: Record<string, unknown>[], columns
           </tr>
         </thead>
         <tbody>
-          {data.slice(0, 100).map((row, i) => (
+          {rows.slice(0, 100).map((row, i) => (
             <tr key={i}>
-              {columns.map((col) => (
-                <td key={col}>{formatValue(row[col])}</td>
+              {columns.map((col, j) => (
+                <td key={col}>{formatValue(row[j])}</td>
               ))}
             </tr>
           ))}
         </tbody>
       </table>
-      {data.length > 100 && (
+      {rows.length > 100 && (
         <p style={{ padding: '1rem', color: '#666', textAlign: 'center' }}>
-          Showing first 100 of {data.length} rows
+          Showing first 100 of {rows.length} rows
         </p>
       )}
     </div>